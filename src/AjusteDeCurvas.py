@@ -1,11 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import warnings
-from typing import Tuple, Optional
-
-# Configurações globais
-warnings.filterwarnings("ignore")
-plt.style.use('seaborn-v0_8-whitegrid')
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from numpy.polynomial import Polynomial, chebyshev, legendre, polynomial
+from scipy.linalg import solve_triangular
+from typing import Tuple, Optional, Union, Callable, List, Dict
+from DadosTabelados import ler_blocos_xy
 
 def obter_dados_usuario() -> Tuple[Optional[np.ndarray], Optional[np.ndarray], str, str]:
     """
@@ -71,79 +72,581 @@ def formatar_equacao_polinomio(coeficientes: np.ndarray) -> str:
     equacao = "y = " + " ".join(lista_termos)
     return equacao.replace("+", "+ ").replace("-", "- ").replace("= + ", "= ")
 
+# --- Motor de Mínimos Quadrados ---
+
+_VANDERMONDE = {'monomial': polynomial.polyvander, 'chebyshev': chebyshev.chebvander, 'legendre': legendre.legvander}
+_AVALIADORES = {'monomial': polynomial.polyval, 'chebyshev': chebyshev.chebval, 'legendre': legendre.legval}
+_PARA_POTENCIAS = {'monomial': np.asarray, 'chebyshev': chebyshev.cheb2poly, 'legendre': legendre.leg2poly}
+
+@dataclass
+class ModeloPolinomial:
+    """
+    Polinômio ajustado na variável normalizada u = (x - centro) / escala, com
+    coeficientes na base escolhida (monomial, Chebyshev ou Legendre).
+    Com x levado a [-1, 1] e base ortogonal, a matriz do problema fica bem
+    condicionada mesmo em graus altos.
+    """
+    coeficientes: np.ndarray
+    centro: float
+    escala: float
+    base: str = 'chebyshev'
+
+    @property
+    def grau(self) -> int:
+        return len(self.coeficientes) - 1
+
+    def __call__(self, x):
+        u = (np.asarray(x, dtype=float) - self.centro) / self.escala
+        return _AVALIADORES[self.base](u, self.coeficientes)
+
+    def para_poly1d(self) -> np.poly1d:
+        """Converte para potências de x (para exibir a equação e reaproveitar as predições)."""
+        em_u = Polynomial(_PARA_POTENCIAS[self.base](self.coeficientes))
+        em_x = em_u(Polynomial([-self.centro / self.escala, 1.0 / self.escala]))
+        return np.poly1d(em_x.coef[::-1])
+
+def normalizacao(x_min: float, x_max: float) -> Tuple[float, float]:
+    """Centro e escala que levam [x_min, x_max] a [-1, 1]."""
+    escala = (x_max - x_min) / 2.0
+    return (x_max + x_min) / 2.0, escala if escala > 0 else 1.0
+
+def matriz_base(x: np.ndarray, grau: int, base: str, centro: float, escala: float) -> np.ndarray:
+    if base not in _VANDERMONDE:
+        raise ValueError(f"Base desconhecida: '{base}'. Use {', '.join(_VANDERMONDE)}.")
+    return _VANDERMONDE[base]((np.asarray(x, dtype=float) - centro) / escala, grau)
+
+def resolver_minimos_quadrados(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Resolve min ||A c - b|| por QR; se A tiver posto deficiente, recorre ao SVD (lstsq)."""
+    Q, R = np.linalg.qr(A)
+    diagonal = np.abs(np.diag(R))
+    if diagonal.size == 0 or diagonal.min() <= diagonal.max() * max(A.shape) * np.finfo(float).eps:
+        return np.linalg.lstsq(A, b, rcond=None)[0]
+    return solve_triangular(R, Q.T @ b)
+
+def ajustar_polinomio(x: np.ndarray, y: np.ndarray, grau: int, base: str = 'chebyshev') -> ModeloPolinomial:
+    """MMQ polinomial com x centrado e escalado, resolvido por QR."""
+    if len(x) <= grau:
+        raise ValueError(f"São necessários pelo menos {grau + 1} pontos para grau {grau}.")
+    centro, escala = normalizacao(np.min(x), np.max(x))
+    coeficientes = resolver_minimos_quadrados(matriz_base(x, grau, base, centro, escala), np.asarray(y, dtype=float))
+    return ModeloPolinomial(coeficientes, centro, escala, base)
+
+@dataclass
+class LinhaSelecaoGrau:
+    grau: int
+    sse: float
+    r_quadrado: float
+    aic: float
+    bic: float
+    erro_cv: float   # erro quadrático médio fora da amostra (validação cruzada k-fold)
+
+def _coeficientes_aninhados(V: np.ndarray, y: np.ndarray, grau_maximo: int) -> List[Optional[np.ndarray]]:
+    """
+    Uma única QR de V (colunas até o grau máximo) resolve todos os graus: as
+    primeiras g+1 colunas de Q e o bloco R[:g+1, :g+1] são a QR do problema de grau g.
+    """
+    Q, R = np.linalg.qr(V)
+    qty = Q.T @ y
+    diagonal = np.abs(np.diag(R))
+    limite = diagonal.max() * max(V.shape) * np.finfo(float).eps
+    coeficientes = []
+    for g in range(grau_maximo + 1):
+        if g + 1 > len(y) or diagonal[:g + 1].min() <= limite:
+            coeficientes.append(None)
+        else:
+            coeficientes.append(solve_triangular(R[:g + 1, :g + 1], qty[:g + 1]))
+    return coeficientes
+
+def selecionar_grau(x: np.ndarray, y: np.ndarray, grau_maximo: int, base: str = 'chebyshev',
+                    num_folds: int = 5, criterio: str = 'cv', semente: Optional[int] = 0,
+                    max_threads: Optional[int] = None) -> Tuple[List[LinhaSelecaoGrau], ModeloPolinomial]:
+    """
+    Compara os graus 1..grau_maximo por validação cruzada k-fold, AIC e BIC.
+    A matriz da base é montada uma vez até o grau máximo e cada ajuste usa o
+    subconjunto aninhado de colunas; os folds rodam em paralelo (threads, já
+    que a QR do NumPy libera o GIL). Retorna a tabela ordenada pelo
+    `criterio` ('cv', 'aic' ou 'bic') e o modelo do melhor grau.
+    """
+    if criterio not in ('cv', 'aic', 'bic'):
+        raise ValueError("Critério deve ser 'cv', 'aic' ou 'bic'.")
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    grau_maximo = min(grau_maximo, n - 2)
+    if grau_maximo < 1:
+        raise ValueError("Pontos insuficientes para comparar graus.")
+
+    centro, escala = normalizacao(np.min(x), np.max(x))
+    V = matriz_base(x, grau_maximo, base, centro, escala)
+    coeficientes = _coeficientes_aninhados(V, y, grau_maximo)
+
+    num_folds = max(2, min(num_folds, n))
+    ordem = np.random.default_rng(semente).permutation(n)
+    folds = np.array_split(ordem, num_folds)
+
+    def avaliar_fold(teste: np.ndarray) -> np.ndarray:
+        treino = np.setdiff1d(ordem, teste, assume_unique=True)
+        coef_fold = _coeficientes_aninhados(V[treino], y[treino], grau_maximo)
+        erros = np.full(grau_maximo + 1, np.inf)
+        for g, c in enumerate(coef_fold):
+            if c is not None:
+                erros[g] = np.sum((y[teste] - V[teste, :g + 1] @ c) ** 2)
+        return erros
+
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        erro_cv = sum(executor.map(avaliar_fold, folds)) / n
+
+    soma_total = np.sum((y - np.mean(y)) ** 2)
+    tabela = []
+    for g in range(1, grau_maximo + 1):
+        if coeficientes[g] is None:
+            continue
+        sse = float(np.sum((y - V[:, :g + 1] @ coeficientes[g]) ** 2))
+        k = g + 1
+        log_verossimilhanca = n * np.log(max(sse, np.finfo(float).tiny) / n)
+        tabela.append(LinhaSelecaoGrau(
+            grau=g, sse=sse,
+            r_quadrado=float(1 - sse / soma_total) if soma_total != 0 else 0.0,
+            aic=float(log_verossimilhanca + 2 * k),
+            bic=float(log_verossimilhanca + k * np.log(n)),
+            erro_cv=float(erro_cv[g]),
+        ))
+    if not tabela:
+        # Todos os graus com posto deficiente (ex: valores de x repetidos demais)
+        raise ValueError("Pontos insuficientes: poucos valores distintos de x para qualquer grau.")
+
+    chave = {'cv': lambda l: l.erro_cv, 'aic': lambda l: l.aic, 'bic': lambda l: l.bic}[criterio]
+    tabela.sort(key=chave)
+    melhor = tabela[0].grau
+    return tabela, ModeloPolinomial(coeficientes[melhor], centro, escala, base)
+
+class AcumuladorMMQ:
+    """
+    MMQ polinomial em blocos com memória O(grau²), independente do número de
+    pontos. Mantém só o fator R da QR de [V | y]: cada bloco é empilhado sob o
+    R atual e refatorado. A última coluna de R guarda Qᵀy e o seu elemento
+    diagonal final é a raiz da soma dos quadrados dos resíduos.
+    """
+    def __init__(self, grau: int, intervalo_x: Tuple[float, float], base: str = 'chebyshev'):
+        self.grau = grau
+        self.base = base
+        self.centro, self.escala = normalizacao(*intervalo_x)
+        self._R = np.zeros((0, grau + 2))
+        # Média e soma dos quadrados dos desvios de y, combinadas por bloco (Chan et al.)
+        self.num_amostras = 0
+        self._media_y = 0.0
+        self._m2_y = 0.0
+
+    def adicionar(self, x: np.ndarray, y: np.ndarray):
+        y = np.asarray(y, dtype=float)
+        if len(y) == 0:
+            return
+        bloco = np.column_stack([matriz_base(x, self.grau, self.base, self.centro, self.escala), y])
+        self._R = np.linalg.qr(np.vstack([self._R, bloco]), mode='r')
+
+        n_bloco, media_bloco = len(y), float(np.mean(y))
+        total = self.num_amostras + n_bloco
+        delta = media_bloco - self._media_y
+        self._m2_y += float(np.sum((y - media_bloco) ** 2)) + delta**2 * self.num_amostras * n_bloco / total
+        self._media_y += delta * n_bloco / total
+        self.num_amostras = total
+
+    def ajustar(self) -> ModeloPolinomial:
+        p = self.grau + 1
+        if self.num_amostras < p:
+            raise ValueError(f"São necessários pelo menos {p} pontos para grau {self.grau}.")
+        R = self._R[:p, :p]
+        diagonal = np.abs(np.diag(R))
+        if diagonal.min() <= diagonal.max() * max(self.num_amostras, p) * np.finfo(float).eps:
+            # Posto deficiente (poucos valores distintos de x): mínima norma, como resolver_minimos_quadrados
+            coeficientes = np.linalg.lstsq(R, self._R[:p, p], rcond=None)[0]
+        else:
+            coeficientes = solve_triangular(R, self._R[:p, p])
+        return ModeloPolinomial(coeficientes, self.centro, self.escala, self.base)
+
+    @property
+    def soma_quadrados_residuos(self) -> float:
+        p = self.grau + 1
+        return float(self._R[p, p] ** 2) if self._R.shape[0] > p else 0.0
+
+    def metricas(self) -> Tuple[float, float]:
+        """(R², variância residual), sem nova passada pelos dados."""
+        sse = self.soma_quadrados_residuos
+        r_quadrado = 1 - sse / self._m2_y if self._m2_y != 0 else 0.0
+        graus_liberdade = self.num_amostras - (self.grau + 1)
+        return r_quadrado, (sse / graus_liberdade if graus_liberdade > 0 else 0.0)
+
+def ajustar_arquivo(fonte: Union[str, np.ndarray], grau: int, base: str = 'chebyshev',
+                    tamanho_bloco: int = 1_000_000) -> Tuple[ModeloPolinomial, AcumuladorMMQ]:
+    """Duas passadas em blocos: a primeira acha o intervalo de x (para normalizar), a segunda acumula R."""
+    x_min, x_max = np.inf, -np.inf
+    for x, _ in ler_blocos_xy(fonte, tamanho_bloco):
+        if len(x):
+            x_min, x_max = min(x_min, float(np.min(x))), max(x_max, float(np.max(x)))
+    if not np.isfinite(x_min):
+        raise ValueError("Nenhum ponto encontrado.")
+
+    acumulador = AcumuladorMMQ(grau, (x_min, x_max), base)
+    for x, y in ler_blocos_xy(fonte, tamanho_bloco):
+        acumulador.adicionar(x, y)
+    return acumulador.ajustar(), acumulador
+
+class RegressorPolinomialOnline:
+    """
+    Regressão polinomial incremental por mínimos quadrados recursivos (RLS):
+    cada ponto novo custa O(grau²), sem refazer o ajuste. Aceita fator de
+    esquecimento λ < 1 (pesos exponenciais) ou janela deslizante dos últimos
+    `janela` pontos (o ponto mais antigo é removido com um downdate). Como o
+    downdate de P acumula erro, a cada `janela` atualizações θ, P e as
+    estatísticas são refeitas em lote a partir dos pontos guardados, com x
+    renormalizado pela faixa da janela: custo amortizado continua O(grau²).
+    A soma dos resíduos, a média e a dispersão de y são mantidas de forma
+    recursiva, então R² e variância residual saem em O(1).
+    A matriz P começa em `delta`·I; com delta grande o viés inicial só é
+    desprezível se x estiver normalizado (`centro`/`escala`). Para eliminá-lo,
+    `iniciar_lote` parte de um ajuste exato dos primeiros pontos.
+    """
+    def __init__(self, grau: int, fator_esquecimento: float = 1.0, janela: Optional[int] = None,
+                 centro: float = 0.0, escala: float = 1.0, base: str = 'monomial', delta: float = 1e8):
+        if not 0 < fator_esquecimento <= 1:
+            raise ValueError("O fator de esquecimento deve estar em (0, 1].")
+        if janela is not None and fator_esquecimento != 1.0:
+            raise ValueError("Use janela deslizante ou fator de esquecimento, não ambos.")
+        if janela is not None and janela < grau + 1:
+            raise ValueError(f"A janela deve ter pelo menos {grau + 1} pontos para grau {grau}.")
+        self.grau = grau
+        self.fator_esquecimento = fator_esquecimento
+        self.janela = janela
+        self.centro, self.escala, self.base = centro, escala, base
+
+        p = grau + 1
+        self._theta = np.zeros(p)
+        self._P = np.eye(p) * delta
+        self._pontos = deque()
+        self._desde_reconstrucao = 0
+        # Estatísticas suficientes: peso total, média e M2 de y, soma dos resíduos ao quadrado
+        self._peso_total = 0.0
+        self._media_y = 0.0
+        self._m2_y = 0.0
+        self._sse = 0.0
+
+    def _aplicar(self, x: float, y: float, peso: float):
+        """Inclui (peso=+1) ou remove (peso=-1) um ponto, atualizando θ, P e as estatísticas."""
+        phi = matriz_base(np.array([x]), self.grau, self.base, self.centro, self.escala)[0]
+        P_phi = self._P @ phi
+        denominador = 1.0 + peso * (phi @ P_phi)
+        erro_a_priori = y - phi @ self._theta
+
+        self._theta = self._theta + (peso * erro_a_priori / denominador) * P_phi
+        self._P = self._P - np.outer(P_phi, P_phi) * (peso / denominador)
+        self._sse = max(self._sse + peso * erro_a_priori**2 / denominador, 0.0)
+
+        self._peso_total += peso
+        if self._peso_total <= 0:
+            self._media_y, self._m2_y = 0.0, 0.0
+            return
+        delta = y - self._media_y
+        self._media_y += peso * delta / self._peso_total
+        self._m2_y = max(self._m2_y + peso * delta * (y - self._media_y), 0.0)
+
+    def iniciar_lote(self, x: np.ndarray, y: np.ndarray):
+        """
+        Começa a recursão por MMQ em lote (ponderado por λ), com P = (VᵀWV)⁻¹
+        exata em vez de delta·I. Só vale para um regressor ainda vazio.
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if self.janela is not None:
+            x, y = x[-self.janela:], y[-self.janela:]
+        p = self.grau + 1
+        if self._peso_total != 0:
+            raise ValueError("O ajuste em lote só pode iniciar um regressor vazio.")
+        if len(x) < p:
+            raise ValueError(f"São necessários pelo menos {p} pontos para grau {self.grau}.")
+
+        self._ajustar_lote(x, y, self.fator_esquecimento ** np.arange(len(x) - 1, -1, -1.0))
+        if self.janela is not None:
+            self._pontos.extend(zip(x.tolist(), y.tolist()))
+
+    def _ajustar_lote(self, x: np.ndarray, y: np.ndarray, pesos: np.ndarray):
+        """θ, P = (VᵀWV)⁻¹ e estatísticas pelo MMQ ponderado; ValueError (sem alterar o estado) se V tiver posto deficiente."""
+        p = self.grau + 1
+        V = matriz_base(x, self.grau, self.base, self.centro, self.escala)
+        raiz_pesos = np.sqrt(pesos)
+        R = np.linalg.qr(V * raiz_pesos[:, np.newaxis], mode='r')
+        diagonal = np.abs(np.diag(R))
+        if diagonal.min() <= diagonal.max() * len(x) * np.finfo(float).eps:
+            raise ValueError(f"São necessários pelo menos {p} valores distintos de x para grau {self.grau}.")
+
+        self._theta = resolver_minimos_quadrados(V * raiz_pesos[:, np.newaxis], y * raiz_pesos)
+        R_inv = solve_triangular(R, np.eye(p))
+        self._P = R_inv @ R_inv.T
+        self._sse = float(np.sum(pesos * (y - V @ self._theta) ** 2))
+        self._peso_total = float(np.sum(pesos))
+        self._media_y = float(np.sum(pesos * y)) / self._peso_total
+        self._m2_y = float(np.sum(pesos * (y - self._media_y) ** 2))
+        self._desde_reconstrucao = 0
+
+    def _reconstruir_janela(self):
+        """Refaz o estado a partir dos pontos da janela, com centro/escala da faixa atual de x."""
+        x, y = (np.array(v) for v in zip(*self._pontos))
+        anteriores = self.centro, self.escala
+        self.centro, self.escala = normalizacao(np.min(x), np.max(x))
+        try:
+            self._ajustar_lote(x, y, np.ones(len(x)))
+        except ValueError:
+            # x repetidos demais na janela: segue com a recursão até a próxima tentativa
+            self.centro, self.escala = anteriores
+            self._desde_reconstrucao = 0
+
+    def atualizar(self, x: float, y: float):
+        x, y = float(x), float(y)
+        if self.fator_esquecimento < 1.0:
+            lam = self.fator_esquecimento
+            self._P /= lam
+            self._sse *= lam
+            self._peso_total *= lam
+            self._m2_y *= lam
+
+        self._aplicar(x, y, 1.0)
+        if self.janela is not None:
+            self._pontos.append((x, y))
+            if len(self._pontos) > self.janela:
+                self._aplicar(*self._pontos.popleft(), -1.0)
+            self._desde_reconstrucao += 1
+            if self._desde_reconstrucao >= self.janela:
+                self._reconstruir_janela()
+                return
+        # Mantém P simétrica contra o acúmulo de arredondamento
+        self._P = (self._P + self._P.T) / 2.0
+
+    def atualizar_lote(self, x: np.ndarray, y: np.ndarray):
+        for xi, yi in zip(x, y):
+            self.atualizar(xi, yi)
+
+    @property
+    def modelo(self) -> ModeloPolinomial:
+        return ModeloPolinomial(self._theta.copy(), self.centro, self.escala, self.base)
+
+    def prever(self, x):
+        return self.modelo(x)
+
+    @property
+    def num_amostras(self) -> float:
+        """Número efetivo de pontos (soma dos pesos)."""
+        return self._peso_total
+
+    def metricas(self) -> Tuple[float, float]:
+        """(R², variância residual) a partir das estatísticas acumuladas, em O(1)."""
+        r_quadrado = 1 - self._sse / self._m2_y if self._m2_y > 0 else 0.0
+        graus_liberdade = self._peso_total - (self.grau + 1)
+        return r_quadrado, (self._sse / graus_liberdade if graus_liberdade > 0 else 0.0)
+
+# --- Catálogo de Modelos ---
+
+@dataclass
+class EspecificacaoModelo:
+    """
+    Modelo linear nos coeficientes após uma transformação opcional de y:
+    g(y) = base(x) @ c. Exponencial e potência são linearizados com g = ln.
+    """
+    nome: str
+    base: Callable[[np.ndarray], np.ndarray]          # x (n,) -> matriz de projeto (n, p)
+    formatar: Callable[[np.ndarray], str]
+    transformar_y: Callable = np.asarray
+    inverter_y: Callable = np.asarray
+    exige_x_positivo: bool = False
+    exige_y_positivo: bool = False
+
+@dataclass
+class ModeloAjustado:
+    especificacao: EspecificacaoModelo
+    coeficientes: np.ndarray   # (p,) ou (p, k) quando há k colunas de y
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        return self.especificacao.inverter_y(self.especificacao.base(np.atleast_1d(x)) @ self.coeficientes)
+
+    def equacoes(self) -> List[str]:
+        colunas = self.coeficientes.reshape(len(self.coeficientes), -1).T
+        return [self.especificacao.formatar(c) for c in colunas]
+
+def _base_constante_e(transformacao: Callable) -> Callable:
+    return lambda x: np.column_stack([np.ones_like(x, dtype=float), transformacao(x)])
+
+CATALOGO_MODELOS: Dict[str, EspecificacaoModelo] = {
+    'exponencial': EspecificacaoModelo(
+        'Exponencial', _base_constante_e(lambda x: x),
+        lambda c: f"y = {np.exp(c[0]):.5f}·e^({c[1]:.5f}x)",
+        transformar_y=np.log, inverter_y=np.exp, exige_y_positivo=True),
+    'potencia': EspecificacaoModelo(
+        'Potência', _base_constante_e(np.log),
+        lambda c: f"y = {np.exp(c[0]):.5f}·x^{c[1]:.5f}",
+        transformar_y=np.log, inverter_y=np.exp, exige_x_positivo=True, exige_y_positivo=True),
+    'logaritmico': EspecificacaoModelo(
+        'Logarítmico', _base_constante_e(np.log),
+        lambda c: f"y = {c[0]:.5f} {'+' if c[1] >= 0 else '-'} {abs(c[1]):.5f}·ln(x)",
+        exige_x_positivo=True),
+}
+
+def modelo_personalizado(expressoes: List[str], variavel: str = 'x') -> EspecificacaoModelo:
+    """
+    y = Σ c_i f_i(x) com funções de base digitadas (ex: ['1', 'sin(x)', 'x**2']).
+    As expressões são interpretadas pelo SymPy e compiladas uma única vez.
+    """
+    import sympy as sp  # Só os modelos personalizados precisam do SymPy
+
+    x_sym = sp.Symbol(variavel)
+    try:
+        funcoes = [sp.sympify(expr.replace('^', '**'), locals={variavel: x_sym}) for expr in expressoes]
+    except sp.SympifyError as e:
+        raise ValueError(f"Erro de sintaxe matemática: {e}")
+    for funcao in funcoes:
+        if funcao.free_symbols - {x_sym}:
+            raise ValueError(f"A base '{funcao}' só pode depender de {variavel}.")
+
+    compilada = sp.lambdify(x_sym, funcoes, modules='numpy')
+    def base(x):
+        # Constantes (ex: '1') voltam como escalar e são expandidas para o tamanho de x
+        return np.column_stack([np.broadcast_to(np.asarray(col, dtype=float), x.shape) for col in compilada(x)])
+
+    def formatar(c):
+        return "y = " + " ".join(f"{coef:+.5f}·({funcao})" for coef, funcao in zip(c, funcoes)).lstrip('+')
+    return EspecificacaoModelo('Personalizado', base, formatar)
+
+def ajustar_modelo(x: np.ndarray, y: np.ndarray, especificacao: EspecificacaoModelo,
+                   pesos: Optional[np.ndarray] = None) -> ModeloAjustado:
+    """
+    MMQ ponderado: minimiza Σ w_i (g(y_i) - base(x_i)·c)². A matriz de projeto
+    é montada numa só passada vetorizada e fatorada uma única vez por QR;
+    `y` com forma (n, k) ajusta as k colunas contra o mesmo x de uma vez.
+    Nos modelos linearizados o ajuste é feito no espaço de ln(y).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if especificacao.exige_x_positivo and np.any(x <= 0):
+        raise ValueError(f"O modelo {especificacao.nome} exige X > 0.")
+    if especificacao.exige_y_positivo and np.any(y <= 0):
+        raise ValueError(f"O modelo {especificacao.nome} exige Y > 0.")
+
+    A = especificacao.base(x)
+    b = especificacao.transformar_y(y)
+    if pesos is not None:
+        raiz_pesos = np.sqrt(np.asarray(pesos, dtype=float))
+        A = A * raiz_pesos[:, np.newaxis]
+        b = b * (raiz_pesos if b.ndim == 1 else raiz_pesos[:, np.newaxis])
+    if len(x) < A.shape[1]:
+        raise ValueError(f"São necessários pelo menos {A.shape[1]} pontos para este modelo.")
+    return ModeloAjustado(especificacao, resolver_minimos_quadrados(A, b))
+
+# --- Predição em Lote ---
+
+class PreditorPolinomial:
+    """
+    Predições vetorizadas com um polinômio ajustado. Para a inversa (X dado Y),
+    os trechos monótonos são calculados uma única vez a partir das raízes reais
+    da derivada; cada alvo é resolvido por Newton com salvaguarda de bisseção
+    dentro dos trechos cujo intervalo de valores contém o alvo. Os trechos das
+    pontas são limitados pelo raio de Cauchy das raízes de p(x) - y, que pode
+    ser enorme: por isso a bisseção assume sempre que um passo de Newton não
+    reduz o colchete à metade. Alvos sem convergência viram NaN.
+    """
+    MAX_ITERACOES = 300
+    TOLERANCIA = 1e-13
+
+    def __init__(self, polinomio: np.poly1d):
+        self.polinomio = np.poly1d(polinomio)
+        self.coeficientes = self.polinomio.coeffs.astype(float)
+        self.derivada = self.polinomio.deriv().coeffs.astype(float)
+        self.grau = self.polinomio.order
+
+        criticos = np.roots(self.derivada) if self.grau >= 2 else np.array([])
+        reais = criticos[np.abs(criticos.imag) <= 1e-10 * (1 + np.abs(criticos))].real
+        self.pontos_criticos = np.unique(reais)
+
+    def prever(self, valores_x) -> np.ndarray:
+        return np.polyval(self.coeficientes, np.asarray(valores_x, dtype=float))
+
+    def inverter(self, valores_y) -> np.ndarray:
+        """
+        Matriz (alvos, grau) com as soluções reais de p(x) = y em ordem
+        crescente, completada com NaN quando há menos soluções.
+        """
+        alvos = np.atleast_1d(np.asarray(valores_y, dtype=float))
+        num_alvos = len(alvos)
+        if self.grau < 1:
+            return np.full((num_alvos, 1), np.nan)
+
+        c = self.coeficientes
+        # Raio de Cauchy de p(x) - y: todas as raízes reais ficam em [-raio, raio]
+        maximo_interno = np.max(np.abs(c[1:-1])) if self.grau > 1 else 0.0
+        raio = 1 + np.maximum(maximo_interno, np.abs(c[-1] - alvos)) / abs(c[0])
+
+        bordas = np.column_stack([-raio, np.broadcast_to(self.pontos_criticos, (num_alvos, len(self.pontos_criticos))), raio])
+        bordas = np.clip(bordas, -raio[:, np.newaxis], raio[:, np.newaxis])
+        inicio, fim = bordas[:, :-1], bordas[:, 1:]
+        alvo = np.broadcast_to(alvos[:, np.newaxis], inicio.shape)
+        f_inicio = np.polyval(c, inicio) - alvo
+        f_fim = np.polyval(c, fim) - alvo
+
+        # Trechos semiabertos [inicio, fim): uma raiz num ponto crítico não é contada duas vezes
+        ultimo = np.zeros(inicio.shape, dtype=bool)
+        ultimo[:, -1] = True
+        contem = (f_inicio == 0) | (f_inicio * f_fim < 0) | (ultimo & (f_fim == 0))
+
+        solucoes = np.full(inicio.shape, np.nan)
+        solucoes[contem] = self._newton_bisseccao(inicio[contem], fim[contem], f_inicio[contem], f_fim[contem], alvo[contem])
+        return np.sort(solucoes, axis=1)
+
+    def _newton_bisseccao(self, a: np.ndarray, b: np.ndarray, fa: np.ndarray, fb: np.ndarray,
+                          alvo: np.ndarray) -> np.ndarray:
+        exata_a, exata_b = fa == 0, fb == 0
+        x = (a + b) / 2
+        ativo = ~(exata_a | exata_b)
+        largura_anterior = np.full(x.shape, np.inf)
+        for _ in range(self.MAX_ITERACOES):
+            if not ativo.any():
+                break
+            fx = np.polyval(self.coeficientes, x) - alvo
+            dfx = np.polyval(self.derivada, x)
+            # Mantém o colchete [a, b] com troca de sinal (só nos alvos ainda ativos)
+            mesmo_sinal = np.sign(fx) == np.sign(fa)
+            a = np.where(ativo & mesmo_sinal, x, a)
+            fa = np.where(ativo & mesmo_sinal, fx, fa)
+            b = np.where(ativo & ~mesmo_sinal, x, b)
+            largura = b - a
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = x - fx / dfx
+            # Bisseção se Newton sai do colchete (ou derivada nula) ou se o último passo não o reduziu à metade
+            usar_newton = (newton > a) & (newton < b) & (largura <= 0.5 * largura_anterior)
+            x_novo = np.where(usar_newton, newton, (a + b) / 2)
+            largura_anterior = np.where(ativo, largura, largura_anterior)
+
+            raiz_exata = fx == 0
+            escala = self.TOLERANCIA * (1 + np.abs(x))
+            convergiu = (np.abs(x_novo - x) <= escala) | (largura <= escala) | raiz_exata
+            x = np.where(ativo & ~raiz_exata, x_novo, x)
+            ativo &= ~convergiu
+        x = np.where(ativo, np.nan, x)  # sem convergência: NaN em vez de um iterado qualquer
+        return np.where(exata_a, a, np.where(exata_b, b, x))
+
 # --- Funções de Plotagem ---
 
-def configurar_grafico(titulo: str, rotulo_x: str, rotulo_y: str):
-    """Aplica configurações padrão ao gráfico atual."""
-    plt.xlabel(rotulo_x)
-    plt.ylabel(rotulo_y)
-    plt.title(titulo)
-    plt.legend()
-    plt.grid(True, which='both', linestyle='--', alpha=0.6)
-    plt.minorticks_on()
-
-def plotar_ajuste(x: np.ndarray, y: np.ndarray, x_ajuste: np.ndarray, y_ajuste: np.ndarray, 
-                  titulo: str, equacao: str, r2: float, var_res: float, rot_x: str, rot_y: str):
-    """Exibe o gráfico com os dados originais, a curva ajustada e a equação na legenda."""
-    plt.figure(figsize=(8, 6))
-    
-    plt.scatter(x, y, color='red', s=50, label='Dados Originais', zorder=5)
-    
-    # Monta a legenda com Título, Equação e Métricas
-    texto_legenda = (f"{titulo}\n"
-                     f"{equacao}\n"
-                     f"($R^2$={r2:.4f} | $\\sigma^2_{{res}}$={var_res:.4f})")
-    
-    plt.plot(x_ajuste, y_ajuste, color='blue', linewidth=2, label=texto_legenda)
-    
-    configurar_grafico("Ajuste de Curva", rot_x, rot_y)
-    print("\n>>> Feche a janela do gráfico para continuar... <<<")
-    plt.show()
-
-def plotar_apenas_pontos(x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str):
-    """Exibe apenas os pontos coletados."""
-    plt.figure(figsize=(8, 6))
-    plt.scatter(x, y, color='darkred', s=70, alpha=0.8, label='Dados Coletados')
-    configurar_grafico("Visualização dos Pontos", rot_x, rot_y)
-    plt.show()
-
-def plotar_predicao_y(x_dados, y_dados, funcao_poli, valor_x, valor_y, rot_x, rot_y):
-    """Exibe visualmente a predição de Y para um dado X."""
-    plt.figure(figsize=(6, 4))
-    
-    plt.scatter(x_dados, y_dados, color='red', alpha=0.2, label="Dados Originais")
-    
-    margem = (max(x_dados) - min(x_dados)) * 0.1
-    x_plot = np.linspace(min(min(x_dados), valor_x) - margem, max(max(x_dados), valor_x) + margem, 100)
-    plt.plot(x_plot, funcao_poli(x_plot), 'b-', alpha=0.5, label="Modelo Ajustado")
-    
-    plt.plot(valor_x, valor_y, 'go', markersize=10, zorder=10, label=f'Estimativa: {valor_y:.2f}')
-    plt.axvline(valor_x, color='green', linestyle=':', alpha=0.5)
-    
-    configurar_grafico(f"Predição: Y dado X={valor_x}", rot_x, rot_y)
-    plt.show()
+def _graficos():
+    """Importa a camada de gráficos (e o matplotlib) só quando uma figura é pedida."""
+    import GraficosAjusteDeCurvas
+    return GraficosAjusteDeCurvas
 
-def plotar_predicao_x(x_dados, y_dados, funcao_poli, valor_y_alvo, raizes_reais, rot_x, rot_y):
-    """Exibe visualmente a busca de X para um dado Y alvo."""
-    plt.figure(figsize=(6, 4))
-    plt.scatter(x_dados, y_dados, color='red', alpha=0.2, label="Dados Originais")
-    
-    x_min = min(min(x_dados), min(raizes_reais))
-    x_max = max(max(x_dados), max(raizes_reais))
-    margem = (x_max - x_min) * 0.1
-    
-    x_plot = np.linspace(x_min - margem, x_max + margem, 200)
-    plt.plot(x_plot, funcao_poli(x_plot), 'b-', alpha=0.5, label="Modelo Ajustado")
-    
-    plt.axhline(valor_y_alvo, color='orange', linestyle='--', label=f'Alvo Y={valor_y_alvo}')
-    
-    for i, raiz in enumerate(raizes_reais):
-        texto = f'Solução X={raiz:.2f}' if i == 0 else ""
-        plt.plot(raiz, valor_y_alvo, 'go', markersize=8, zorder=10, label=texto)
-        plt.axvline(raiz, color='green', linestyle=':', alpha=0.3)
-        
-    configurar_grafico(f"Predição: X dado Y={valor_y_alvo}", rot_x, rot_y)
-    plt.show()
+def plotar_ajuste(*args, **kwargs):
+    _graficos().plotar_ajuste(*args, **kwargs)
+
+def plotar_apenas_pontos(*args, **kwargs):
+    _graficos().plotar_apenas_pontos(*args, **kwargs)
+
+def plotar_predicao_y(*args, **kwargs):
+    _graficos().plotar_predicao_y(*args, **kwargs)
+
+def plotar_predicao_x(*args, **kwargs):
+    _graficos().plotar_predicao_x(*args, **kwargs)
 
 # --- Lógica de Negócio ---
 
@@ -156,11 +659,12 @@ def realizar_predicao_y(funcao_poli, x_dados, y_dados, rot_x, rot_y):
     except ValueError:
         print("Entrada inválida.")
 
-def realizar_predicao_x(funcao_poli, x_dados, y_dados, rot_x, rot_y):
+def realizar_predicao_x(funcao_poli, x_dados, y_dados, rot_x, rot_y, preditor: Optional[PreditorPolinomial] = None):
     try:
         valor_y_alvo = float(input(f"Digite o valor alvo de {rot_y} (Y): "))
-        raizes = (funcao_poli - valor_y_alvo).roots
-        raizes_reais = raizes[np.iscomplex(raizes) == False].real
+        preditor = preditor or PreditorPolinomial(funcao_poli)
+        raizes_reais = preditor.inverter(valor_y_alvo)[0]
+        raizes_reais = raizes_reais[~np.isnan(raizes_reais)]
         
         if len(raizes_reais) == 0:
             print(f"\n---> Não há valor real de {rot_x} para este {rot_y} no modelo atual.")
@@ -172,34 +676,82 @@ def realizar_predicao_x(funcao_poli, x_dados, y_dados, rot_x, rot_y):
     except ValueError:
         print("Entrada inválida.")
 
+def realizar_predicao_lote(preditor: PreditorPolinomial, rot_x: str, rot_y: str):
+    """Várias consultas de uma vez: Y para uma lista de X ou X para uma lista de Y."""
+    direcao = input(f"1. {rot_y} dado {rot_x}  |  2. {rot_x} dado {rot_y}: ").strip()
+    try:
+        valores = np.array([float(v) for v in input("Valores separados por espaço: ").split()])
+    except ValueError:
+        print("Entrada inválida.")
+        return
+
+    if direcao == '1':
+        for valor_x, valor_y in zip(valores, preditor.prever(valores)):
+            print(f"   {rot_x} = {valor_x:.5f} -> {rot_y} = {valor_y:.5f}")
+    elif direcao == '2':
+        for valor_y, raizes in zip(valores, preditor.inverter(valores)):
+            raizes = raizes[~np.isnan(raizes)]
+            texto = ", ".join(f"{r:.5f}" for r in raizes) if len(raizes) else "sem solução real"
+            print(f"   {rot_y} = {valor_y:.5f} -> {rot_x} = {texto}")
+    else:
+        print("Opção inválida.")
+
 def menu_predicoes(funcao_poli: np.poly1d, x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str):
     """Sub-menu para realizar inferências com o modelo ajustado."""
+    # Trechos monótonos calculados uma vez e reaproveitados em todas as consultas
+    preditor = PreditorPolinomial(funcao_poli)
     while True:
         print(f"\n>>> PREDIÇÕES (Baseadas no ajuste atual) <<<")
         print(f"1. Encontrar {rot_y} (Y) dado um valor de {rot_x} (X)")
         print(f"2. Encontrar {rot_x} (X) dado um valor de {rot_y} (Y)")
+        print("3. Predições em lote (lista de valores)")
         print("0. Voltar ao menu principal")
         opcao = input("Escolha uma opção: ")
         if opcao == '0': break
         elif opcao == '1': realizar_predicao_y(funcao_poli, x, y, rot_x, rot_y)
-        elif opcao == '2': realizar_predicao_x(funcao_poli, x, y, rot_x, rot_y)
+        elif opcao == '2': realizar_predicao_x(funcao_poli, x, y, rot_x, rot_y, preditor)
+        elif opcao == '3': realizar_predicao_lote(preditor, rot_x, rot_y)
         else: print("Opção inválida.")
 
+def selecionar_grau_interativo(x: np.ndarray, y: np.ndarray) -> int:
+    """Mostra a tabela de graus ordenada por validação cruzada e devolve o melhor."""
+    grau_maximo = int(input("Grau máximo a testar: "))
+    tabela, _ = selecionar_grau(x, y, grau_maximo)
+    print(f"\n{'Grau':>4} | {'Erro CV':>11} | {'AIC':>10} | {'BIC':>10} | {'R²':>8}")
+    print("-" * 55)
+    for linha in tabela:
+        print(f"{linha.grau:>4} | {linha.erro_cv:>11.5g} | {linha.aic:>10.3f} | {linha.bic:>10.3f} | {linha.r_quadrado:>8.5f}")
+    print(f"Grau escolhido (menor erro de validação cruzada): {tabela[0].grau}")
+    return tabela[0].grau
+
 def executar_mmq(x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str):
     """Executa o Método dos Mínimos Quadrados."""
     try:
-        grau = int(input("Grau do polinômio (1=Reta, 2=Parábola, etc): "))
+        entrada = input("Grau do polinômio (1=Reta, 2=Parábola, etc, ou 'auto'): ").strip().lower()
+        if entrada == 'auto':
+            try:
+                grau = selecionar_grau_interativo(x, y)
+            except ValueError as e:
+                print(f"Erro: {e}")
+                return
+        else:
+            grau = int(entrada)
         if grau < 1:
             print("Grau deve ser maior ou igual a 1.")
             return
 
-        coeficientes = np.polyfit(x, y, grau)
-        polinomio = np.poly1d(coeficientes)
+        if len(x) <= grau:
+            print(f"São necessários pelo menos {grau + 1} pontos para grau {grau}.")
+            return
+
+        # Ajuste em base de Chebyshev com x normalizado (bem condicionado); poly1d só para exibir e prever
+        modelo = ajustar_polinomio(x, y, grau)
+        polinomio = modelo.para_poly1d()
         
         # Formata a equação aqui para usar tanto no print quanto no gráfico
-        equacao_texto = formatar_equacao_polinomio(coeficientes)
+        equacao_texto = formatar_equacao_polinomio(polinomio.coeffs)
         
-        r2, var_residual = calcular_metricas(y, polinomio(x), grau + 1)
+        r2, var_residual = calcular_metricas(y, modelo(x), grau + 1)
         
         print(f"\n--- MMQ Grau {grau} ---")
         print(equacao_texto)
@@ -208,7 +760,7 @@ def executar_mmq(x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str):
         x_plot = np.linspace(min(x), max(x), 500)
         
         # Passamos equacao_texto para o gráfico agora
-        plotar_ajuste(x, y, x_plot, polinomio(x_plot), f"MMQ G{grau}", equacao_texto, r2, var_residual, rot_x, rot_y)
+        plotar_ajuste(x, y, x_plot, modelo(x_plot), f"MMQ G{grau}", equacao_texto, r2, var_residual, rot_x, rot_y)
         
         menu_predicoes(polinomio, x, y, rot_x, rot_y)
         
@@ -235,6 +787,111 @@ def executar_reta_extremos(x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str)
     plotar_ajuste(x, y, x, polinomio_reta(x), "Reta Extremos", equacao_texto, r2, var_residual, rot_x, rot_y)
     menu_predicoes(polinomio_reta, x, y, rot_x, rot_y)
 
+def executar_mmq_arquivo():
+    """MMQ sobre um arquivo grande, lido em blocos sem carregar os dados na memória."""
+    caminho = input("Caminho do arquivo (CSV/TXT com colunas X Y, .npy ou binário float64): ").strip()
+    try:
+        grau = int(input("Grau do polinômio: "))
+        if grau < 1:
+            print("Grau deve ser maior ou igual a 1.")
+            return
+        modelo, acumulador = ajustar_arquivo(caminho, grau)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}")
+        return
+
+    r2, var_residual = acumulador.metricas()
+    print(f"\n--- MMQ Grau {grau} ({acumulador.num_amostras} pontos, em blocos) ---")
+    print(formatar_equacao_polinomio(modelo.para_poly1d().coeffs))
+    print(f"R²: {r2:.5f} | Var.Res: {var_residual:.5f}")
+
+def executar_regressao_online():
+    """
+    Recebe pontos um a um e atualiza o ajuste a cada entrada, sem refazer do zero.
+    Os primeiros grau+1 pontos formam um ajuste em lote exato (base de Chebyshev
+    com x normalizado pela faixa informada ou por esses pontos); a partir daí
+    a atualização é recursiva.
+    """
+    try:
+        grau = int(input("Grau do polinômio: "))
+        entrada = input("Janela deslizante (nº de pontos, vazio = todos): ").strip()
+        janela = int(entrada) if entrada else None
+        entrada = input("Fator de esquecimento λ em (0, 1] (vazio = 1): ").strip() if janela is None else ""
+        fator_esquecimento = float(entrada) if entrada else 1.0
+        entrada = input("Faixa esperada de x 'mín máx' (vazio = estimar pelos primeiros pontos): ").strip()
+        faixa = tuple(float(v) for v in entrada.split()) if entrada else None
+        if faixa is not None and (len(faixa) != 2 or faixa[0] >= faixa[1]):
+            raise ValueError("informe dois números com mín < máx")
+        # Valida grau, janela e λ antes de pedir os pontos
+        RegressorPolinomialOnline(grau, fator_esquecimento, janela)
+    except ValueError as e:
+        print(f"Entrada inválida: {e}")
+        return
+
+    print("Digite pontos no formato 'x y' (linha vazia encerra).")
+    regressor = None
+    iniciais_x, iniciais_y = [], []
+    while True:
+        linha = input("> ").strip()
+        if not linha:
+            break
+        try:
+            x_novo, y_novo = (float(v) for v in linha.split())
+        except ValueError:
+            print("Use dois números separados por espaço.")
+            continue
+
+        if regressor is not None:
+            regressor.atualizar(x_novo, y_novo)
+        else:
+            iniciais_x.append(x_novo)
+            iniciais_y.append(y_novo)
+            if len(iniciais_x) < grau + 1:
+                print(f"  Ponto guardado ({len(iniciais_x)}/{grau + 1} para o ajuste inicial).")
+                continue
+            centro, escala = normalizacao(*(faixa or (min(iniciais_x), max(iniciais_x))))
+            candidato = RegressorPolinomialOnline(grau, fator_esquecimento, janela, centro, escala, 'chebyshev')
+            try:
+                candidato.iniciar_lote(iniciais_x, iniciais_y)
+            except ValueError as e:
+                print(f"  {e} Aguardando mais pontos.")
+                continue
+            regressor = candidato
+        r2, var_residual = regressor.metricas()
+        print(f"  {formatar_equacao_polinomio(regressor.modelo.para_poly1d().coeffs)}"
+              f" | R²: {r2:.5f} | Var.Res: {var_residual:.5f}")
+
+def executar_outros_modelos(x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str):
+    """Ajusta um modelo do catálogo (ou com funções de base digitadas) e exibe o gráfico."""
+    nomes = list(CATALOGO_MODELOS)
+    for i, nome in enumerate(nomes, 1):
+        print(f"{i}. {CATALOGO_MODELOS[nome].nome}")
+    print(f"{len(nomes) + 1}. Personalizado (funções de base)")
+    opcao = input("Modelo: ").strip()
+
+    try:
+        if opcao == str(len(nomes) + 1):
+            expressoes = input("Funções de base separadas por vírgula (ex: 1, sin(x), x^2): ").split(',')
+            especificacao = modelo_personalizado([e.strip() for e in expressoes if e.strip()])
+        elif opcao.isdigit() and 1 <= int(opcao) <= len(nomes):
+            especificacao = CATALOGO_MODELOS[nomes[int(opcao) - 1]]
+        else:
+            print("Opção inválida.")
+            return
+        modelo = ajustar_modelo(x, y, especificacao)
+    except ValueError as e:
+        print(f"Erro: {e}")
+        return
+
+    equacao_texto = modelo.equacoes()[0]
+    r2, var_residual = calcular_metricas(y, modelo(x), len(modelo.coeficientes))
+    print(f"\n--- {especificacao.nome} ---")
+    print(equacao_texto)
+    print(f"R²: {r2:.5f} | Var.Res: {var_residual:.5f}")
+
+    x_plot = np.linspace(min(x), max(x), 500)
+    plotar_ajuste(x, y, x_plot, modelo(x_plot), especificacao.nome, equacao_texto, r2, var_residual, rot_x, rot_y)
+
 def menu_principal():
     """Controlador principal."""
     x, y = None, None
@@ -252,6 +909,9 @@ def menu_principal():
         print("-" * 30)
         print("4. Visualizar apenas Pontos")
         print("5. Inserir novos dados")
+        print("6. MMQ de arquivo grande (leitura em blocos)")
+        print("7. Regressão online (pontos chegando um a um)")
+        print("8. Outros modelos (Exponencial, Potência, Logarítmico, Personalizado)")
         print("0. Sair")
         
         opcao = input("Opção: ")
@@ -270,8 +930,80 @@ def menu_principal():
             plotar_ajuste(x, y, x, y, "Interpolação", "Conexão Direta", 1.0, 0.0, rotulo_x, rotulo_y)
         elif opcao == '2':
             executar_reta_extremos(x, y, rotulo_x, rotulo_y)
+        elif opcao == '6':
+            executar_mmq_arquivo()
+        elif opcao == '7':
+            executar_regressao_online()
+        elif opcao == '8':
+            executar_outros_modelos(x, y, rotulo_x, rotulo_y)
         else:
             print("Opção inválida.")
 
+# --- Verificação ---
+
+def verificar_predicao_inversa(num_polinomios: int = 500, semente: int = 0) -> int:
+    """
+    Compara PreditorPolinomial.inverter com np.roots em polinômios de grau 4 a 7
+    ajustados por np.polyfit com x em [0, 1000]: coeficientes pequenos levam o
+    raio de Cauchy a 1e12-1e16, o caso em que o Newton salvaguardado mais sofre.
+    Retorna o número de alvos com raízes divergentes (0 = ok).
+    """
+    gerador = np.random.default_rng(semente)
+    divergentes = 0
+    for _ in range(num_polinomios):
+        grau = int(gerador.integers(4, 8))
+        x = np.sort(gerador.uniform(0, 1000, 40))
+        y = np.cumsum(gerador.normal(size=40)) * 10
+        coeficientes = np.polyfit(x, y, grau)
+        alvos = gerador.uniform(y.min(), y.max(), 5)
+        for alvo, obtidas in zip(alvos, PreditorPolinomial(np.poly1d(coeficientes)).inverter(alvos)):
+            raizes = np.roots(np.r_[coeficientes[:-1], coeficientes[-1] - alvo])
+            reais = np.sort(raizes[np.abs(raizes.imag) <= 1e-7 * (1 + np.abs(raizes))].real)
+            obtidas = obtidas[~np.isnan(obtidas)]
+            if len(obtidas) != len(reais) or not np.allclose(obtidas, reais, rtol=1e-6, atol=1e-6):
+                divergentes += 1
+    print(f"Predição inversa: {divergentes} de {5 * num_polinomios} alvos divergem de np.roots.")
+    return divergentes
+
+def verificar_regressao_janela(grau: int = 2, janela: int = 50, num_pontos: int = 20_000,
+                               intervalo_verificacao: int = 997, semente: int = 0) -> int:
+    """
+    Janela deslizante do RegressorPolinomialOnline ao longo de milhares de
+    atualizações, com x em [0, 1000] normalizado só pelos primeiros pontos
+    (o fluxo de `executar_regressao_online`). A cada `intervalo_verificacao`
+    pontos, compara previsões e R² com ajustar_polinomio nos últimos `janela`
+    pontos. Retorna o número de verificações divergentes (0 = ok).
+    """
+    gerador = np.random.default_rng(semente)
+    x = np.linspace(0, 1000, num_pontos)
+    y = 0.002 * x**2 - x + 30 * np.sin(x / 30) + gerador.normal(0, 50, num_pontos)
+    p = grau + 1
+    regressor = RegressorPolinomialOnline(grau, 1.0, janela, *normalizacao(x[0], x[p - 1]), 'chebyshev')
+    regressor.iniciar_lote(x[:p], y[:p])
+
+    divergentes = verificacoes = 0
+    for i in range(p, num_pontos):
+        regressor.atualizar(x[i], y[i])
+        if (i + 1) % intervalo_verificacao != 0 or i + 1 < janela:
+            continue
+        verificacoes += 1
+        x_jan, y_jan = x[i + 1 - janela:i + 1], y[i + 1 - janela:i + 1]
+        referencia = ajustar_polinomio(x_jan, y_jan, grau)
+        r2_ref, _ = calcular_metricas(y_jan, referencia(x_jan), p)
+        desvio = np.max(np.abs(regressor.prever(x_jan) - referencia(x_jan)))
+        if desvio > 1e-8 * np.max(np.abs(y_jan)) or abs(regressor.metricas()[0] - r2_ref) > 1e-8:
+            divergentes += 1
+    print(f"Regressão online (janela {janela}): {divergentes} de {verificacoes} verificações divergem do ajuste em lote.")
+    return divergentes
+
 if __name__ == "__main__":
+    if "--verificar" in sys.argv[1:]:
+        falhas = verificar_predicao_inversa() + verificar_regressao_janela()
+        sys.exit(1 if falhas else 0)
+    # --graficos DIR [png|svg] grava as figuras no diretório em vez de abrir janelas
+    argumentos = sys.argv[1:]
+    if "--graficos" in argumentos[:-1]:
+        posicao = argumentos.index("--graficos")
+        formato = argumentos[posicao + 2] if len(argumentos) > posicao + 2 else 'png'
+        _graficos().configurar_saida(argumentos[posicao + 1], formato)
     menu_principal()
\ No newline at end of file
@@ -1,8 +1,16 @@
 import numpy as np
 import sympy as sp
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional, Callable, Dict, Any
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple, Optional, Callable, Dict, Any, Union, Iterator, Iterable, Sequence
+import json
+import multiprocessing
+import os
 import sys
+import time
+from DadosTabelados import ler_blocos_xy
 
 
 # 1. CAMADA DE DOMÍNIO (Estratégias Matemáticas)
@@ -10,85 +18,628 @@ import sys
 class EstrategiaIntegracao(ABC):
     """
     Interface base para algoritmos de integração numérica.
+
+    `valores_y` pode ser N-dimensional: a integração ocorre ao longo de `axis`
+    e o retorno tem a forma dos dados sem esse eixo (escalar no caso 1-D).
+    `passo_h` pode ser um array compatível por broadcasting com esse retorno.
     """
+    # Quantidade de subintervalos que formam um painel da regra composta
+    intervalos_por_painel: int = 1
+
     @property
     @abstractmethod
     def nome(self) -> str:
         pass
 
     @abstractmethod
-    def calcular(self, valores_y: np.ndarray, passo_h: float) -> float:
+    def calcular(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> Union[float, np.ndarray]:
         pass
 
+    def calcular_nao_uniforme(self, valores_x: np.ndarray, valores_y: np.ndarray) -> float:
+        """Integra dados tabelados com espaçamento variável em X."""
+        raise ValueError("Não suporta h variável")
+
+    def calcular_acumulado(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> np.ndarray:
+        """Integral acumulada F(x_i) em todos os pontos da malha, com F(x_0) = 0."""
+        raise ValueError("Não suporta integral acumulada")
+
+    def pesos(self, num_segmentos: int, passo_h: float) -> np.ndarray:
+        """Vetor w (num_segmentos+1,) da regra composta: a integral é w @ y."""
+        raise ValueError("Não suporta vetor de pesos")
+
+    def acumular_em_blocos(self, blocos_y: Iterable[np.ndarray], passo_h: float) -> Iterator[np.ndarray]:
+        """
+        Versão em fluxo de `calcular_acumulado` para sinais 1-D: recebe os valores
+        de Y em blocos consecutivos e gera a integral acumulada correspondente a
+        cada trecho. Pontos de painéis ainda incompletos ficam retidos até o
+        bloco seguinte, então a concatenação das saídas equivale ao cálculo único.
+        """
+        painel = self.intervalos_por_painel
+        deslocamento = 0.0
+        pendente = np.empty(0)
+        primeiro = True
+
+        for bloco in blocos_y:
+            buf = np.concatenate([pendente, np.asarray(bloco, dtype=float).ravel()])
+            corte = ((len(buf) - 1 - painel) // painel) * painel
+            if corte > 0:
+                acumulado = deslocamento + self.calcular_acumulado(buf[:corte + 1], passo_h)
+                yield acumulado if primeiro else acumulado[1:]
+                primeiro = False
+                deslocamento = acumulado[-1]
+                buf = buf[corte:]
+            pendente = buf
+
+        if primeiro and len(pendente) == 1:
+            yield np.zeros(1)
+        elif len(pendente) >= 2:
+            acumulado = deslocamento + self.calcular_acumulado(pendente, passo_h)
+            yield acumulado if primeiro else acumulado[1:]
+
 class MetodoTrapezio(EstrategiaIntegracao):
     @property
     def nome(self) -> str:
         return "Regra do Trapézio"
 
-    def calcular(self, valores_y: np.ndarray, passo_h: float) -> float:
-        soma = valores_y[0] + 2 * np.sum(valores_y[1:-1]) + valores_y[-1]
+    def calcular(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> Union[float, np.ndarray]:
+        y = np.moveaxis(np.asarray(valores_y, dtype=float), axis, -1)
+        soma = y[..., 0] + 2 * np.sum(y[..., 1:-1], axis=-1) + y[..., -1]
         return (passo_h / 2) * soma
 
+    def pesos(self, num_segmentos: int, passo_h: float) -> np.ndarray:
+        w = np.full(num_segmentos + 1, float(passo_h))
+        w[0] = w[-1] = passo_h / 2
+        return w
+
+    def calcular_nao_uniforme(self, valores_x: np.ndarray, valores_y: np.ndarray) -> float:
+        x = np.asarray(valores_x, dtype=float)
+        y = np.asarray(valores_y, dtype=float)
+        return float(np.sum(np.diff(x) * (y[:-1] + y[1:])) / 2)
+
+    def calcular_acumulado(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> np.ndarray:
+        y = np.moveaxis(np.asarray(valores_y, dtype=float), axis, -1)
+        h = np.expand_dims(np.asarray(passo_h, dtype=float), -1)
+
+        acumulado = np.zeros(np.broadcast_shapes(y.shape, h.shape))
+        np.cumsum((h / 2) * (y[..., :-1] + y[..., 1:]), axis=-1, out=acumulado[..., 1:])
+        return np.moveaxis(acumulado, -1, axis)
+
 class MetodoSimpson13(EstrategiaIntegracao):
+    intervalos_por_painel = 2
+
     @property
     def nome(self) -> str:
         return "Simpson 1/3"
 
-    def calcular(self, valores_y: np.ndarray, passo_h: float) -> float:
-        num_segmentos = len(valores_y) - 1
+    def calcular(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> Union[float, np.ndarray]:
+        y = np.moveaxis(np.asarray(valores_y, dtype=float), axis, -1)
+        num_segmentos = y.shape[-1] - 1
         if num_segmentos % 2 != 0:
             raise ValueError("Requer n PAR") # Mensagem curta para caber na tabela
         
-        soma = (valores_y[0] 
-                + 4 * np.sum(valores_y[1:-1:2]) 
-                + 2 * np.sum(valores_y[2:-1:2]) 
-                + valores_y[-1])
+        soma = (y[..., 0] 
+                + 4 * np.sum(y[..., 1:-1:2], axis=-1) 
+                + 2 * np.sum(y[..., 2:-1:2], axis=-1) 
+                + y[..., -1])
         return (passo_h / 3) * soma
 
+    def pesos(self, num_segmentos: int, passo_h: float) -> np.ndarray:
+        if num_segmentos % 2 != 0:
+            raise ValueError("Requer n PAR")
+        w = np.full(num_segmentos + 1, 4.0)
+        w[::2] = 2.0
+        w[0] = w[-1] = 1.0
+        return (passo_h / 3) * w
+
+    def calcular_nao_uniforme(self, valores_x: np.ndarray, valores_y: np.ndarray) -> float:
+        """
+        Simpson para malha irregular: cada par de subintervalos (h0, h1) recebe a
+        parábola pelos 3 pontos. Com n ímpar, o último subintervalo usa a mesma
+        parábola ajustada aos 3 pontos finais.
+        """
+        x = np.asarray(valores_x, dtype=float)
+        y = np.asarray(valores_y, dtype=float)
+        num_segmentos = len(x) - 1
+        if num_segmentos < 2:
+            raise ValueError("Requer ao menos 3 pontos")
+
+        h = np.diff(x)
+        fim_pares = num_segmentos - num_segmentos % 2
+        h0, h1 = h[0:fim_pares:2], h[1:fim_pares:2]
+        y0, y1, y2 = y[0:fim_pares:2], y[1:fim_pares:2], y[2:fim_pares + 1:2]
+        soma_h = h0 + h1
+        total = np.sum(soma_h / 6 * ((2 - h1 / h0) * y0
+                                     + soma_h ** 2 / (h0 * h1) * y1
+                                     + (2 - h0 / h1) * y2))
+
+        if num_segmentos % 2 != 0:
+            h_ant, h_ult = h[-2], h[-1]
+            alfa = (2 * h_ult ** 2 + 3 * h_ult * h_ant) / (6 * (h_ant + h_ult))
+            beta = (h_ult ** 2 + 3 * h_ult * h_ant) / (6 * h_ant)
+            eta = h_ult ** 3 / (6 * h_ant * (h_ant + h_ult))
+            total += alfa * y[-1] + beta * y[-2] - eta * y[-3]
+
+        return float(total)
+
+    def calcular_acumulado(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> np.ndarray:
+        """
+        Nos pontos pares, F é a soma acumulada dos painéis de Simpson. Nos ímpares
+        (meio de painel), soma-se a integral da parábola do painel até o ponto
+        médio: h/12 (5y0 + 8y1 - y2). Com n ímpar, o último ponto usa a mesma
+        parábola aplicada ao subintervalo final.
+        """
+        y = np.moveaxis(np.asarray(valores_y, dtype=float), axis, -1)
+        h = np.expand_dims(np.asarray(passo_h, dtype=float), -1)
+        num_segmentos = y.shape[-1] - 1
+        if num_segmentos < 2:
+            raise ValueError("Requer ao menos 3 pontos")
+
+        fim_pares = num_segmentos - num_segmentos % 2
+        y0, y1, y2 = y[..., 0:fim_pares:2], y[..., 1:fim_pares:2], y[..., 2:fim_pares + 1:2]
+
+        acumulado = np.zeros(np.broadcast_shapes(y.shape, h.shape))
+        np.cumsum((h / 3) * (y0 + 4 * y1 + y2), axis=-1, out=acumulado[..., 2:fim_pares + 1:2])
+        acumulado[..., 1:fim_pares:2] = acumulado[..., 0:fim_pares:2] + (h / 12) * (5 * y0 + 8 * y1 - y2)
+
+        if num_segmentos % 2 != 0:
+            acumulado[..., -1] = (acumulado[..., -2]
+                                  + (h[..., 0] / 12) * (-y[..., -3] + 8 * y[..., -2] + 5 * y[..., -1]))
+        return np.moveaxis(acumulado, -1, axis)
+
 class MetodoSimpson38(EstrategiaIntegracao):
+    intervalos_por_painel = 3
+
     @property
     def nome(self) -> str:
         return "Simpson 3/8"
 
-    def calcular(self, valores_y: np.ndarray, passo_h: float) -> float:
-        num_segmentos = len(valores_y) - 1
+    def calcular(self, valores_y: np.ndarray, passo_h: Union[float, np.ndarray], axis: int = -1) -> Union[float, np.ndarray]:
+        y = np.moveaxis(np.asarray(valores_y, dtype=float), axis, -1)
+        # Pesos com h = 1 (múltiplos exatos de 3/8); passo_h pode ser array
+        return (y @ self.pesos(y.shape[-1] - 1, 1.0)) * passo_h
+
+    def pesos(self, num_segmentos: int, passo_h: float) -> np.ndarray:
         if num_segmentos % 3 != 0:
             raise ValueError("Requer n MÚLTIPLO DE 3")
-        
-        soma = valores_y[0] + valores_y[-1]
-        for i in range(1, num_segmentos):
-            fator = 2 if i % 3 == 0 else 3
-            soma += fator * valores_y[i]
-            
-        return (3 * passo_h / 8) * soma
+        # Pesos 1, 3, 3, 2, 3, 3, 2, ..., 3, 3, 1 montados por fatiamento com passo 3
+        w = np.full(num_segmentos + 1, 3.0)
+        w[::3] = 2.0
+        w[0] = w[-1] = 1.0
+        return (3 * passo_h / 8) * w
+
+
+# 1.1 INTEGRAIS MÚLTIPLAS (Caixas [a1,b1] x ... x [ad,bd])
+
+@dataclass
+class ResultadoIntegracaoMultipla:
+    valor: float
+    metodo: str
+    avaliacoes: int
+    erro_padrao: Optional[float] = None
+
+class EstrategiaIntegracaoMultipla(ABC):
+    """
+    Interface para integração de f(x1, ..., xd) sobre uma caixa.
+    `funcao` recebe d arrays (compatíveis por broadcasting) e devolve um array.
+    """
+    @property
+    @abstractmethod
+    def nome(self) -> str:
+        pass
+
+    @abstractmethod
+    def calcular(self, funcao: Callable[..., np.ndarray], limites: Sequence[Tuple[float, float]], n: int) -> ResultadoIntegracaoMultipla:
+        pass
+
+class ProdutoTensorialBase(EstrategiaIntegracaoMultipla):
+    """
+    Regra produto: avalia f numa grade montada por broadcasting (meshgrid
+    esparso) e contrai um eixo por vez com os pesos 1-D. O custo é (n+1)^d,
+    adequado a dimensões baixas (d <= 3).
+    """
+    LIMITE_PONTOS = 10 ** 8
+
+    @abstractmethod
+    def _nos_e_pesos(self, a: float, b: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        pass
+
+    def calcular(self, funcao: Callable[..., np.ndarray], limites: Sequence[Tuple[float, float]], n: int) -> ResultadoIntegracaoMultipla:
+        nos, pesos = zip(*(self._nos_e_pesos(a, b, n) for a, b in limites))
+        forma = tuple(len(no) for no in nos)
+        total_pontos = int(np.prod(forma))
+        if total_pontos > self.LIMITE_PONTOS:
+            raise ValueError(f"Grade com {total_pontos:.2e} pontos; use Quase-Monte Carlo")
+
+        grades = np.meshgrid(*nos, indexing='ij', sparse=True)
+        valores = np.broadcast_to(funcao(*grades), forma)
+        for w in pesos:
+            valores = np.tensordot(valores, w, axes=([0], [0]))
+        return ResultadoIntegracaoMultipla(float(valores), self.nome, total_pontos)
+
+class ProdutoTensorialNewtonCotes(ProdutoTensorialBase):
+    """Produto tensorial de uma regra 1-D composta (Trapézio, Simpson 1/3 ou 3/8)."""
+    def __init__(self, regra_1d: EstrategiaIntegracao):
+        self.regra_1d = regra_1d
+
+    @property
+    def nome(self) -> str:
+        return f"{self.regra_1d.nome} (Tensorial)"
+
+    def _nos_e_pesos(self, a: float, b: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        return np.linspace(a, b, n + 1), self.regra_1d.pesos(n, (b - a) / n)
+
+class ProdutoTensorialGauss(ProdutoTensorialBase):
+    """Gauss-Legendre com n nós por dimensão."""
+    @property
+    def nome(self) -> str:
+        return "Gauss-Legendre (Tensorial)"
+
+    def _nos_e_pesos(self, a: float, b: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        nos, pesos = np.polynomial.legendre.leggauss(n)
+        meia_largura = (b - a) / 2
+        return meia_largura * nos + (a + b) / 2, meia_largura * pesos
+
+def _estimar_replica_qmc(funcao: Callable[..., np.ndarray], limites: Sequence[Tuple[float, float]],
+                         num_pontos: int, sequencia: str, tamanho_lote: int, semente: int) -> float:
+    """Média de f numa réplica embaralhada da sequência (nível de módulo para uso em processos)."""
+    from scipy.stats import qmc
+
+    dimensao = len(limites)
+    if sequencia == 'sobol':
+        gerador = qmc.Sobol(dimensao, scramble=True, seed=semente)
+    else:
+        gerador = qmc.Halton(dimensao, scramble=True, seed=semente)
+
+    inferiores = np.array([a for a, _ in limites], dtype=float)
+    larguras = np.array([b - a for a, b in limites], dtype=float)
+
+    soma = 0.0
+    for inicio in range(0, num_pontos, tamanho_lote):
+        amostra = inferiores + larguras * gerador.random(min(tamanho_lote, num_pontos - inicio))
+        valores = funcao(*amostra.T)
+        soma += float(np.sum(np.broadcast_to(valores, (amostra.shape[0],))))
+    return soma / num_pontos
+
+class MonteCarloQuaseAleatorio(EstrategiaIntegracaoMultipla):
+    """
+    Quase-Monte Carlo com sequências de baixa discrepância (Sobol ou Halton).
+    Usa `replicas` embaralhamentos independentes: a média entre elas é a
+    estimativa e o desvio entre elas fornece o erro padrão. Cada réplica é
+    avaliada em lotes de `tamanho_lote` pontos (memória limitada) e as
+    réplicas podem rodar em paralelo em `processos` processos.
+    """
+    def __init__(self, sequencia: str = 'sobol', replicas: int = 8, tamanho_lote: int = 2 ** 16,
+                 processos: int = 1, semente: Optional[int] = None):
+        if sequencia not in ('sobol', 'halton'):
+            raise ValueError("Sequência deve ser 'sobol' ou 'halton'.")
+        if replicas < 2:
+            raise ValueError("São necessárias ao menos 2 réplicas para estimar o erro padrão.")
+        self.sequencia = sequencia
+        self.replicas = replicas
+        self.tamanho_lote = tamanho_lote
+        self.processos = processos
+        self.semente = semente
+
+    @property
+    def nome(self) -> str:
+        return f"Quase-Monte Carlo ({self.sequencia.capitalize()})"
+
+    def calcular(self, funcao: Callable[..., np.ndarray], limites: Sequence[Tuple[float, float]], n: int) -> ResultadoIntegracaoMultipla:
+        # Sobol preserva as propriedades de equilíbrio apenas em potências de 2
+        num_pontos = n
+        lote = min(self.tamanho_lote, num_pontos)
+        if self.sequencia == 'sobol':
+            num_pontos = 1 << max(int(np.ceil(np.log2(max(n, 2)))), 1)
+            lote = min(1 << int(np.log2(max(self.tamanho_lote, 2))), num_pontos)
+
+        sementes = np.random.SeedSequence(self.semente).generate_state(self.replicas)
+        argumentos = [(funcao, limites, num_pontos, self.sequencia, lote, int(s)) for s in sementes]
+        if self.processos > 1:
+            with ProcessPoolExecutor(max_workers=self.processos) as executor:
+                medias = list(executor.map(_estimar_replica_qmc, *zip(*argumentos)))
+        else:
+            medias = [_estimar_replica_qmc(*args) for args in argumentos]
+
+        volume = float(np.prod([b - a for a, b in limites]))
+        medias = volume * np.array(medias)
+        erro_padrao = float(np.std(medias, ddof=1) / np.sqrt(self.replicas))
+        return ResultadoIntegracaoMultipla(float(np.mean(medias)), self.nome,
+                                           num_pontos * self.replicas, erro_padrao)
 
 
 # 2. CAMADA DE SERVIÇO (Lógica Auxiliar)
 
+def soma_compensada(parcelas: Iterable[float]) -> float:
+    """Soma de Neumaier (Kahan melhorado): o erro de arredondamento não cresce com o nº de parcelas."""
+    soma = 0.0
+    compensacao = 0.0
+    for parcela in parcelas:
+        t = soma + parcela
+        if abs(soma) >= abs(parcela):
+            compensacao += (soma - t) + parcela
+        else:
+            compensacao += (parcela - t) + soma
+        soma = t
+    return soma + compensacao
+
+@lru_cache(maxsize=8)
+def _funcao_em_cache(funcao_str: str) -> Callable[[np.ndarray], np.ndarray]:
+    """Evita recompilar a mesma expressão a cada trecho enviado ao processo de trabalho."""
+    return ServicoMatematico.compilar_funcao(funcao_str)
+
+def _integrar_trecho(funcao_str: str, a: float, b: float, n: int, inicio: int, fim: int,
+                     estrategia: EstrategiaIntegracao) -> float:
+    """Integra os subintervalos [inicio, fim) da malha x_i = a + i*h gerando apenas esse trecho."""
+    h = (b - a) / n
+    x_vals = a + h * np.arange(inicio, fim + 1, dtype=float)
+    if fim == n:
+        x_vals[-1] = b
+    return float(estrategia.calcular(_funcao_em_cache(funcao_str)(x_vals), h))
+
+def _integrar_simbolicamente(funcao_str: str, limite_a: float, limite_b: float) -> Optional[float]:
+    """Executada no processo de trabalho (precisa ser de nível de módulo para o pickle)."""
+    x = sp.symbols('x')
+    try:
+        expressao = sp.sympify(funcao_str.replace('^', '**'))
+        resultado = sp.integrate(expressao, (x, limite_a, limite_b))
+        return float(resultado)
+    except Exception:
+        return None
+
+class CacheIntegrais:
+    """
+    Memoização persistente (JSON) das integrais analíticas, indexada pela
+    expressão normalizada pelo SymPy e pelos limites.
+    """
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._dados: Optional[Dict[str, List[Any]]] = None
+
+    @staticmethod
+    def gerar_chave(funcao_str: str, limite_a: float, limite_b: float) -> str:
+        expressao = sp.sympify(funcao_str.replace('^', '**'))
+        return f"{sp.srepr(expressao)}|{float(limite_a)!r}|{float(limite_b)!r}"
+
+    def _carregar(self) -> Dict[str, List[Any]]:
+        if self._dados is None:
+            try:
+                with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                    self._dados = json.load(arquivo)
+            except (OSError, ValueError):
+                self._dados = {}
+        return self._dados
+
+    def obter(self, chave: str) -> Optional[Tuple[float, str]]:
+        registro = self._carregar().get(chave)
+        return (registro[0], registro[1]) if registro else None
+
+    def salvar(self, chave: str, valor: float, origem: str):
+        self._carregar()[chave] = [valor, origem]
+        try:
+            os.makedirs(os.path.dirname(self.caminho) or '.', exist_ok=True)
+            with open(self.caminho, 'w', encoding='utf-8') as arquivo:
+                json.dump(self._dados, arquivo)
+        except OSError:
+            pass  # Cache é apenas otimização: falha de escrita não interrompe o cálculo
+
+class PoolAnalitico:
+    """
+    Processo único de trabalho para as integrais do SymPy, criado sob demanda
+    e reaproveitado entre tarefas. Interromper uma integral exige matar o
+    processo: `encerrar` faz terminate + join e o próximo `submeter` cria outro.
+    """
+    def __init__(self):
+        self._pool = None
+
+    def submeter(self, funcao: Callable, argumentos: Tuple):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=1)
+        return self._pool.apply_async(funcao, argumentos)
+
+    def encerrar(self):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            try:
+                pool.terminate()
+            finally:
+                pool.join()
+
+class TarefaIntegralAnalitica:
+    """
+    Integral analítica executada em um processo separado, com tempo limite.
+    Enquanto o SymPy trabalha, a interface segue livre para exibir os
+    resultados numéricos; `consultar` nunca bloqueia além do solicitado.
+    Se o tempo esgotar (ou o SymPy não encontrar primitiva), o processo é
+    encerrado e usa-se uma referência numérica adaptativa de alta precisão,
+    que não vai para o cache (só resultados analíticos são persistidos).
+    """
+    ORIGEM_ANALITICA = "analítica"
+    ORIGEM_NUMERICA = "referência numérica (quad)"
+
+    def __init__(self, funcao_str: str, limite_a: float, limite_b: float, tempo_limite: float,
+                 pool: PoolAnalitico, cache: Optional[CacheIntegrais] = None):
+        self.funcao_str = funcao_str
+        self.limite_a = limite_a
+        self.limite_b = limite_b
+        self.tempo_limite = tempo_limite
+        self.cache = cache
+        self.valor: Optional[float] = None
+        self.origem = ""
+        self.concluida = False
+        self._pool = pool
+        self._assincrono = None
+        self._inicio = time.monotonic()
+
+        self._chave = CacheIntegrais.gerar_chave(funcao_str, limite_a, limite_b)
+        registro = cache.obter(self._chave) if cache else None
+        if registro is not None:
+            self.valor, self.origem = registro
+            self.concluida = True
+            return
+
+        self._assincrono = pool.submeter(_integrar_simbolicamente, (funcao_str, limite_a, limite_b))
+
+    @property
+    def pendente(self) -> bool:
+        return not self.concluida
+
+    def consultar(self, bloquear: bool = False) -> Optional[float]:
+        """Retorna o valor se já disponível; com `bloquear`, espera até o tempo limite."""
+        if self.concluida:
+            return self.valor
+
+        restante = self.tempo_limite - (time.monotonic() - self._inicio)
+        if bloquear and restante > 0:
+            self._assincrono.wait(restante)
+
+        if self._assincrono.ready():
+            valor = self._assincrono.get()
+            if valor is not None:
+                self._concluir(valor, self.ORIGEM_ANALITICA)
+            else:
+                self._concluir(self._referencia_numerica(), self.ORIGEM_NUMERICA)
+        elif restante <= 0 or bloquear:
+            self.cancelar()
+            self._concluir(self._referencia_numerica(), self.ORIGEM_NUMERICA)
+
+        return self.valor
+
+    def cancelar(self):
+        """Encerra o processo do SymPy, se ainda estiver calculando esta integral."""
+        if self._assincrono is not None and not self.concluida and not self._assincrono.ready():
+            self._pool.encerrar()
+
+    def _concluir(self, valor: Optional[float], origem: str):
+        self.valor = valor
+        self.origem = origem if valor is not None else ""
+        self.concluida = True
+        if origem == self.ORIGEM_ANALITICA and valor is not None and self.cache is not None:
+            self.cache.salvar(self._chave, valor, origem)
+
+    def _referencia_numerica(self) -> Optional[float]:
+        try:
+            from scipy.integrate import quad
+            funcao = ServicoMatematico.compilar_funcao(self.funcao_str)
+            valor, _ = quad(lambda x: float(funcao(np.float64(x))), self.limite_a, self.limite_b,
+                            limit=500, epsabs=1e-13, epsrel=1e-12)
+            return float(valor)
+        except Exception:
+            return None
+
+class FuncaoMultivariada:
+    """
+    f(x1, ..., xd) compilada a partir da string. Pode ser enviada a outros
+    processos: no pickle viaja apenas o texto, recompilado no destino.
+    """
+    def __init__(self, funcao_str: str, variaveis: Sequence[str]):
+        self.funcao_str = funcao_str
+        self.variaveis = list(variaveis)
+        simbolos = sp.symbols(self.variaveis)
+        expressao = sp.sympify(funcao_str.replace('^', '**'))
+        desconhecidas = expressao.free_symbols - set(simbolos)
+        if desconhecidas:
+            raise ValueError(f"Variáveis não declaradas na função: {sorted(map(str, desconhecidas))}")
+        self._funcao = sp.lambdify(simbolos, expressao, 'numpy')
+
+    def __call__(self, *coordenadas: np.ndarray) -> np.ndarray:
+        return self._funcao(*coordenadas)
+
+    def __reduce__(self):
+        return (FuncaoMultivariada, (self.funcao_str, self.variaveis))
+
 class ServicoMatematico:
+    TEMPO_LIMITE_ANALITICO = 10.0  # segundos
+    CACHE_INTEGRAIS = CacheIntegrais(os.path.join(os.path.expanduser("~"), ".cache",
+                                                  "algoritmos_numericos", "integrais.json"))
+    POOL_ANALITICO = PoolAnalitico()
+
+    @staticmethod
+    def iniciar_integral_analitica(funcao_str: str, limite_a: float, limite_b: float,
+                                   tempo_limite: Optional[float] = None) -> TarefaIntegralAnalitica:
+        """Dispara a integral analítica em segundo plano (ou a recupera do cache)."""
+        limite = ServicoMatematico.TEMPO_LIMITE_ANALITICO if tempo_limite is None else tempo_limite
+        return TarefaIntegralAnalitica(funcao_str, limite_a, limite_b, limite,
+                                       ServicoMatematico.POOL_ANALITICO, ServicoMatematico.CACHE_INTEGRAIS)
+
+    @staticmethod
+    def encerrar_processos():
+        """Finaliza o processo de trabalho das integrais analíticas (terminate + join)."""
+        ServicoMatematico.POOL_ANALITICO.encerrar()
+
     @staticmethod
-    def integral_analitica(funcao_str: str, limite_a: float, limite_b: float) -> Optional[float]:
-        x = sp.symbols('x')
+    def integral_analitica(funcao_str: str, limite_a: float, limite_b: float,
+                           tempo_limite: Optional[float] = None) -> Optional[float]:
         try:
-            expressao = sp.sympify(funcao_str.replace('^', '**'))
-            resultado = sp.integrate(expressao, (x, limite_a, limite_b))
-            return float(resultado)
+            tarefa = ServicoMatematico.iniciar_integral_analitica(funcao_str, limite_a, limite_b, tempo_limite)
         except Exception:
             return None
+        return tarefa.consultar(bloquear=True)
 
     @staticmethod
-    def gerar_pontos_funcao(funcao_str: str, a: float, b: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
-        x_vals = np.linspace(a, b, n + 1)
+    def compilar_funcao(funcao_str: str) -> Callable[[np.ndarray], np.ndarray]:
+        """Converte a string em f(x) vetorizada que preserva a forma de x (inclusive para constantes)."""
         x_sym = sp.symbols('x')
         expressao = sp.sympify(funcao_str.replace('^', '**'))
         funcao_lambda = sp.lambdify(x_sym, expressao, 'numpy')
-        y_vals = funcao_lambda(x_vals)
-        
-        if np.ndim(y_vals) == 0:
-            y_vals = np.full_like(x_vals, y_vals)
-            
+
+        def funcao_vetorizada(x_vals: np.ndarray) -> np.ndarray:
+            y_vals = funcao_lambda(x_vals)
+            if np.shape(y_vals) != np.shape(x_vals):
+                y_vals = np.broadcast_to(y_vals, np.shape(x_vals)).astype(float)
+            return y_vals
+
+        return funcao_vetorizada
+
+    @staticmethod
+    def gerar_pontos_funcao(funcao_str: str, a: float, b: float, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        x_vals = np.linspace(a, b, n + 1)
+        y_vals = ServicoMatematico.compilar_funcao(funcao_str)(x_vals)
         return x_vals, y_vals
 
+    @staticmethod
+    def integrar_intervalos(funcao_str: str, limites_a: np.ndarray, limites_b: np.ndarray, n: int,
+                            estrategia: EstrategiaIntegracao) -> np.ndarray:
+        """
+        Integra a mesma função em vários intervalos [a_i, b_i] numa única avaliação vetorizada.
+        Monta uma malha (m, n+1) por broadcasting e integra ao longo do último eixo.
+        """
+        limites_a = np.atleast_1d(np.asarray(limites_a, dtype=float))
+        limites_b = np.atleast_1d(np.asarray(limites_b, dtype=float))
+        if limites_a.shape != limites_b.shape:
+            raise ValueError("Vetores de limites inferiores e superiores têm tamanhos diferentes.")
+
+        passos_h = (limites_b - limites_a) / n
+        fracoes = np.arange(n + 1) / n
+        x_malha = limites_a[..., np.newaxis] + (limites_b - limites_a)[..., np.newaxis] * fracoes
+        y_malha = ServicoMatematico.compilar_funcao(funcao_str)(x_malha)
+        return estrategia.calcular(y_malha, passos_h, axis=-1)
+
+    @staticmethod
+    def integrar_paralelo(funcao_str: str, a: float, b: float, n: int, estrategia: EstrategiaIntegracao,
+                          processos: Optional[int] = None, intervalos_por_bloco: int = 1 << 20) -> float:
+        """
+        Integração para n muito grande sem materializar os n+1 pontos: [a, b] é
+        dividido em trechos alinhados aos painéis da regra (pares no Simpson 1/3,
+        múltiplos de 3 no 3/8), cada trecho é gerado e integrado num processo do
+        pool e as somas parciais são combinadas com soma compensada.
+        """
+        painel = estrategia.intervalos_por_painel
+        if n % painel != 0:
+            raise ValueError("Requer n PAR" if painel == 2 else f"Requer n MÚLTIPLO DE {painel}")
+
+        tamanho = max(painel, (intervalos_por_bloco // painel) * painel)
+        inicios = list(range(0, n, tamanho))
+        fins = [min(inicio + tamanho, n) for inicio in inicios]
+        argumentos = ([funcao_str] * len(inicios), [a] * len(inicios), [b] * len(inicios),
+                      [n] * len(inicios), inicios, fins, [estrategia] * len(inicios))
+
+        if processos == 1 or len(inicios) == 1:
+            parciais = map(_integrar_trecho, *argumentos)
+            return soma_compensada(parciais)
+
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            return soma_compensada(executor.map(_integrar_trecho, *argumentos))
+
     @staticmethod
     def calcular_erro_percentual(valor_exato: Optional[float], valor_numerico: float) -> Optional[float]:
         if valor_exato is None or abs(valor_exato) < 1e-15:
@@ -96,6 +647,50 @@ class ServicoMatematico:
         return abs((valor_exato - valor_numerico) / valor_exato) * 100
 
 
+class IntegradorTabelado:
+    """
+    Integra dados tabelados (x, y) grandes demais para a memória, lendo-os em
+    blocos de tamanho fixo. Aceita caminho de arquivo (.csv/.txt, .npy ou
+    binário float64 bruto com 2 colunas) ou um array (N, 2) / np.memmap.
+
+    Entre blocos, os últimos pontos ainda não fechados em painéis completos são
+    carregados para o bloco seguinte, de modo que o resultado é idêntico ao da
+    integração do arquivo inteiro e a memória fica limitada ao tamanho do bloco.
+    """
+    def __init__(self, estrategia: EstrategiaIntegracao, tamanho_bloco: int = 1_000_000):
+        if tamanho_bloco < 2 * estrategia.intervalos_por_painel + 1:
+            raise ValueError("Tamanho de bloco pequeno demais para a estratégia escolhida.")
+        self.estrategia = estrategia
+        self.tamanho_bloco = tamanho_bloco
+
+    def integrar(self, fonte: Union[str, np.ndarray]) -> float:
+        painel = self.estrategia.intervalos_por_painel
+        total = 0.0
+        x_pendente = np.empty(0)
+        y_pendente = np.empty(0)
+
+        for x_bloco, y_bloco in self.ler_blocos(fonte, self.tamanho_bloco):
+            x_buf = np.concatenate([x_pendente, x_bloco])
+            y_buf = np.concatenate([y_pendente, y_bloco])
+
+            # Fecha apenas painéis completos e mantém uma cauda de painel+1 pontos,
+            # suficiente para tratar um número ímpar de intervalos no final
+            corte = ((len(x_buf) - 1 - painel) // painel) * painel
+            if corte > 0:
+                total += self.estrategia.calcular_nao_uniforme(x_buf[:corte + 1], y_buf[:corte + 1])
+                x_buf, y_buf = x_buf[corte:], y_buf[corte:]
+            x_pendente, y_pendente = x_buf, y_buf
+
+        if len(x_pendente) >= 2:
+            total += self.estrategia.calcular_nao_uniforme(x_pendente, y_pendente)
+        return total
+
+    @staticmethod
+    def ler_blocos(fonte: Union[str, np.ndarray], tamanho_bloco: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Gera blocos (x, y) de no máximo `tamanho_bloco` linhas."""
+        return ler_blocos_xy(fonte, tamanho_bloco)
+
+
 # 3. CAMADA DE APRESENTAÇÃO
 
 class InterfaceUsuario:
@@ -166,22 +761,87 @@ class InterfaceUsuario:
 
         print(divisor)
 
+    def exibir_resultados_multiplos(self, resultados: List[Dict[str, Any]]):
+        """Tabela das integrais múltiplas: valor, erro padrão (QMC) e nº de avaliações de f."""
+        self.exibir_cabecalho("INTEGRAL MÚLTIPLA")
+
+        w_metodo = 30
+        w_calc = 18
+        w_erro = 14
+        w_aval = 12
+
+        header = (f"| {'MÉTODO'.center(w_metodo)} | {'CALCULADO'.center(w_calc)} | "
+                  f"{'ERRO PADRÃO'.center(w_erro)} | {'AVALIAÇÕES'.center(w_aval)} |")
+        divisor = "-" * len(header)
+
+        print(divisor)
+        print(header)
+        print(divisor)
+
+        for linha in resultados:
+            nome = linha['metodo']
+            if linha['sucesso']:
+                res: ResultadoIntegracaoMultipla = linha['resultado']
+                str_val = f"{res.valor:.8f}" if abs(res.valor) < 1e6 else f"{res.valor:.4e}"
+                str_erro = f"{res.erro_padrao:.2e}" if res.erro_padrao is not None else "-"
+                print(f"| {nome:<{w_metodo}} | {str_val:>{w_calc}} | {str_erro:>{w_erro}} | {res.avaliacoes:>{w_aval}} |")
+            else:
+                msg_formatada = f"FALHA: {linha['mensagem']}"
+                largura_restante = w_calc + w_erro + w_aval + 6
+                print(f"| {nome:<{w_metodo}} | {msg_formatada:^{largura_restante}} |")
+
+        print(divisor)
+
 
 # 4. ORQUESTRADOR (Main com Loop)
 
+@dataclass
+class DadosEntrada:
+    """Dados prontos para integração: malha uniforme, malha irregular ou arquivo lido em blocos."""
+    valores_y: Optional[np.ndarray] = None
+    passo_h: Optional[float] = None            # None => espaçamento variável (usa valores_x)
+    valores_x: Optional[np.ndarray] = None
+    caminho_arquivo: Optional[str] = None
+    tarefa_analitica: Optional[TarefaIntegralAnalitica] = None
+    # Função avaliada sob demanda em blocos paralelos (n grande demais para a memória)
+    funcao_str: Optional[str] = None
+    limites: Tuple[float, float] = (0.0, 0.0)
+    num_intervalos: int = 0
+
+    def descrever(self) -> str:
+        if self.caminho_arquivo:
+            return f"Arquivo: {self.caminho_arquivo} (leitura em blocos)"
+        if self.funcao_str is not None:
+            return f"n = {self.num_intervalos} | h = {self.passo_h:.6e} | avaliação paralela em blocos"
+        if self.passo_h is None:
+            return f"n = {len(self.valores_y)-1} | h variável"
+        return f"n = {len(self.valores_y)-1} | h = {self.passo_h:.6f}"
+
 class AplicacaoCalculadora:
+    # Acima deste n a função não é materializada: cada método integra em blocos paralelos
+    LIMITE_PONTOS_MEMORIA = 10 ** 7
+
     def __init__(self):
         self.ui = InterfaceUsuario()
         self.servico = ServicoMatematico()
         self.estrategias = [MetodoTrapezio(), MetodoSimpson13(), MetodoSimpson38()]
+        self.estrategias_multiplas = [
+            ProdutoTensorialNewtonCotes(MetodoTrapezio()),
+            ProdutoTensorialNewtonCotes(MetodoSimpson13()),
+            ProdutoTensorialGauss(),
+            MonteCarloQuaseAleatorio('sobol'),
+            MonteCarloQuaseAleatorio('halton'),
+        ]
 
-    def _obter_dados_entrada(self) -> Tuple[np.ndarray, float, Optional[float]]:
-        """Gerencia o fluxo de obter dados (seja por função ou tabela)."""
-        print("\n1. Entrada por FUNÇÃO")
-        print("2. Entrada por TABELA")
-        print("0. Sair do Programa")
-        
+    def _obter_dados_entrada(self) -> DadosEntrada:
+        """Gerencia o fluxo de obter dados (seja por função, tabela ou arquivo)."""
         while True:
+            print("\n1. Entrada por FUNÇÃO")
+            print("2. Entrada por TABELA")
+            print("3. Entrada por ARQUIVO (CSV/TXT, .npy ou binário)")
+            print("4. Integral MÚLTIPLA (dupla, tripla, ...)")
+            print("0. Sair do Programa")
+
             opcao = input("Escolha a entrada: ").strip()
             
             if opcao == '0':
@@ -190,10 +850,14 @@ class AplicacaoCalculadora:
                 return self._fluxo_entrada_funcao()
             elif opcao == '2':
                 return self._fluxo_entrada_tabela()
+            elif opcao == '3':
+                return self._fluxo_entrada_arquivo()
+            elif opcao == '4':
+                self._fluxo_integral_multipla()
             else:
                 print("Opção inválida.")
 
-    def _fluxo_entrada_funcao(self) -> Tuple[np.ndarray, float, Optional[float]]:
+    def _fluxo_entrada_funcao(self) -> DadosEntrada:
         funcao_str = input("\nDigite a função (ex: x**2): ")
         a = self.ui.ler_float("Limite inferior (a): ")
         b = self.ui.ler_float("Limite superior (b): ")
@@ -224,11 +888,16 @@ class AplicacaoCalculadora:
             n = 10
             h = (b - a) / n
 
+        tarefa_analitica = self.servico.iniciar_integral_analitica(funcao_str, a, b)
+        if n > self.LIMITE_PONTOS_MEMORIA:
+            self.servico.compilar_funcao(funcao_str)  # Valida a expressão antes de seguir
+            return DadosEntrada(passo_h=h, tarefa_analitica=tarefa_analitica,
+                                funcao_str=funcao_str, limites=(a, b), num_intervalos=n)
+
         x_vals, y_vals = self.servico.gerar_pontos_funcao(funcao_str, a, b, n)
-        valor_analitico = self.servico.integral_analitica(funcao_str, a, b)
-        return y_vals, h, valor_analitico
+        return DadosEntrada(valores_y=y_vals, passo_h=h, tarefa_analitica=tarefa_analitica)
 
-    def _fluxo_entrada_tabela(self) -> Tuple[np.ndarray, float, Optional[float]]:
+    def _fluxo_entrada_tabela(self) -> DadosEntrada:
         print("\nDigite os valores separados por espaço.")
         str_x = input("Valores de X: ").replace(',', ' ').split()
         str_y = input("Valores de Y: ").replace(',', ' ').split()
@@ -239,24 +908,83 @@ class AplicacaoCalculadora:
         if len(x_vals) != len(y_vals):
             raise ValueError("Vetores X e Y têm tamanhos diferentes.")
 
-        h = x_vals[1] - x_vals[0]
-        return y_vals, h, None
+        # Só trata como malha uniforme se TODOS os espaçamentos coincidirem
+        espacamentos = np.diff(x_vals)
+        h = espacamentos[0]
+        if np.allclose(espacamentos, h, rtol=1e-9, atol=0.0):
+            return DadosEntrada(valores_y=y_vals, passo_h=h)
+
+        print("[Aviso] Espaçamento irregular em X: usando fórmulas para h variável.")
+        return DadosEntrada(valores_y=y_vals, valores_x=x_vals)
+
+    def _fluxo_entrada_arquivo(self) -> DadosEntrada:
+        caminho = input("\nCaminho do arquivo (colunas X e Y): ").strip().strip('"')
+        if not os.path.isfile(caminho):
+            raise ValueError(f"Arquivo não encontrado: '{caminho}'")
+        return DadosEntrada(caminho_arquivo=caminho)
+
+    def _fluxo_integral_multipla(self):
+        """Integral de f sobre uma caixa: regras tensoriais (d baixo) e Quase-Monte Carlo."""
+        funcao_str = input("\nDigite a função (ex: x*y + z**2): ")
+        variaveis = input("Variáveis de integração (ex: x y z): ").replace(',', ' ').split()
+        funcao = FuncaoMultivariada(funcao_str, variaveis)
+
+        limites = []
+        for nome in variaveis:
+            a = self.ui.ler_float(f"Limite inferior de {nome}: ")
+            b = self.ui.ler_float(f"Limite superior de {nome}: ")
+            limites.append((a, b))
+
+        n_grade = self.ui.ler_inteiro("Intervalos por dimensão nas regras tensoriais (n, múltiplo de 2): ")
+        n_qmc = self.ui.ler_inteiro("Pontos por réplica no Quase-Monte Carlo (ex: 65536): ")
+
+        relatorio = []
+        for metodo in self.estrategias_multiplas:
+            linha = {'metodo': metodo.nome, 'sucesso': False, 'resultado': None, 'mensagem': ''}
+            try:
+                n = n_qmc if isinstance(metodo, MonteCarloQuaseAleatorio) else n_grade
+                linha['resultado'] = metodo.calcular(funcao, limites, n)
+                linha['sucesso'] = True
+            except Exception as e:
+                linha['mensagem'] = str(e)
+            relatorio.append(linha)
+
+        self.ui.exibir_resultados_multiplos(relatorio)
+
+    def _integrar(self, metodo: EstrategiaIntegracao, dados: DadosEntrada) -> float:
+        if dados.caminho_arquivo:
+            return IntegradorTabelado(metodo).integrar(dados.caminho_arquivo)
+        if dados.funcao_str is not None:
+            a, b = dados.limites
+            return self.servico.integrar_paralelo(dados.funcao_str, a, b, dados.num_intervalos, metodo)
+        if dados.passo_h is None:
+            return metodo.calcular_nao_uniforme(dados.valores_x, dados.valores_y)
+        return metodo.calcular(dados.valores_y, dados.passo_h)
 
     def executar(self):
         self.ui.exibir_cabecalho("CALCULADORA DE INTEGRAIS (CLEAN ARCH)")
+        try:
+            self._loop_principal()
+        finally:
+            # Também na saída por sys.exit ou por exceção: não deixa o processo do SymPy órfão
+            self.servico.encerrar_processos()
 
-        # Loop Principal do Programa
+    def _loop_principal(self):
         while True:
             try:
                 # 1. Obtenção dos Dados (Carrega apenas uma vez)
-                y_vals, h, valor_analitico = self._obter_dados_entrada()
+                dados = self._obter_dados_entrada()
+                tarefa = dados.tarefa_analitica
 
                 # 2. Loop de Métodos (Reutiliza os mesmos dados)
                 while True:
                     self.ui.exibir_cabecalho("SELEÇÃO DE MÉTODO")
-                    print(f"Dados atuais: n = {len(y_vals)-1} | h = {h:.6f}")
-                    if valor_analitico:
-                        print(f"Analítico: {valor_analitico:.6f}")
+                    print(f"Dados atuais: {dados.descrever()}")
+                    valor_analitico = tarefa.consultar() if tarefa else None
+                    if valor_analitico is not None:
+                        print(f"Analítico: {valor_analitico:.6f} [{tarefa.origem}]")
+                    elif tarefa and tarefa.pendente:
+                        print(f"Analítico: em cálculo (limite de {tarefa.tempo_limite:.0f}s)...")
                     
                     print("\n--- Métodos ---")
                     for i, estrategia in enumerate(self.estrategias):
@@ -270,9 +998,13 @@ class AplicacaoCalculadora:
 
                     if escolha == 0:
                         print("Encerrando...")
+                        if tarefa:
+                            tarefa.cancelar()
                         sys.exit(0)
                     
                     if escolha == 5:
+                        if tarefa:
+                            tarefa.cancelar()
                         break # Sai do loop de métodos e volta para pedir dados
 
                     metodos_para_executar = []
@@ -284,12 +1016,13 @@ class AplicacaoCalculadora:
                         print("Opção inválida.")
                         continue # Volta para o menu de métodos
 
-                    # Processamento
+                    # Processamento (a integral analítica segue em segundo plano)
+                    valor_analitico = tarefa.consultar() if tarefa else None
                     relatorio = []
                     for metodo in metodos_para_executar:
                         resultado_dict = {'metodo': metodo.nome, 'sucesso': False, 'valor': 0.0, 'erro': None, 'mensagem': ''}
                         try:
-                            res_numerico = metodo.calcular(y_vals, h)
+                            res_numerico = self._integrar(metodo, dados)
                             erro_pct = self.servico.calcular_erro_percentual(valor_analitico, res_numerico)
                             
                             resultado_dict['sucesso'] = True
@@ -303,6 +1036,10 @@ class AplicacaoCalculadora:
                         relatorio.append(resultado_dict)
 
                     self.ui.exibir_resultados(relatorio, valor_analitico)
+                    if tarefa and tarefa.concluida and tarefa.origem:
+                        print(f"Coluna ANALÍTICO: {tarefa.origem}")
+                    elif tarefa and tarefa.pendente:
+                        print("Integral analítica ainda em cálculo; o erro % aparecerá na próxima execução.")
                     input("\nPressione ENTER para continuar...")
 
             except Exception as e:
@@ -1,5 +1,10 @@
 import sys
-from typing import List
+import math
+import time
+import decimal
+import numpy as np
+from decimal import Decimal
+from typing import Dict, List, Tuple
 
 # Constantes Globais
 # Definem as regras de negócio em um único lugar
@@ -7,22 +12,47 @@ ALFABETO_NUMERICO = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 BASE_MINIMA = 2
 BASE_MAXIMA = 36
 
+# Acima destes tamanhos a conversão usa divisão e conquista em vez do laço dígito a dígito
+LIMITE_DIGITOS_DIRETO = 1000
+LIMITE_BITS_DIRETO = 4096
+
+# Bases que são potências de dois: bits por dígito
+BITS_POR_DIGITO = {2: 1, 4: 2, 8: 3, 16: 4, 32: 5}
+
 def converter_para_decimal(numero_str: str, base_origem: int) -> int:
     """
     Converte uma string numérica de uma base específica para inteiro decimal (Base 10).
     Lança ValueError se o número conter caracteres inválidos para a base.
     """
+    # Em bases potência de dois o próprio int() já é linear
+    if len(numero_str) > LIMITE_DIGITOS_DIRETO and base_origem not in BITS_POR_DIGITO:
+        negativo, digitos = _separar_sinal(numero_str, base_origem)
+        valor = _decimal_para_inteiro(_texto_para_decimal(digitos, base_origem))
+        return -valor if negativo else valor
     try:
         return int(numero_str, base_origem)
     except ValueError:
         raise ValueError(
-            f"O número '{numero_str}' contém caracteres inválidos para a base {base_origem}."
+            f"O número '{_resumo(numero_str)}' contém caracteres inválidos para a base {base_origem}."
         )
 
 def converter_decimal_para_base(numero_decimal: int, base_destino: int) -> str:
     """
     Converte um inteiro decimal (Base 10) para uma string na base de destino.
     """
+    if numero_decimal < 0:
+        return "-" + converter_decimal_para_base(-numero_decimal, base_destino)
+    if numero_decimal.bit_length() > LIMITE_BITS_DIRETO and base_destino in BITS_POR_DIGITO:
+        # Os bytes do int já são dígitos de 8 bits: basta reagrupá-los
+        bits = BITS_POR_DIGITO[base_destino]
+        num_digitos = -(-numero_decimal.bit_length() // bits)
+        return _valor_para_digitos(numero_decimal, base_destino, num_digitos).decode("ascii")
+    if numero_decimal.bit_length() > LIMITE_BITS_DIRETO:
+        return _decimal_para_texto(_inteiro_para_decimal(numero_decimal), base_destino)
+    return _converter_por_divisoes_sucessivas(numero_decimal, base_destino)
+
+def _converter_por_divisoes_sucessivas(numero_decimal: int, base_destino: int) -> str:
+    """Laço clássico, um dígito por divisão: O(d²), usado só para números pequenos."""
     if numero_decimal == 0:
         return "0"
 
@@ -41,13 +71,329 @@ def converter_decimal_para_base(numero_decimal: int, base_destino: int) -> str:
 def realizar_conversao_completa(numero_str: str, base_origem: int, base_destino: int) -> str:
     """
     Orquestra a conversão completa: Base A -> Decimal -> Base B.
+    Números grandes não passam por int: o valor intermediário fica num Decimal,
+    cuja multiplicação (NTT da libmpdec) é muito mais rápida que a do int.
+    Entre potências de dois (2, 4, 8, 16, 32) os bits são só reagrupados.
     """
+    if base_origem in BITS_POR_DIGITO and base_destino in BITS_POR_DIGITO:
+        return converter_potencias_de_2(numero_str, base_origem, base_destino)
+    if len(numero_str) > LIMITE_DIGITOS_DIRETO:
+        negativo, digitos = _separar_sinal(numero_str, base_origem)
+        texto = _decimal_para_texto(_texto_para_decimal(digitos, base_origem), base_destino)
+        return "-" + texto if negativo and texto != "0" else texto
+
     # Passo 1: Normalização (Base N -> Base 10)
     valor_decimal = converter_para_decimal(numero_str, base_origem)
     
     # Passo 2: Transformação (Base 10 -> Base M)
     return converter_decimal_para_base(valor_decimal, base_destino)
 
+# Inteiros grandes: divisão e conquista
+#
+# O laço de divisões sucessivas faz d divisões de um número de d dígitos: O(d²).
+# Aqui o número é dividido ao meio por base^(f·2^k) repetidamente até sobrarem
+# folhas de f dígitos, convertidas diretamente; o caminho inverso junta as folhas
+# duas a duas com alto·P + baixo. As potências ficam numa tabela em cache, e o
+# custo total fica O(M(d)·log d), onde M é o custo da multiplicação. Os valores
+# intermediários são Decimal em vez de int porque a libmpdec multiplica e divide
+# números enormes em tempo quase linear, enquanto o int do CPython é Karatsuba
+# e sua divisão é quadrática.
+
+# Precisão máxima: somas, produtos e divmod entre inteiros nunca arredondam
+_CONTEXTO_EXATO = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+DIGITOS_FOLHA_TEXTO = 256          # dígitos por folha ao ler texto
+BITS_FOLHA = 4096                  # bits por folha na ponte int <-> Decimal
+_ALFABETO_BYTES = np.frombuffer(ALFABETO_NUMERICO.encode("ascii"), dtype=np.uint8)
+
+DIGITOS_BARRETT = 2000             # divisores acima disso usam o recíproco em cache
+
+_cache_potencias: Dict[Tuple[int, int], List[Decimal]] = {}
+_cache_reciprocos: Dict[Tuple[int, int, int], Tuple[Decimal, int]] = {}
+
+def _potencias(base: int, tamanho_folha: int, nivel: int) -> List[Decimal]:
+    """Tabela [base^f, base^(2f), base^(4f), ...] com pelo menos nivel+1 entradas, estendida por quadrados."""
+    tabela = _cache_potencias.setdefault((base, tamanho_folha), [])
+    with decimal.localcontext(_CONTEXTO_EXATO):
+        if not tabela:
+            tabela.append(Decimal(base) ** tamanho_folha)
+        while len(tabela) <= nivel:
+            tabela.append(tabela[-1] * tabela[-1])
+    return tabela
+
+def _reciproco(base: int, tamanho_folha: int, nivel: int) -> Tuple[Decimal, int]:
+    """(floor(10^(2n) / P), n) para P = base^(f·2^nivel) com n dígitos, calculado uma vez por potência."""
+    chave = (base, tamanho_folha, nivel)
+    if chave not in _cache_reciprocos:
+        potencia = _potencias(base, tamanho_folha, nivel)[nivel]
+        n = potencia.adjusted() + 1
+        with decimal.localcontext(_CONTEXTO_EXATO):
+            _cache_reciprocos[chave] = (Decimal(1).scaleb(2 * n) // potencia, n)
+    return _cache_reciprocos[chave]
+
+def _divmod_barrett(valor: Decimal, potencia: Decimal, reciproco: Decimal, n: int) -> Tuple[Decimal, Decimal]:
+    """
+    divmod(valor, potencia) para valor < potencia² com duas multiplicações
+    (redução de Barrett): a estimativa do quociente erra no máximo por 2 para menos.
+    Deve ser chamada dentro do contexto exato.
+    """
+    # Só os n+1 dígitos mais altos de `valor` influem na estimativa
+    alto = valor.scaleb(1 - n).to_integral_value(rounding=decimal.ROUND_FLOOR)
+    quociente = (alto * reciproco).scaleb(-n - 1).to_integral_value(rounding=decimal.ROUND_FLOOR)
+    resto = valor - quociente * potencia
+    while resto >= potencia:
+        quociente += 1
+        resto -= potencia
+    return quociente, resto
+
+def _niveis(num_folhas: int) -> int:
+    """Menor m com 2^m >= num_folhas."""
+    return max(num_folhas - 1, 0).bit_length()
+
+def _combinar_folhas(folhas: List[Decimal], potencias: List[Decimal]) -> Decimal:
+    """Junta folhas (a mais significativa primeiro) duas a duas com alto·P[k] + baixo."""
+    nivel = 0
+    with decimal.localcontext(_CONTEXTO_EXATO):
+        while len(folhas) > 1:
+            if len(folhas) % 2:
+                folhas.insert(0, Decimal(0))  # zero à esquerda mantém as folhas alinhadas pela direita
+            potencia = potencias[nivel]
+            folhas = [alto * potencia + baixo for alto, baixo in zip(folhas[::2], folhas[1::2])]
+            nivel += 1
+    return folhas[0]
+
+def _dividir_em_folhas(valor: Decimal, base: int, tamanho_folha: int, niveis: int) -> List[Decimal]:
+    """
+    Divide `valor` (menor que base^(f·2^niveis)) em 2^niveis folhas menores que
+    base^f, a mais significativa primeiro. Cada quociente/resto representa
+    exatamente metade dos dígitos do bloco, então os zeros à esquerda de cada
+    metade aparecem sozinhos como folhas nulas.
+    """
+    potencias = _potencias(base, tamanho_folha, niveis)
+    blocos = [valor]
+    with decimal.localcontext(_CONTEXTO_EXATO):
+        for nivel in reversed(range(niveis)):
+            potencia = potencias[nivel]
+            novos = []
+            if potencia.adjusted() >= DIGITOS_BARRETT:
+                reciproco, n = _reciproco(base, tamanho_folha, nivel)
+                for bloco in blocos:
+                    novos.extend(_divmod_barrett(bloco, potencia, reciproco, n))
+            else:
+                for bloco in blocos:
+                    novos.extend(divmod(bloco, potencia))
+            blocos = novos
+    return blocos
+
+def _resumo(numero_str: str, limite: int = 40) -> str:
+    """Trecho inicial do número para mensagens de erro, sem despejar milhões de dígitos."""
+    return numero_str if len(numero_str) <= limite else numero_str[:limite] + "..."
+
+def _separar_sinal(numero_str: str, base: int) -> Tuple[bool, str]:
+    """Remove espaços e sinal e valida os dígitos (sem chamar int no texto inteiro)."""
+    texto = numero_str.strip()
+    negativo = texto[:1] == "-"
+    if texto[:1] in ("+", "-"):
+        texto = texto[1:]
+    validos = ALFABETO_NUMERICO[:base] + ALFABETO_NUMERICO[10:base].lower()
+    if not texto or texto.translate(str.maketrans("", "", validos)):
+        raise ValueError(
+            f"O número '{_resumo(numero_str)}' contém caracteres inválidos para a base {base}."
+        )
+    return negativo, texto
+
+def _texto_para_decimal(digitos: str, base: int) -> Decimal:
+    """Texto já validado na `base` -> Decimal, juntando folhas de DIGITOS_FOLHA_TEXTO dígitos."""
+    if base == 10:
+        return Decimal(digitos)
+    f = DIGITOS_FOLHA_TEXTO
+    excesso = len(digitos) % f
+    if excesso:
+        digitos = "0" * (f - excesso) + digitos
+    folhas = [Decimal(int(digitos[i:i + f], base)) for i in range(0, len(digitos), f)]
+    return _combinar_folhas(folhas, _potencias(base, f, _niveis(len(folhas))))
+
+def _inteiro_para_decimal(numero: int) -> Decimal:
+    """int -> Decimal por folhas de BITS_FOLHA bits, extraídas dos bytes do número em tempo linear."""
+    bytes_folha = BITS_FOLHA // 8
+    num_folhas = max(1, -(-numero.bit_length() // BITS_FOLHA))
+    dados = numero.to_bytes(num_folhas * bytes_folha, "big")
+    folhas = [Decimal(int.from_bytes(dados[i:i + bytes_folha], "big"))
+              for i in range(0, len(dados), bytes_folha)]
+    return _combinar_folhas(folhas, _potencias(2, BITS_FOLHA, _niveis(num_folhas)))
+
+def _decimal_para_inteiro(valor: Decimal) -> int:
+    """Decimal -> int: divide por 2^(BITS_FOLHA·2^k) e concatena os bytes das folhas."""
+    bits = math.ceil((valor.adjusted() + 1) * math.log2(10)) + 1
+    niveis = _niveis(-(-bits // BITS_FOLHA))
+    folhas = _dividir_em_folhas(valor, 2, BITS_FOLHA, niveis)
+    bytes_folha = BITS_FOLHA // 8
+    return int.from_bytes(b"".join(int(folha).to_bytes(bytes_folha, "big") for folha in folhas), "big")
+
+def _digitos_por_palavra(base: int) -> int:
+    """Maior potência de dois f com base^f < 2^63: cada folha cabe num int64 do NumPy."""
+    f = 1
+    while base ** (2 * f) < 2**63:
+        f *= 2
+    return f
+
+def _decimal_para_texto(valor: Decimal, base: int) -> str:
+    """Decimal -> texto na `base`: folhas do tamanho de uma palavra, dígitos extraídos em lote pelo NumPy."""
+    if base == 10:
+        return str(valor)
+    f = _digitos_por_palavra(base)
+    num_digitos = math.ceil((valor.adjusted() + 1) / math.log10(base)) + 1
+    niveis = _niveis(-(-num_digitos // f))
+    folhas = _dividir_em_folhas(valor, base, f, niveis)
+
+    palavras = np.array([int(folha) for folha in folhas], dtype=np.int64)
+    digitos = np.empty((len(palavras), f), dtype=np.int64)
+    for coluna in reversed(range(f)):
+        palavras, digitos[:, coluna] = np.divmod(palavras, base)
+    texto = _ALFABETO_BYTES[digitos].tobytes().decode("ascii").lstrip("0")
+    return texto or "0"
+
+# Bases potências de dois: reagrupamento de bits
+#
+# Entre bases 2^a e 2^b não há aritmética: cada mmc(a, b) bits formam mmc/a
+# dígitos de origem e exatamente mmc/b de destino, então um trecho alinhado a
+# esses grupos se converte sem depender do resto do número. O texto é tratado
+# em blocos de bytes: a validação é um bytes.translate com a tabela de dígitos
+# da base, e cada bloco passa por int()/format(), que o CPython executa em
+# tempo linear nessas bases (4 e 32, sem formato nativo, são reagrupadas a
+# partir dos bytes do bloco com NumPy). Como os grupos se alinham pela direita,
+# o total de dígitos precisa ser conhecido antes do primeiro bloco; no arquivo,
+# isso custa uma passada só de contagem, e a memória fica limitada ao bloco.
+
+TAMANHO_BLOCO = 1 << 22            # dígitos de entrada processados por vez
+ESPACOS_ASCII = b" \t\r\n\v\f"
+_FORMATOS_NATIVOS = {2: "b", 8: "o", 16: "X"}
+# Dígitos aceitos em cada base (maiúsculas e minúsculas), para bytes.translate(None, ...)
+_DIGITOS_VALIDOS = {base: (ALFABETO_NUMERICO[:base] + ALFABETO_NUMERICO[10:base].lower()).encode("ascii")
+                    for base in range(BASE_MINIMA, BASE_MAXIMA + 1)}
+# Valor do dígito -> caractere ASCII
+_TABELA_ASCII = ALFABETO_NUMERICO.encode("ascii").ljust(256, b"?")
+
+def _bytes_para_digitos(dados: bytes, bits_destino: int, num_digitos: int) -> bytes:
+    """
+    Os últimos `num_digitos` dígitos de `bits_destino` bits do inteiro big-endian
+    em `dados`. Cada grupo de mmc(8, b) bits vira uma palavra de 64 bits, lida
+    depois com deslocamentos.
+    """
+    grupo = math.lcm(8, bits_destino)
+    bytes_grupo, digitos_grupo = grupo // 8, grupo // bits_destino
+    dados = dados.rjust(-(-len(dados) // bytes_grupo) * bytes_grupo, b"\0")
+    colunas = np.frombuffer(dados, dtype=np.uint8).reshape(-1, bytes_grupo)
+
+    palavras = colunas[:, 0].astype(np.uint64)
+    for j in range(1, bytes_grupo):
+        palavras <<= np.uint64(8)
+        palavras |= colunas[:, j]
+    digitos = np.empty((len(palavras), digitos_grupo), dtype=np.uint8)
+    mascara = np.uint64((1 << bits_destino) - 1)
+    for k in range(digitos_grupo):
+        digitos[:, k] = (palavras >> np.uint64(bits_destino * (digitos_grupo - 1 - k))) & mascara
+    return digitos.ravel()[-num_digitos:].tobytes().translate(_TABELA_ASCII)
+
+def _valor_para_digitos(valor: int, base: int, num_digitos: int) -> bytes:
+    """`valor` com exatamente `num_digitos` dígitos na base potência de dois (zeros à esquerda)."""
+    if base in _FORMATOS_NATIVOS:
+        return format(valor, f"0{num_digitos}{_FORMATOS_NATIVOS[base]}").encode("ascii")
+    bits = BITS_POR_DIGITO[base]
+    return _bytes_para_digitos(valor.to_bytes((num_digitos * bits + 7) // 8, "big"), bits, num_digitos)
+
+class ReagrupadorDeBits:
+    """
+    Converte, bloco a bloco, texto já validado entre duas bases potência de dois.
+    Os zeros que completam o grupo mais significativo entram antes do primeiro
+    bloco, e os zeros à esquerda do resultado são descartados.
+    """
+    def __init__(self, base_origem: int, base_destino: int, num_digitos: int):
+        self.base_origem = base_origem
+        self.base_destino = base_destino
+        grupo = math.lcm(BITS_POR_DIGITO[base_origem], BITS_POR_DIGITO[base_destino])
+        self.digitos_origem = grupo // BITS_POR_DIGITO[base_origem]
+        self.digitos_destino = grupo // BITS_POR_DIGITO[base_destino]
+        self._pendentes = b"0" * (-num_digitos % self.digitos_origem)
+        self.apenas_zeros = True
+
+    def converter(self, bloco: bytes) -> bytes:
+        """Dígitos ASCII na origem -> dígitos ASCII na destino dos grupos já completos."""
+        bloco = self._pendentes + bloco
+        completos = len(bloco) - len(bloco) % self.digitos_origem
+        self._pendentes = bloco[completos:]
+        if not completos:
+            return b""
+        num_saida = completos // self.digitos_origem * self.digitos_destino
+        saida = _valor_para_digitos(int(bloco[:completos], self.base_origem), self.base_destino, num_saida)
+        if self.apenas_zeros:
+            saida = saida.lstrip(b"0")
+            self.apenas_zeros = not saida
+        return saida
+
+def _verificar_potencias_de_2(*bases: int):
+    for base in bases:
+        if base not in BITS_POR_DIGITO:
+            raise ValueError(f"A base {base} não é potência de dois (2, 4, 8, 16 ou 32).")
+
+def _validar_bloco(bloco: bytes, base: int, origem: str):
+    """int() aceitaria '_', sinal e espaços no meio do bloco; aqui só dígitos da base passam."""
+    if bloco.translate(None, _DIGITOS_VALIDOS[base]):
+        raise ValueError(f"O número '{_resumo(origem)}' contém caracteres inválidos para a base {base}.")
+
+def converter_potencias_de_2(numero_str: str, base_origem: int, base_destino: int) -> str:
+    """
+    Converte entre bases potência de dois por reagrupamento de bits, em tempo linear.
+    Aceita sinal e espaços nas pontas, como int().
+    """
+    _verificar_potencias_de_2(base_origem, base_destino)
+    texto = numero_str.strip()
+    negativo = texto[:1] == "-"
+    if texto[:1] in ("+", "-"):
+        texto = texto[1:]
+    dados = texto.encode("ascii", errors="replace")  # '?' fora do ASCII é rejeitado como dígito
+    _validar_bloco(dados, base_origem, numero_str)
+    if not dados:
+        raise ValueError(f"O número '{numero_str}' contém caracteres inválidos para a base {base_origem}.")
+
+    reagrupador = ReagrupadorDeBits(base_origem, base_destino, len(dados))
+    partes = [reagrupador.converter(dados[i:i + TAMANHO_BLOCO]) for i in range(0, len(dados), TAMANHO_BLOCO)]
+    resultado = b"".join(partes).decode("ascii") or "0"
+    return "-" + resultado if negativo and resultado != "0" else resultado
+
+def _blocos_de_digitos(caminho: str, tamanho_bloco: int):
+    """Lê o arquivo em blocos de bytes, já sem espaços e quebras de linha."""
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b""):
+            yield bloco.translate(None, ESPACOS_ASCII)
+
+def converter_arquivo_potencias_de_2(caminho_entrada: str, base_origem: int, caminho_saida: str,
+                                     base_destino: int, tamanho_bloco: int = TAMANHO_BLOCO) -> int:
+    """
+    Converte um arquivo de dígitos (espaços e quebras de linha ignorados) entre
+    bases potência de dois com memória limitada ao bloco. A primeira passada
+    valida e conta os dígitos; a segunda converte e grava. Retorna quantos
+    dígitos foram gravados.
+    """
+    _verificar_potencias_de_2(base_origem, base_destino)
+    num_digitos = 0
+    for bloco in _blocos_de_digitos(caminho_entrada, tamanho_bloco):
+        _validar_bloco(bloco, base_origem, caminho_entrada)
+        num_digitos += len(bloco)
+    if num_digitos == 0:
+        raise ValueError(f"O arquivo '{caminho_entrada}' não contém dígitos.")
+
+    reagrupador = ReagrupadorDeBits(base_origem, base_destino, num_digitos)
+    gravados = 0
+    with open(caminho_saida, "wb") as saida:
+        for bloco in _blocos_de_digitos(caminho_entrada, tamanho_bloco):
+            digitos = reagrupador.converter(bloco)
+            saida.write(digitos)
+            gravados += len(digitos)
+        if reagrupador.apenas_zeros:
+            saida.write(b"0")
+            gravados = 1
+    return gravados
+
 # Camada de Interface do Usuário
 
 def solicitar_inteiro_validado(mensagem: str, min_val: int, max_val: int) -> int:
@@ -101,7 +447,60 @@ def executar_programa():
     except Exception as erro:
         print(f"\nErro Inesperado: {erro}")
 
+# Benchmark
+
+def _digitos_aleatorios(num_digitos: int, base: int, gerador: np.random.Generator) -> str:
+    indices = gerador.integers(0, base, num_digitos)
+    indices[0] = gerador.integers(1, base)  # sem zero à esquerda, para a volta bater com a ida
+    return _ALFABETO_BYTES[indices].tobytes().decode("ascii")
+
+def executar_benchmark(expoente_maximo: int = 7, bases=range(BASE_MINIMA, BASE_MAXIMA + 1)):
+    """
+    Ida e volta texto -> int -> texto com 10^3 até 10^expoente_maximo dígitos em
+    cada base. O laço dígito a dígito anterior só é medido até 10^4 dígitos:
+    acima disso ele leva minutos. A primeira conversão em cada base inclui o
+    preenchimento da tabela de potências.
+    """
+    gerador = np.random.default_rng(0)
+    print(f"{'Dígitos':>9} | {'Base':>4} | {'Texto->int (s)':>14} | {'Int->texto (s)':>14} | {'Anterior (s)':>12}")
+    print("-" * 66)
+    for expoente in range(3, expoente_maximo + 1):
+        num_digitos = 10 ** expoente
+        for base in bases:
+            texto = _digitos_aleatorios(num_digitos, base, gerador)
+            inicio = time.perf_counter()
+            valor = converter_para_decimal(texto, base)
+            tempo_ida = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            volta = converter_decimal_para_base(valor, base)
+            tempo_volta = time.perf_counter() - inicio
+            if volta != texto:
+                raise RuntimeError(f"Ida e volta divergiu na base {base} com {num_digitos} dígitos.")
+
+            anterior = "-"
+            if num_digitos <= 10**4:
+                inicio = time.perf_counter()
+                _converter_por_divisoes_sucessivas(valor, base)
+                anterior = f"{time.perf_counter() - inicio:.3f}"
+            print(f"{num_digitos:>9} | {base:>4} | {tempo_ida:>14.3f} | {tempo_volta:>14.3f} | {anterior:>12}")
+
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv[1:]:
+        # --benchmark [expoente]: vai de 10^3 até 10^expoente dígitos (padrão 7)
+        argumentos = sys.argv[sys.argv.index("--benchmark") + 1:]
+        executar_benchmark(int(argumentos[0]) if argumentos else 7)
+        sys.exit(0)
+    if "--arquivo" in sys.argv[1:]:
+        # --arquivo ENTRADA BASE_ORIGEM SAIDA BASE_DESTINO: só entre potências de dois, em fluxo
+        entrada, origem, saida, destino = sys.argv[sys.argv.index("--arquivo") + 1:][:4]
+        try:
+            gravados = converter_arquivo_potencias_de_2(entrada, int(origem), saida, int(destino))
+            print(f"{gravados} dígitos gravados em '{saida}'.")
+        except (ValueError, OSError) as erro:
+            print(f"Erro: {erro}")
+            sys.exit(1)
+        sys.exit(0)
     try:
         executar_programa()
     except KeyboardInterrupt:
@@ -0,0 +1,58 @@
+"""
+Leitura em blocos de dados tabelados (x, y) grandes demais para a memória,
+compartilhada pela integração de tabelas e pelo MMQ de arquivo.
+"""
+import os
+import numpy as np
+from itertools import islice
+from typing import Iterator, Tuple, Union
+
+EXTENSOES_TEXTO = ('.csv', '.txt', '.dat')
+
+def ler_blocos_xy(fonte: Union[str, np.ndarray], tamanho_bloco: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Gera blocos (x, y) de no máximo `tamanho_bloco` linhas de um CSV/TXT de 2
+    colunas (cabeçalho opcional), de um .npy (n, 2), de binário float64
+    intercalado ou de um array (n, 2) / np.memmap.
+    """
+    if isinstance(fonte, str) and os.path.splitext(fonte)[1].lower() in EXTENSOES_TEXTO:
+        yield from _ler_blocos_texto(fonte, tamanho_bloco)
+        return
+
+    if isinstance(fonte, str):
+        if fonte.lower().endswith('.npy'):
+            dados = np.load(fonte, mmap_mode='r')
+        else:
+            dados = np.memmap(fonte, dtype=np.float64, mode='r').reshape(-1, 2)
+    else:
+        dados = fonte
+
+    if dados.ndim != 2 or dados.shape[1] != 2:
+        raise ValueError("Os dados tabelados devem ter exatamente 2 colunas (X, Y).")
+
+    for inicio in range(0, dados.shape[0], tamanho_bloco):
+        bloco = np.asarray(dados[inicio:inicio + tamanho_bloco], dtype=float)
+        yield bloco[:, 0], bloco[:, 1]
+
+def _ler_blocos_texto(caminho: str, tamanho_bloco: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    delimitador = ',' if caminho.lower().endswith('.csv') else None
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        primeira = arquivo.readline()
+        try:
+            [float(v) for v in primeira.replace(',', ' ').split()]
+            pendentes = [primeira]
+        except ValueError:
+            pendentes = []  # Linha de cabeçalho
+
+        while True:
+            brutas = pendentes + list(islice(arquivo, tamanho_bloco - len(pendentes)))
+            pendentes = []
+            if not brutas:
+                break
+            linhas = [linha for linha in brutas if linha.strip()]
+            if not linhas:
+                continue
+            bloco = np.loadtxt(linhas, delimiter=delimitador, ndmin=2)
+            if bloco.shape[1] != 2:
+                raise ValueError("Os dados tabelados devem ter exatamente 2 colunas (X, Y).")
+            yield bloco[:, 0], bloco[:, 1]
@@ -0,0 +1,145 @@
+"""
+Camada de gráficos do AjusteDeCurvas.
+O matplotlib só é importado na primeira figura desenhada, então os ajustes
+feitos em lote nunca o carregam. Sem tela (ou com `configurar_saida`), as
+figuras são gravadas em PNG/SVG num diretório em vez de abrirem uma janela.
+Conjuntos grandes são desenhados como mapa de densidade e linhas longas são
+decimadas, de modo que o custo de desenho não depende do número de pontos.
+"""
+import os
+import numpy as np
+from typing import Optional
+from GraficosComuns import decimar_min_max, importar_pyplot, sem_tela
+
+LIMITE_DISPERSAO = 20_000      # acima disso, os pontos viram mapa de densidade (hexbin)
+LARGURA_DECIMACAO = 2_000      # baldes por linha ao decimar curvas longas
+
+_plt = None
+_diretorio_saida: Optional[str] = None
+_formato_saida = 'png'
+_contador_figuras = 0
+
+def configurar_saida(diretorio: Optional[str], formato: str = 'png'):
+    """Grava as próximas figuras em `diretorio` (PNG ou SVG); None volta ao modo de janela."""
+    global _diretorio_saida, _formato_saida
+    if formato not in ('png', 'svg'):
+        raise ValueError("Formato de saída deve ser 'png' ou 'svg'.")
+    _diretorio_saida, _formato_saida = diretorio, formato
+
+def _pyplot():
+    global _plt, _diretorio_saida
+    if _plt is None:
+        if _diretorio_saida is None and sem_tela():
+            _diretorio_saida = '.'
+        plt = importar_pyplot(_diretorio_saida is not None)
+        plt.style.use('seaborn-v0_8-whitegrid')
+        _plt = plt
+    return _plt
+
+def _finalizar(nome: str):
+    """Mostra a figura ou, no modo arquivo, grava e fecha."""
+    global _contador_figuras
+    plt = _pyplot()
+    if _diretorio_saida is None:
+        print("\n>>> Feche a janela do gráfico para continuar... <<<")
+        plt.show()
+        return
+    _contador_figuras += 1
+    os.makedirs(_diretorio_saida, exist_ok=True)
+    caminho = os.path.join(_diretorio_saida, f"{_contador_figuras:03d}_{nome}.{_formato_saida}")
+    plt.savefig(caminho)
+    plt.close()
+    print(f"[Info] Gráfico salvo em '{caminho}'.")
+
+def decimar_linha(x: np.ndarray, y: np.ndarray, num_baldes: int = LARGURA_DECIMACAO):
+    """Mantém primeiro, último, mínimo e máximo de y em cada balde consecutivo: preserva o desenho da linha."""
+    indices = decimar_min_max(y, num_baldes)
+    return x[indices], y[indices]
+
+def _desenhar_pontos(x: np.ndarray, y: np.ndarray, cor: str, rotulo: str, **estilo):
+    """Dispersão para poucos pontos; mapa de densidade quando passam de LIMITE_DISPERSAO."""
+    plt = _pyplot()
+    if len(x) <= LIMITE_DISPERSAO:
+        plt.scatter(x, y, color=cor, label=rotulo, **estilo)
+        return
+    mapa = {'red': 'Reds', 'darkred': 'Reds'}.get(cor, 'Greys')
+    plt.hexbin(x, y, gridsize=200, cmap=mapa, mincnt=1, bins='log', rasterized=True)
+    # Entrada de legenda para o hexbin, que não aceita label próprio
+    plt.scatter([], [], color=cor, marker='h', label=f"{rotulo} (densidade, {len(x)} pts)")
+
+def configurar_grafico(titulo: str, rotulo_x: str, rotulo_y: str):
+    """Aplica configurações padrão ao gráfico atual."""
+    plt = _pyplot()
+    plt.xlabel(rotulo_x)
+    plt.ylabel(rotulo_y)
+    plt.title(titulo)
+    plt.legend()
+    plt.grid(True, which='both', linestyle='--', alpha=0.6)
+    plt.minorticks_on()
+
+def plotar_ajuste(x: np.ndarray, y: np.ndarray, x_ajuste: np.ndarray, y_ajuste: np.ndarray,
+                  titulo: str, equacao: str, r2: float, var_res: float, rot_x: str, rot_y: str):
+    """Exibe o gráfico com os dados originais, a curva ajustada e a equação na legenda."""
+    plt = _pyplot()
+    plt.figure(figsize=(8, 6))
+
+    _desenhar_pontos(x, y, 'red', 'Dados Originais', s=50, zorder=5)
+
+    # Monta a legenda com Título, Equação e Métricas
+    texto_legenda = (f"{titulo}\n"
+                     f"{equacao}\n"
+                     f"($R^2$={r2:.4f} | $\\sigma^2_{{res}}$={var_res:.4f})")
+
+    x_ajuste, y_ajuste = decimar_linha(np.asarray(x_ajuste), np.asarray(y_ajuste))
+    plt.plot(x_ajuste, y_ajuste, color='blue', linewidth=2, label=texto_legenda)
+
+    configurar_grafico("Ajuste de Curva", rot_x, rot_y)
+    _finalizar("ajuste")
+
+def plotar_apenas_pontos(x: np.ndarray, y: np.ndarray, rot_x: str, rot_y: str):
+    """Exibe apenas os pontos coletados."""
+    plt = _pyplot()
+    plt.figure(figsize=(8, 6))
+    _desenhar_pontos(x, y, 'darkred', 'Dados Coletados', s=70, alpha=0.8)
+    configurar_grafico("Visualização dos Pontos", rot_x, rot_y)
+    _finalizar("pontos")
+
+def plotar_predicao_y(x_dados, y_dados, funcao_poli, valor_x, valor_y, rot_x, rot_y):
+    """Exibe visualmente a predição de Y para um dado X."""
+    plt = _pyplot()
+    plt.figure(figsize=(6, 4))
+
+    _desenhar_pontos(x_dados, y_dados, 'red', "Dados Originais", alpha=0.2)
+
+    margem = (max(x_dados) - min(x_dados)) * 0.1
+    x_plot = np.linspace(min(min(x_dados), valor_x) - margem, max(max(x_dados), valor_x) + margem, 100)
+    plt.plot(x_plot, funcao_poli(x_plot), 'b-', alpha=0.5, label="Modelo Ajustado")
+
+    plt.plot(valor_x, valor_y, 'go', markersize=10, zorder=10, label=f'Estimativa: {valor_y:.2f}')
+    plt.axvline(valor_x, color='green', linestyle=':', alpha=0.5)
+
+    configurar_grafico(f"Predição: Y dado X={valor_x}", rot_x, rot_y)
+    _finalizar("predicao_y")
+
+def plotar_predicao_x(x_dados, y_dados, funcao_poli, valor_y_alvo, raizes_reais, rot_x, rot_y):
+    """Exibe visualmente a busca de X para um dado Y alvo."""
+    plt = _pyplot()
+    plt.figure(figsize=(6, 4))
+    _desenhar_pontos(x_dados, y_dados, 'red', "Dados Originais", alpha=0.2)
+
+    x_min = min(min(x_dados), min(raizes_reais))
+    x_max = max(max(x_dados), max(raizes_reais))
+    margem = (x_max - x_min) * 0.1
+
+    x_plot = np.linspace(x_min - margem, x_max + margem, 200)
+    plt.plot(x_plot, funcao_poli(x_plot), 'b-', alpha=0.5, label="Modelo Ajustado")
+
+    plt.axhline(valor_y_alvo, color='orange', linestyle='--', label=f'Alvo Y={valor_y_alvo}')
+
+    for i, raiz in enumerate(raizes_reais):
+        texto = f'Solução X={raiz:.2f}' if i == 0 else ""
+        plt.plot(raiz, valor_y_alvo, 'go', markersize=8, zorder=10, label=texto)
+        plt.axvline(raiz, color='green', linestyle=':', alpha=0.3)
+
+    configurar_grafico(f"Predição: X dado Y={valor_y_alvo}", rot_x, rot_y)
+    _finalizar("predicao_x")
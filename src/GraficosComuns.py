@@ -0,0 +1,53 @@
+"""
+Utilitários de gráficos compartilhados pelos módulos com saída em matplotlib:
+detecção de ambiente sem tela, importação do pyplot com o backend escolhido
+antes do import e decimação mín/máx de curvas longas.
+"""
+import os
+import sys
+import numpy as np
+
+BACKENDS_SEM_JANELA = ('agg', 'pdf', 'svg', 'ps', 'cairo', 'template')
+
+def sem_tela() -> bool:
+    """Servidor Linux sem DISPLAY/WAYLAND ou backend não interativo pedido via MPLBACKEND."""
+    if os.environ.get('MPLBACKEND', '').lower() in BACKENDS_SEM_JANELA:
+        return True
+    return sys.platform.startswith('linux') and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+def importar_pyplot(salvar_em_arquivo: bool):
+    """
+    Importa o pyplot escolhendo o backend antes do import (Agg quando as
+    figuras vão para arquivo). Deve ser chamada uma vez, na primeira figura:
+    o backend não é trocado depois.
+    """
+    import matplotlib
+    if salvar_em_arquivo:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def decimar_min_max(valores: np.ndarray, num_baldes: int) -> np.ndarray:
+    """
+    Índices que preservam o desenho de uma curva longa: divide as amostras em
+    `num_baldes` grupos consecutivos (≈ um por pixel) e mantém, em cada um, o
+    primeiro, o último e os extremos de cada componente. O total fica limitado
+    a cerca de (2 + 2d)·num_baldes pontos, seja qual for o número de amostras.
+    """
+    n = len(valores)
+    valores = np.asarray(valores).reshape(n, -1)
+    if n <= 4 * num_baldes:
+        return np.arange(n)
+
+    tamanho = int(np.ceil(n / num_baldes))
+    completos = (n // tamanho) * tamanho
+    blocos = valores[:completos].reshape(-1, tamanho, valores.shape[1])
+    inicios = np.arange(0, completos, tamanho)[:, np.newaxis]
+
+    partes = [inicios.ravel(), inicios.ravel() + tamanho - 1,
+              (blocos.argmin(axis=1) + inicios).ravel(), (blocos.argmax(axis=1) + inicios).ravel()]
+    if completos < n:
+        resto = valores[completos:]
+        partes.append(completos + np.concatenate([resto.argmin(axis=0), resto.argmax(axis=0)]))
+    partes.append(np.array([n - 1]))
+    return np.unique(np.concatenate(partes))
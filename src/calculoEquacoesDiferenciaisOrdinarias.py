@@ -1,66 +1,1325 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import sympy as sp
+import struct
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+import sys
 import time
-from typing import Callable, List, Tuple, Dict, Optional
+from scipy.linalg import lu_factor, lu_solve
+from scipy.optimize import brentq
+from sympy.printing.numpy import SciPyPrinter
+from typing import Callable, List, Tuple, Dict, Optional, Sequence, Iterator, Any, Union
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from GraficosComuns import decimar_min_max, importar_pyplot, sem_tela
 
 
 # 1. NÚCLEO MATEMÁTICO (Estratégia e Solver)
 
 class MetodoNumerico(ABC):
     """Interface para estratégias de resolução numérica."""
+    ordem: int = 1
+
     @abstractmethod
     def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
         pass
 
+    def reiniciar(self):
+        """Descarta estado guardado entre passos. Os solucionadores chamam antes de cada integração."""
+        pass
+
 class MetodoEuler(MetodoNumerico):
+    ordem = 1
+
     def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
         return y + h * func(t, y)
 
 class MetodoEulerAperfeicoado(MetodoNumerico):
+    ordem = 2
+
     def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
         k1 = func(t, y)
         k2 = func(t + h, y + h * k1)
         return y + (h / 2.0) * (k1 + k2)
 
 class MetodoRK4(MetodoNumerico):
+    ordem = 4
+
     def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
-        k1 = func(t, y)
+        return self.passo_com_derivada(func, t, y, h, func(t, y))
+
+    def passo_com_derivada(self, func: Callable, t: float, y: np.ndarray, h: float, k1: np.ndarray) -> np.ndarray:
         k2 = func(t + h/2, y + (h/2) * k1)
         k3 = func(t + h/2, y + (h/2) * k2)
         k4 = func(t + h, y + h * k3)
         return y + (h / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
 
+def continua_passo_anterior(t: float, y: np.ndarray, h: float,
+                            t_esperado: Optional[float], y_esperado: Optional[np.ndarray]) -> bool:
+    """
+    O passo em (t, y) começa onde o anterior terminou? Os instantes t0 + i*h
+    acumulam arredondamento proporcional a |t|, então a tolerância é relativa
+    a max(|t|, |h|) (poucos ulps), não a h.
+    """
+    return (y_esperado is not None
+            and abs(t - t_esperado) <= 64 * np.finfo(float).eps * max(abs(t), abs(h))
+            and (y is y_esperado or np.array_equal(y, y_esperado)))
+
+class MetodoAdamsBashforthMoulton(MetodoNumerico):
+    """
+    Preditor-corretor de Adams (PECE) de ordem 2 a 5, com passo fixo.
+    Guarda as últimas derivadas num buffer circular: cada passo custa 2
+    avaliações de f (predição e correção) em vez das 4 do RK4. Os primeiros
+    `ordem - 1` passos são dados com RK4 para preencher o histórico, que é
+    descartado se h mudar ou se o passo não continuar o anterior.
+    """
+    # Bashforth: pesos de f_n, f_{n-1}, ...; Moulton: pesos de f_{n+1}, f_n, ...
+    BASHFORTH = {
+        2: np.array([3, -1]) / 2,
+        3: np.array([23, -16, 5]) / 12,
+        4: np.array([55, -59, 37, -9]) / 24,
+        5: np.array([1901, -2774, 2616, -1274, 251]) / 720,
+    }
+    MOULTON = {
+        2: np.array([1, 1]) / 2,
+        3: np.array([5, 8, -1]) / 12,
+        4: np.array([9, 19, -5, 1]) / 24,
+        5: np.array([251, 646, -264, 106, -19]) / 720,
+    }
+
+    def __init__(self, ordem: int = 4):
+        if ordem not in self.BASHFORTH:
+            raise ValueError("Ordem do Adams-Bashforth-Moulton deve estar entre 2 e 5.")
+        self.ordem = ordem
+        self._partida = MetodoRK4()
+        self.reiniciar()
+
+    def reiniciar(self):
+        self._historico = deque(maxlen=self.ordem)  # _historico[0] = f_n
+        self._t_esperado = None
+        self._y_esperado = None
+        self._h = None
+
+    def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        if h != self._h or not continua_passo_anterior(t, y, h, self._t_esperado, self._y_esperado):
+            self.reiniciar()
+            self._historico.appendleft(func(t, y))
+            self._h = h
+
+        historico = self._historico
+        if len(historico) < self.ordem:
+            y_prox = self._partida.passo_com_derivada(func, t, y, h, historico[0])
+        else:
+            beta = self.BASHFORTH[self.ordem]
+            gama = self.MOULTON[self.ordem]
+            y_pred = y + h * sum(b * f for b, f in zip(beta, historico))
+            f_pred = func(t + h, y_pred)
+            y_prox = y + h * (gama[0] * f_pred + sum(g * f for g, f in zip(gama[1:], historico)))
+
+        historico.appendleft(func(t + h, y_prox))
+        self._t_esperado = t + h
+        self._y_esperado = y_prox
+        return y_prox
+
+class MetodoSimpletico(MetodoNumerico):
+    """
+    Base dos integradores simpléticos para sistemas mecânicos separáveis:
+    d(q_i)/dt = v_i e d(v_i)/dt = a_i(t, q). As posições avançam sem avaliar f
+    ("drift") e só as acelerações, lidas de f nos índices de velocidade,
+    custam avaliações ("kick"). O erro de energia fica limitado em vez de
+    crescer com o tempo, mesmo com passos grandes.
+    """
+    def __init__(self, indices_posicao: Sequence[int] = (), indices_velocidade: Sequence[int] = ()):
+        self.indices_posicao = list(indices_posicao)
+        self.indices_velocidade = list(indices_velocidade)
+
+    @staticmethod
+    def _como_fatia(indices: Sequence[int]):
+        # Índices consecutivos viram fatia: evita a cópia da indexação avançada a cada subpasso
+        if all(b - a == 1 for a, b in zip(indices, indices[1:])):
+            return slice(indices[0], indices[-1] + 1)
+        return np.asarray(indices)
+
+    def _indices(self, y: np.ndarray):
+        if not self.indices_posicao or len(self.indices_posicao) != len(self.indices_velocidade):
+            raise ValueError("Informe o mesmo número (≥ 1) de variáveis de posição e de velocidade.")
+        return self._como_fatia(self.indices_posicao), self._como_fatia(self.indices_velocidade)
+
+    def _aceleracao(self, func: Callable, t: float, y: np.ndarray, iv) -> np.ndarray:
+        return func(t, y)[..., iv]
+
+class MetodoVelocityVerlet(MetodoSimpletico):
+    """
+    Velocity Verlet (kick-drift-kick), 2ª ordem. A aceleração no fim do passo
+    é a mesma do início do seguinte (FSAL), então cada passo custa 1 avaliação.
+    """
+    ordem = 2
+
+    def __init__(self, indices_posicao: Sequence[int] = (), indices_velocidade: Sequence[int] = ()):
+        super().__init__(indices_posicao, indices_velocidade)
+        self.reiniciar()
+
+    def reiniciar(self):
+        self._t_esperado = None
+        self._y_esperado = None
+        self._aceleracao_final = None
+
+    def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        iq, iv = self._indices(y)
+        continua = continua_passo_anterior(t, y, h, self._t_esperado, self._y_esperado)
+        a = self._aceleracao_final if continua else self._aceleracao(func, t, y, iv)
+
+        y_prox = np.array(y, dtype=float)
+        y_prox[..., iv] += (h / 2.0) * a
+        y_prox[..., iq] += h * y_prox[..., iv]
+        a = self._aceleracao(func, t + h, y_prox, iv)
+        y_prox[..., iv] += (h / 2.0) * a
+
+        self._t_esperado, self._y_esperado, self._aceleracao_final = t + h, y_prox, a
+        return y_prox
+
+class MetodoYoshida4(MetodoSimpletico):
+    """
+    Composição de Yoshida de 4ª ordem (drift-kick com 4 drifts e 3 kicks).
+    Um dos subpassos é negativo; custa 3 avaliações por passo.
+    """
+    ordem = 4
+    _W1 = 1.0 / (2.0 - 2.0 ** (1.0 / 3.0))
+    _W0 = -(2.0 ** (1.0 / 3.0)) * _W1
+    DRIFT = np.array([_W1 / 2, (_W0 + _W1) / 2, (_W0 + _W1) / 2, _W1 / 2])
+    KICK = np.array([_W1, _W0, _W1])
+
+    def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        iq, iv = self._indices(y)
+        y_prox = np.array(y, dtype=float)
+        t_posicao = t
+        for c, d in zip(self.DRIFT[:3], self.KICK):
+            y_prox[..., iq] += c * h * y_prox[..., iv]
+            t_posicao += c * h
+            y_prox[..., iv] += d * h * self._aceleracao(func, t_posicao, y_prox, iv)
+        y_prox[..., iq] += self.DRIFT[3] * h * y_prox[..., iv]
+        return y_prox
+
+def jacobiana_numerica(func: Callable, t: float, y: np.ndarray, f0: Optional[np.ndarray] = None) -> np.ndarray:
+    """Jacobiana por diferenças progressivas, usada quando não há expressão simbólica."""
+    f0 = func(t, y) if f0 is None else f0
+    J = np.empty((len(f0), len(y)))
+    for j in range(len(y)):
+        dy = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[j]))
+        y_pert = y.copy()
+        y_pert[j] += dy
+        J[:, j] = (func(t, y_pert) - f0) / dy
+    return J
+
+class NewtonNaoConvergiu(Exception):
+    """Sinaliza, dentro dos métodos implícitos, que o passo atual precisa ser subdividido."""
+
+class MetodoImplicito(MetodoNumerico):
+    """
+    Base dos métodos implícitos de passo único para sistemas rígidos.
+    O passo exige resolver y = const + gama*h*f(t_prox, y) por Newton
+    simplificado, com matriz de iteração I - gama*h*J. A jacobiana e a sua
+    fatoração LU são reaproveitadas entre passos; J só é recalculada quando a
+    convergência fica lenta e a LU quando h muda. Se o Newton simplificado
+    falhar, o passo é refeito com Newton completo (J reavaliada em cada
+    iterado) e, se ainda assim falhar, dividido em subpassos menores.
+    """
+    MAX_ITERACOES = 8
+    MAX_ITERACOES_COMPLETO = 25
+    MAX_SUBDIVISOES = 12
+    TAXA_LENTA = 0.5
+
+    def __init__(self, jacobiana: Optional[Callable] = None, tolerancia: float = 1e-10):
+        self.jacobiana = jacobiana
+        self.tolerancia = tolerancia
+        self.reiniciar()
+
+    def reiniciar(self):
+        self._J = None
+        self._lu = None
+        self._h_fatorado = None
+        self._recalcular_J = True
+
+    @property
+    @abstractmethod
+    def gama(self) -> float:
+        pass
+
+    def _avaliar_jacobiana(self, func: Callable, t: float, y: np.ndarray) -> np.ndarray:
+        if self.jacobiana is not None:
+            return np.asarray(self.jacobiana(t, y), dtype=float)
+        return jacobiana_numerica(func, t, y)
+
+    def _atualizar_fatoracao(self, func: Callable, t: float, y: np.ndarray, h: float, nova_jacobiana: bool):
+        if nova_jacobiana or self._J is None or self._J.shape != (len(y), len(y)):
+            self._J = self._avaliar_jacobiana(func, t, y)
+            self._lu = None
+            self._recalcular_J = False
+        if self._lu is None or self._h_fatorado != h:
+            self._lu = lu_factor(np.eye(len(y)) - self.gama * h * self._J)
+            self._h_fatorado = h
+
+    def _newton_simplificado(self, func: Callable, t_prox: float, constante: np.ndarray,
+                             y_inicial: np.ndarray, h: float) -> Optional[np.ndarray]:
+        self._atualizar_fatoracao(func, t_prox, y_inicial, h, nova_jacobiana=self._recalcular_J)
+        z = y_inicial.copy()
+        norma_anterior = None
+        for _ in range(self.MAX_ITERACOES):
+            residuo = z - constante - self.gama * h * func(t_prox, z)
+            dz = lu_solve(self._lu, -residuo)
+            z += dz
+            norma = np.linalg.norm(dz) / (1.0 + np.linalg.norm(z))
+            taxa = norma / norma_anterior if norma_anterior else 0.0
+            if norma < self.tolerancia:
+                # Convergiu, mas devagar: a jacobiana envelheceu e será renovada no próximo passo
+                self._recalcular_J = taxa > self.TAXA_LENTA
+                return z
+            if not taxa < 1.0:
+                return None
+            norma_anterior = norma
+        return None
+
+    def _newton_completo(self, func: Callable, t_prox: float, constante: np.ndarray,
+                         y_inicial: np.ndarray, h: float) -> Optional[np.ndarray]:
+        """Newton com J avaliada no iterado atual: mais caro, mas converge onde a J antiga não serve."""
+        z = y_inicial.copy()
+        identidade = np.eye(len(z))
+        for _ in range(self.MAX_ITERACOES_COMPLETO):
+            J = self._avaliar_jacobiana(func, t_prox, z)
+            residuo = z - constante - self.gama * h * func(t_prox, z)
+            try:
+                dz = np.linalg.solve(identidade - self.gama * h * J, -residuo)
+            except np.linalg.LinAlgError:
+                return None
+            z += dz
+            if not np.all(np.isfinite(z)):
+                return None
+            if np.linalg.norm(dz) / (1.0 + np.linalg.norm(z)) < self.tolerancia:
+                # A jacobiana do iterado final passa a ser a usada pelo Newton simplificado
+                self._J, self._lu, self._recalcular_J = J, None, False
+                return z
+        return None
+
+    def _resolver_implicito(self, func: Callable, t_prox: float, constante: np.ndarray,
+                            y_inicial: np.ndarray, h: float) -> np.ndarray:
+        if np.ndim(y_inicial) != 1:
+            raise ValueError("Métodos implícitos aceitam apenas um estado (d,) por vez.")
+        z = self._newton_simplificado(func, t_prox, constante, y_inicial, h)
+        if z is None:
+            z = self._newton_completo(func, t_prox, constante, y_inicial, h)
+        if z is None:
+            self._recalcular_J = True
+            raise NewtonNaoConvergiu()
+        return z
+
+    @abstractmethod
+    def _passo_implicito(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        pass
+
+    def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        return self._avancar(func, t, y, h, 0)
+
+    def _avancar(self, func: Callable, t: float, y: np.ndarray, h: float, nivel: int) -> np.ndarray:
+        """Passo h; se o Newton falhar, dois meios passos (recursivamente, até MAX_SUBDIVISOES níveis)."""
+        try:
+            return self._passo_implicito(func, t, y, h)
+        except NewtonNaoConvergiu:
+            if nivel >= self.MAX_SUBDIVISOES:
+                raise RuntimeError(f"Newton não convergiu em t={t + h} nem com o passo dividido por "
+                                   f"{2 ** nivel}. Reduza o passo h.")
+        meio = self._avancar(func, t, y, h / 2.0, nivel + 1)
+        return self._avancar(func, t + h / 2.0, meio, h / 2.0, nivel + 1)
+
+class MetodoEulerImplicito(MetodoImplicito):
+    """Euler implícito (BDF1): y_{n+1} = y_n + h f(t_{n+1}, y_{n+1}). L-estável, 1ª ordem."""
+    ordem = 1
+
+    @property
+    def gama(self) -> float:
+        return 1.0
+
+    def _passo_implicito(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        return self._resolver_implicito(func, t + h, y, y, h)
+
+class MetodoTrapezioImplicito(MetodoImplicito):
+    """Regra do trapézio implícita (Crank-Nicolson). A-estável, 2ª ordem."""
+    ordem = 2
+
+    @property
+    def gama(self) -> float:
+        return 0.5
+
+    def _passo_implicito(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        f_atual = func(t, y)
+        return self._resolver_implicito(func, t + h, y + (h / 2.0) * f_atual, y + h * f_atual, h)
+
+class MetodoDormandPrince(MetodoNumerico):
+    """
+    Runge-Kutta embutido 5(4) de Dormand-Prince (FSAL).
+    Usado com passo fixo, devolve a solução de 5ª ordem; o SolucionadorAdaptativo
+    usa também a estimativa de erro embutida e a saída densa de 4ª ordem.
+    """
+    ordem = 5
+    C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1])
+    A = np.array([
+        [0, 0, 0, 0, 0],
+        [1/5, 0, 0, 0, 0],
+        [3/40, 9/40, 0, 0, 0],
+        [44/45, -56/15, 32/9, 0, 0],
+        [19372/6561, -25360/2187, 64448/6561, -212/729, 0],
+        [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    ])
+    B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84])
+    # Diferença entre as soluções de 5ª e 4ª ordem (inclui a 7ª etapa, FSAL)
+    E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+    # Coeficientes da saída densa (polinômio em sigma = (t - t_n)/h, graus 1 a 4)
+    P = np.array([
+        [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+        [0, 0, 0, 0],
+        [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+        [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+        [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+        [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+        [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+    ])
+
+    def calcular_passo(self, func: Callable, t: float, y: np.ndarray, h: float) -> np.ndarray:
+        y_prox, _, _ = self.passo_embutido(func, t, y, h, func(t, y))
+        return y_prox
+
+    def passo_embutido(self, func: Callable, t: float, y: np.ndarray, h: float,
+                       f_inicial: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Retorna (y_prox, erro_estimado, K), com K[6] = f(t+h, y_prox) reaproveitável (FSAL)."""
+        K = np.empty((7,) + np.shape(y))
+        K[0] = f_inicial
+        for s in range(1, 6):
+            dy = h * np.tensordot(self.A[s, :s], K[:s], axes=1)
+            K[s] = func(t + self.C[s] * h, y + dy)
+        y_prox = y + h * np.tensordot(self.B, K[:6], axes=1)
+        K[6] = func(t + h, y_prox)
+        erro = h * np.tensordot(self.E, K, axes=1)
+        return y_prox, erro, K
+
+    def interpolar(self, t_inicial: float, h: float, y_inicial: np.ndarray, K: np.ndarray,
+                   tempos: np.ndarray) -> np.ndarray:
+        """Saída densa dentro do passo [t_inicial, t_inicial + h] para vários tempos de uma vez."""
+        sigma = (np.asarray(tempos, dtype=float) - t_inicial) / h
+        potencias = np.cumprod(np.repeat(sigma[:, np.newaxis], 4, axis=1), axis=1)
+        Q = np.tensordot(K, self.P, axes=([0], [0]))  # forma (..., 4)
+        return y_inicial + h * np.tensordot(potencias, Q, axes=([1], [-1])).reshape((len(sigma),) + np.shape(y_inicial))
+
+@dataclass
+class Evento:
+    """
+    Função g(t, y) cujo cruzamento por zero deve ser localizado.
+    `direcao`: +1 só conta subidas (g passa de negativo a não negativo), -1 só
+    descidas, 0 ambas. Um evento `terminal` encerra a integração.
+    """
+    nome: str
+    funcao: Callable
+    direcao: int = 0
+    terminal: bool = False
+
+@dataclass
+class ResultadoEventos:
+    tempos: np.ndarray
+    resultados: np.ndarray
+    tempos_eventos: List[np.ndarray]   # um array por evento, na ordem recebida
+    estados_eventos: List[np.ndarray]
+    evento_terminal: Optional[str] = None
+
+class DetectorEventos:
+    """
+    Teste de sinal de cada evento ao fim de um passo aceito e localização do
+    cruzamento por Brent sobre o interpolante desse passo. Usado tanto pelo
+    passo fixo quanto pelos solucionadores adaptativos, que fornecem a
+    própria saída densa.
+    """
+    def __init__(self, eventos: Sequence[Evento], t0: float, y0: np.ndarray):
+        if np.ndim(y0) != 1:
+            raise ValueError("Detecção de eventos aceita apenas um estado (d,) por vez.")
+        self.eventos = list(eventos)
+        self.direcoes = np.array([ev.direcao for ev in self.eventos])
+        self.dimensao = len(y0)
+        self.g_atual = self._avaliar(t0, y0)
+        self._tempos = [[] for _ in self.eventos]
+        self._estados = [[] for _ in self.eventos]
+        self.evento_terminal: Optional[str] = None
+
+    def _avaliar(self, t: float, y: np.ndarray) -> np.ndarray:
+        return np.array([ev.funcao(t, y) for ev in self.eventos], dtype=float)
+
+    def verificar(self, t: float, t_prox: float, y_prox: np.ndarray,
+                  obter_interpolante: Callable[[], Callable]) -> Optional[Tuple[float, np.ndarray]]:
+        """
+        Registra os eventos do passo [t, t_prox]. `obter_interpolante` só é
+        chamado quando há troca de sinal. Devolve (t, y) do evento terminal,
+        se algum ocorreu no passo, ou None para seguir integrando.
+        """
+        g_prox = self._avaliar(t_prox, y_prox)
+        subiu = (self.g_atual < 0) & (g_prox >= 0) & (self.direcoes >= 0)
+        desceu = (self.g_atual > 0) & (g_prox <= 0) & (self.direcoes <= 0)
+        cruzamentos = np.flatnonzero(subiu | desceu)
+        self.g_atual = g_prox
+        if not len(cruzamentos):
+            return None
+
+        interpolante = obter_interpolante()
+        ocorrencias = []
+        for j in cruzamentos:
+            t_evento = t_prox
+            if g_prox[j] != 0:
+                try:
+                    t_evento = brentq(lambda tau: self.eventos[j].funcao(tau, interpolante(tau)), t, t_prox,
+                                      xtol=1e-12 * max(1.0, abs(t_prox)))
+                except ValueError:
+                    # Arredondamento no interpolante desfez a troca de sinal: fica o fim do passo
+                    pass
+            ocorrencias.append((t_evento, j))
+
+        for t_evento, j in sorted(ocorrencias):
+            y_evento = y_prox if t_evento == t_prox else interpolante(t_evento)
+            self._tempos[j].append(t_evento)
+            self._estados[j].append(y_evento)
+            if self.eventos[j].terminal:
+                self.evento_terminal = self.eventos[j].nome
+                return t_evento, y_evento
+        return None
+
+    @property
+    def tempos_eventos(self) -> List[np.ndarray]:
+        return [np.array(te) for te in self._tempos]
+
+    @property
+    def estados_eventos(self) -> List[np.ndarray]:
+        return [np.array(ee).reshape(len(ee), self.dimensao) for ee in self._estados]
+
+@dataclass
+class ResultadoAdaptativo:
+    tempos: np.ndarray
+    resultados: np.ndarray
+    passos_aceitos: int
+    passos_rejeitados: int
+    avaliacoes: int
+    # Preenchidos quando `resolver` recebe eventos (mesmo formato de ResultadoEventos)
+    tempos_eventos: List[np.ndarray] = field(default_factory=list)
+    estados_eventos: List[np.ndarray] = field(default_factory=list)
+    evento_terminal: Optional[str] = None
+
+def _fechar_saida_densa(tempos_saida: np.ndarray, resultados: np.ndarray, proximo: int, t: float, y: np.ndarray,
+                        detector: Optional[DetectorEventos]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Completa a saída densa com o estado final (tempos coincidentes com t_fim).
+    Após um evento terminal, descarta os tempos posteriores e acrescenta o
+    próprio instante do evento.
+    """
+    if detector is None or detector.evento_terminal is None:
+        resultados[proximo:] = y
+        return tempos_saida, resultados
+    if proximo and tempos_saida[proximo - 1] == t:
+        return tempos_saida[:proximo], resultados[:proximo]
+    return np.append(tempos_saida[:proximo], t), np.concatenate((resultados[:proximo], [y]))
+
+def _montar_resultado(tempos: np.ndarray, resultados: np.ndarray, aceitos: int, rejeitados: int, avaliacoes: int,
+                      detector: Optional[DetectorEventos]) -> ResultadoAdaptativo:
+    if detector is None:
+        return ResultadoAdaptativo(tempos, resultados, aceitos, rejeitados, avaliacoes)
+    return ResultadoAdaptativo(tempos, resultados, aceitos, rejeitados, avaliacoes,
+                               detector.tempos_eventos, detector.estados_eventos, detector.evento_terminal)
+
+class SolucionadorAdaptativo:
+    """
+    Integração com controle automático de passo (Dormand-Prince 5(4)).
+    O erro local é medido na norma RMS ponderada por atol + rtol*|y| e o novo
+    passo vem de um controlador PI. Com `tempos_saida`, os valores são obtidos
+    pela saída densa, sem forçar o integrador a parar nesses instantes; a
+    mesma saída densa localiza os `eventos` dentro de cada passo aceito.
+    """
+    BETA_PI = 0.04
+    EXPOENTE = 0.2 - 0.75 * BETA_PI
+    FATOR_MIN = 0.2
+    FATOR_MAX = 10.0
+
+    def __init__(self, metodo: Optional[MetodoDormandPrince] = None, rtol: float = 1e-6, atol: float = 1e-9,
+                 fator_seguranca: float = 0.9, passo_maximo: float = np.inf):
+        self.metodo = metodo or MetodoDormandPrince()
+        self.rtol = rtol
+        self.atol = atol
+        self.fator_seguranca = fator_seguranca
+        self.passo_maximo = passo_maximo
+
+    def _norma_erro(self, erro: np.ndarray, y: np.ndarray, y_prox: np.ndarray) -> float:
+        escala = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y_prox))
+        return float(np.sqrt(np.mean((erro / escala) ** 2)))
+
+    def _passo_inicial(self, func: Callable, t0: float, y0: np.ndarray, f0: np.ndarray, t_fim: float) -> float:
+        """Heurística de Hairer: estima h a partir de |y0|, |f0| e de um passo de Euler exploratório."""
+        escala = self.atol + self.rtol * np.abs(y0)
+        d0 = np.sqrt(np.mean((y0 / escala) ** 2))
+        d1 = np.sqrt(np.mean((f0 / escala) ** 2))
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h0 = min(h0, t_fim - t0)
+
+        f1 = func(t0 + h0, y0 + h0 * f0)
+        d2 = np.sqrt(np.mean(((f1 - f0) / escala) ** 2)) / h0
+        if max(d1, d2) <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+        return min(100 * h0, h1, self.passo_maximo, t_fim - t0)
+
+    def resolver(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float],
+                 h_inicial: Optional[float] = None, tempos_saida: Optional[Sequence[float]] = None,
+                 eventos: Sequence[Evento] = ()) -> ResultadoAdaptativo:
+        t0, t_fim = intervalo
+        if t_fim <= t0:
+            raise ValueError("O tempo final deve ser maior que o inicial.")
+
+        avaliacoes = 0
+        def func(t, y):
+            nonlocal avaliacoes
+            avaliacoes += 1
+            return func_sistema(t, y)
+
+        self.metodo.reiniciar()
+        y = np.array(y0, dtype=float)
+        t = t0
+        f_atual = func(t, y)
+        h = h_inicial if h_inicial else self._passo_inicial(func, t0, y, f_atual, t_fim)
+        detector = DetectorEventos(eventos, t0, y) if eventos else None
+
+        saida_densa = tempos_saida is not None
+        if saida_densa:
+            tempos_saida = np.asarray(tempos_saida, dtype=float)
+            resultados = np.empty((len(tempos_saida),) + y.shape)
+            proximo = np.searchsorted(tempos_saida, t0, side='right')
+            resultados[:proximo] = y
+        else:
+            lista_t, lista_y = [t], [y]
+
+        aceitos = rejeitados = 0
+        erro_anterior = 1e-4
+        while t < t_fim:
+            h = min(h, self.passo_maximo, t_fim - t)
+            rejeitou_neste_passo = False
+            while True:
+                y_prox, erro_vec, K = self.metodo.passo_embutido(func, t, y, h, f_atual)
+                erro = self._norma_erro(erro_vec, y, y_prox)
+                if erro <= 1.0:
+                    break
+                rejeitados += 1
+                rejeitou_neste_passo = True
+                h *= max(self.FATOR_MIN, self.fator_seguranca * erro ** (-1 / 5))
+                if t + h == t:
+                    raise RuntimeError(f"Passo mínimo atingido em {t}: o problema pode ser rígido.")
+
+            t_prox = t_fim if t_fim - (t + h) <= 1e-12 * max(1.0, abs(t_fim)) else t + h
+            terminal = None
+            if detector is not None:
+                terminal = detector.verificar(t, t_prox, y_prox, lambda: (
+                    lambda tau: self.metodo.interpolar(t, h, y, K, [tau])[0]))
+                if terminal is not None:
+                    t_prox, y_prox = terminal
+            if saida_densa:
+                fim = np.searchsorted(tempos_saida, t_prox, side='right')
+                if fim > proximo:
+                    resultados[proximo:fim] = self.metodo.interpolar(t, h, y, K, tempos_saida[proximo:fim])
+                    proximo = fim
+            else:
+                lista_t.append(t_prox)
+                lista_y.append(y_prox)
+            if terminal is not None:
+                t, y = t_prox, y_prox
+                aceitos += 1
+                break
+
+            # Controlador PI: usa o erro atual e o do último passo aceito
+            fator = (erro ** self.EXPOENTE) / (erro_anterior ** self.BETA_PI) / self.fator_seguranca
+            fator = min(1 / self.FATOR_MIN, max(1 / self.FATOR_MAX, fator)) if erro > 0 else 1 / self.FATOR_MAX
+            h_novo = h / fator
+            if rejeitou_neste_passo:
+                h_novo = min(h_novo, h)
+            erro_anterior = max(erro, 1e-4)
+
+            t, y, f_atual, h = t_prox, y_prox, K[6], h_novo
+            aceitos += 1
+
+        if saida_densa:
+            tempos, resultados = _fechar_saida_densa(tempos_saida, resultados, proximo, t, y, detector)
+        else:
+            tempos, resultados = np.array(lista_t), np.array(lista_y)
+        return _montar_resultado(tempos, resultados, aceitos, rejeitados, avaliacoes, detector)
+
+class SolucionadorBDF:
+    """
+    BDF de ordem (1 a 5) e passo variáveis para problemas rígidos, na forma
+    de diferenças regressivas (Shampine & Reichelt, base do ode15s/solve_ivp).
+    A jacobiana é mantida enquanto o Newton converge e só é recalculada
+    quando ele falha; a LU de I - c*J é refeita apenas quando h ou a ordem mudam.
+    Os `eventos` são localizados no polinômio das diferenças regressivas do passo.
+    """
+    ORDEM_MAXIMA = 5
+    MAX_ITERACOES_NEWTON = 4
+    FATOR_MIN = 0.2
+    FATOR_MAX = 10.0
+
+    def __init__(self, jacobiana: Optional[Callable] = None, rtol: float = 1e-6, atol: float = 1e-9,
+                 passo_maximo: float = np.inf):
+        self.jacobiana = jacobiana
+        self.rtol = rtol
+        self.atol = atol
+        self.passo_maximo = passo_maximo
+
+        k = np.arange(1, self.ORDEM_MAXIMA + 1)
+        self.gama = np.hstack((0, np.cumsum(1 / k)))
+        self.alfa = self.gama
+        self.constante_erro = 1 / np.arange(1, self.ORDEM_MAXIMA + 2)
+
+    @staticmethod
+    def _norma(x: np.ndarray) -> float:
+        return float(np.linalg.norm(x) / np.sqrt(x.size))
+
+    @staticmethod
+    def _matriz_r(ordem: int, fator: float) -> np.ndarray:
+        i = np.arange(1, ordem + 1)[:, np.newaxis]
+        j = np.arange(1, ordem + 1)
+        M = np.zeros((ordem + 1, ordem + 1))
+        M[1:, 1:] = (i - 1 - fator * j) / i
+        M[0] = 1
+        return np.cumprod(M, axis=0)
+
+    def _mudar_passo(self, D: np.ndarray, ordem: int, fator: float):
+        """Reescala as diferenças regressivas para o novo passo h*fator."""
+        RU = self._matriz_r(ordem, fator).dot(self._matriz_r(ordem, 1))
+        D[:ordem + 1] = RU.T.dot(D[:ordem + 1])
+
+    def _resolver_sistema(self, func: Callable, t_novo: float, y_previsto: np.ndarray, c: float,
+                          psi: np.ndarray, lu, escala: np.ndarray, tol_newton: float):
+        d = np.zeros_like(y_previsto)
+        y = y_previsto.copy()
+        norma_anterior = None
+        for k in range(self.MAX_ITERACOES_NEWTON):
+            f = func(t_novo, y)
+            if not np.all(np.isfinite(f)):
+                break
+            dy = lu_solve(lu, c * f - psi - d)
+            norma = self._norma(dy / escala)
+            taxa = None if norma_anterior is None else norma / norma_anterior
+            if taxa is not None and (taxa >= 1 or taxa ** (self.MAX_ITERACOES_NEWTON - k) / (1 - taxa) * norma > tol_newton):
+                break
+            y += dy
+            d += dy
+            if norma == 0 or (taxa is not None and taxa / (1 - taxa) * norma < tol_newton):
+                return True, k + 1, y, d
+            norma_anterior = norma
+        return False, self.MAX_ITERACOES_NEWTON, y, d
+
+    def _interpolar(self, t: float, h: float, ordem: int, D: np.ndarray, tempos: np.ndarray) -> np.ndarray:
+        """Saída densa: polinômio de interpolação das diferenças regressivas do último passo."""
+        t_desloc = t - h * np.arange(ordem)
+        denominador = h * (1 + np.arange(ordem))
+        x = (np.asarray(tempos)[:, np.newaxis] - t_desloc) / denominador
+        p = np.cumprod(x, axis=1)
+        return D[0] + p.dot(D[1:ordem + 1])
+
+    def resolver(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float],
+                 h_inicial: Optional[float] = None, tempos_saida: Optional[Sequence[float]] = None,
+                 eventos: Sequence[Evento] = ()) -> ResultadoAdaptativo:
+        t0, t_fim = intervalo
+        if t_fim <= t0:
+            raise ValueError("O tempo final deve ser maior que o inicial.")
+
+        avaliacoes = 0
+        def func(t, y):
+            nonlocal avaliacoes
+            avaliacoes += 1
+            return np.asarray(func_sistema(t, y), dtype=float)
+
+        def jac(t, y):
+            if self.jacobiana is not None:
+                return np.asarray(self.jacobiana(t, y), dtype=float)
+            return jacobiana_numerica(func, t, y)
+
+        y = np.array(y0, dtype=float)
+        if y.ndim != 1:
+            raise ValueError("O BDF aceita apenas um estado (d,) por vez.")
+        n = len(y)
+        t = t0
+        f0 = func(t, y)
+        tol_newton = max(10 * np.finfo(float).eps / self.rtol, min(0.03, self.rtol ** 0.5))
+
+        if h_inicial:
+            h = h_inicial
+        else:
+            # Passo inicial de 1ª ordem: erro local ~ h^2 |y''|
+            escala = self.atol + self.rtol * np.abs(y)
+            d1 = self._norma(f0 / escala)
+            h = min(0.01 * max(self._norma(y / escala), 1e-5) / max(d1, 1e-5), t_fim - t0, self.passo_maximo)
+            f1 = func(t + h, y + h * f0)
+            d2 = self._norma((f1 - f0) / escala) / h
+            h = min(100 * h, (0.01 / max(d1, d2, 1e-15)) ** 0.5, t_fim - t0, self.passo_maximo)
+
+        detector = DetectorEventos(eventos, t0, y) if eventos else None
+        D = np.zeros((self.ORDEM_MAXIMA + 3, n))
+        D[0] = y
+        D[1] = f0 * h
+        ordem = 1
+        passos_iguais = 0
+        J = jac(t, y)
+        jacobiana_atual = True
+        lu = None
+
+        saida_densa = tempos_saida is not None
+        if saida_densa:
+            tempos_saida = np.asarray(tempos_saida, dtype=float)
+            resultados = np.empty((len(tempos_saida), n))
+            proximo = np.searchsorted(tempos_saida, t0, side='right')
+            resultados[:proximo] = y
+        else:
+            lista_t, lista_y = [t], [y.copy()]
+
+        aceitos = rejeitados = 0
+        while t < t_fim:
+            passo_minimo = 10 * abs(np.nextafter(t, np.inf) - t)
+            if h > self.passo_maximo:
+                self._mudar_passo(D, ordem, self.passo_maximo / h)
+                h = self.passo_maximo
+                passos_iguais = 0
+                lu = None
+
+            while True:
+                if h < passo_minimo:
+                    raise RuntimeError(f"Passo mínimo atingido em {t}.")
+                t_novo = t + h
+                if t_novo >= t_fim or t_fim - t_novo <= 1e-12 * max(1.0, abs(t_fim)):
+                    t_novo = t_fim
+                    self._mudar_passo(D, ordem, (t_novo - t) / h)
+                    passos_iguais = 0
+                    lu = None
+                h = t_novo - t
+
+                y_previsto = np.sum(D[:ordem + 1], axis=0)
+                escala = self.atol + self.rtol * np.abs(y_previsto)
+                psi = np.dot(D[1:ordem + 1].T, self.gama[1:ordem + 1]) / self.alfa[ordem]
+                c = h / self.alfa[ordem]
+
+                while True:
+                    if lu is None:
+                        lu = lu_factor(np.eye(n) - c * J)
+                    convergiu, iteracoes, y_novo, d = self._resolver_sistema(
+                        func, t_novo, y_previsto, c, psi, lu, escala, tol_newton)
+                    if convergiu or jacobiana_atual:
+                        break
+                    J = jac(t_novo, y_previsto)
+                    jacobiana_atual = True
+                    lu = None
+
+                if not convergiu:
+                    rejeitados += 1
+                    self._mudar_passo(D, ordem, 0.5)
+                    h *= 0.5
+                    passos_iguais = 0
+                    lu = None
+                    continue
+
+                seguranca = 0.9 * (2 * self.MAX_ITERACOES_NEWTON + 1) / (2 * self.MAX_ITERACOES_NEWTON + iteracoes)
+                escala = self.atol + self.rtol * np.abs(y_novo)
+                norma_erro = self._norma(self.constante_erro[ordem] * d / escala)
+                if norma_erro > 1:
+                    rejeitados += 1
+                    fator = max(self.FATOR_MIN, seguranca * norma_erro ** (-1 / (ordem + 1)))
+                    self._mudar_passo(D, ordem, fator)
+                    h *= fator
+                    passos_iguais = 0
+                    lu = None
+                    continue
+                break
+
+            aceitos += 1
+            passos_iguais += 1
+            jacobiana_atual = False
+            t = t_novo
+            D[ordem + 2] = d - D[ordem + 1]
+            D[ordem + 1] = d
+            for i in reversed(range(ordem + 1)):
+                D[i] += D[i + 1]
+
+            t_saida, y_saida = t, D[0]
+            terminal = None
+            if detector is not None:
+                terminal = detector.verificar(t - h, t, D[0], lambda: (
+                    lambda tau: self._interpolar(t, h, ordem, D, [tau])[0]))
+                if terminal is not None:
+                    t_saida, y_saida = terminal
+            if saida_densa:
+                fim = np.searchsorted(tempos_saida, t_saida, side='right')
+                if fim > proximo:
+                    resultados[proximo:fim] = self._interpolar(t, h, ordem, D, tempos_saida[proximo:fim])
+                    proximo = fim
+            else:
+                lista_t.append(t_saida)
+                lista_y.append(y_saida.copy())
+            if terminal is not None:
+                t, y = terminal
+                break
+
+            # Troca de ordem/passo só após ordem+1 passos iguais (diferenças confiáveis)
+            if passos_iguais < ordem + 1:
+                continue
+            erro_menor = (self._norma(self.constante_erro[ordem - 1] * D[ordem] / escala)
+                          if ordem > 1 else np.inf)
+            erro_maior = (self._norma(self.constante_erro[ordem + 1] * D[ordem + 2] / escala)
+                          if ordem < self.ORDEM_MAXIMA else np.inf)
+            with np.errstate(divide='ignore'):
+                fatores = np.array([erro_menor, norma_erro, erro_maior]) ** (-1 / np.arange(ordem, ordem + 3))
+            ordem += int(np.argmax(fatores)) - 1
+            fator = min(self.FATOR_MAX, seguranca * np.max(fatores))
+            self._mudar_passo(D, ordem, fator)
+            h *= fator
+            passos_iguais = 0
+            lu = None
+
+        if saida_densa:
+            # Sem evento terminal, o estado final é o das diferenças regressivas
+            y_final = y if detector is not None and detector.evento_terminal is not None else D[0]
+            tempos, resultados = _fechar_saida_densa(tempos_saida, resultados, proximo, t, y_final, detector)
+        else:
+            tempos, resultados = np.array(lista_t), np.array(lista_y)
+        return _montar_resultado(tempos, resultados, aceitos, rejeitados, avaliacoes, detector)
+
+def numero_de_passos(intervalo: Tuple[float, float], h: float) -> int:
+    """
+    Passos de tamanho h que cobrem o intervalo. A folga de 1e-9 no quociente
+    evita um passo extra quando h = (t_fim - t0)/n não é representável
+    exatamente (ex: h = 1/49 em (0, 1) daria 50 passos com o ceil puro).
+    """
+    return max(0, int(np.ceil((intervalo[1] - intervalo[0]) / h - 1e-9)))
+
 class SolucionadorEDO:
     """Orquestrador da resolução matemática."""
     def __init__(self, metodo: MetodoNumerico):
         self.metodo = metodo
 
-    def resolver(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float], h: float) -> Tuple[np.ndarray, np.ndarray]:
-        t0, t_fim = intervalo
-        num_passos = int(np.ceil((t_fim - t0) / h))
-        tempos = np.linspace(t0, t0 + num_passos * h, num_passos + 1)
+    def iterar(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float], h: float,
+               tamanho_bloco: int = 4096) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Gera a trajetória em blocos (tempos, estados) de até `tamanho_bloco`
+        amostras, começando pelo estado inicial. Cada bloco é um array novo,
+        então a memória não cresce com o número de passos desde que o
+        consumidor não acumule os blocos.
+        """
+        t0 = intervalo[0]
+        num_passos = numero_de_passos(intervalo, h)
+
+        self.metodo.reiniciar()
+        y_atual = np.array(y0, dtype=float)
+        bloco_t = np.empty(tamanho_bloco)
+        bloco_y = np.empty((tamanho_bloco,) + y_atual.shape)
+        bloco_t[0], bloco_y[0] = t0, y_atual
+        k = 1
+
+        for i in range(num_passos):
+            if k == tamanho_bloco:
+                yield bloco_t, bloco_y
+                bloco_t = np.empty(tamanho_bloco)
+                bloco_y = np.empty((tamanho_bloco,) + y_atual.shape)
+                k = 0
+            y_atual = self.metodo.calcular_passo(func_sistema, t0 + i * h, y_atual, h)
+            bloco_t[k] = t0 + (i + 1) * h
+            bloco_y[k] = y_atual
+            k += 1
+
+        yield bloco_t[:k], bloco_y[:k]
+
+    def transmitir(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float], h: float,
+                   sumidouros: Sequence['Sumidouro'], tamanho_bloco: int = 4096) -> List[Any]:
+        """Entrega cada bloco de `iterar` a todos os sumidouros e devolve o resultado de cada um."""
+        for tempos, estados in self.iterar(func_sistema, intervalo, y0, h, tamanho_bloco):
+            for sumidouro in sumidouros:
+                sumidouro.consumir(tempos, estados)
+        return [sumidouro.finalizar() for sumidouro in sumidouros]
+
+    @staticmethod
+    def _interpolante_hermite(func_sistema: Callable, t: float, y: np.ndarray,
+                              t_prox: float, y_prox: np.ndarray) -> Callable:
+        """Hermite cúbico no passo [t, t_prox], a partir dos extremos e de f neles."""
+        h = t_prox - t
+        f0, f1 = func_sistema(t, y), func_sistema(t_prox, y_prox)
+        def interpolante(tau):
+            s = (tau - t) / h
+            return ((2*s**3 - 3*s**2 + 1) * y + (s**3 - 2*s**2 + s) * h * f0
+                    + (3*s**2 - 2*s**3) * y_prox + (s**3 - s**2) * h * f1)
+        return interpolante
+
+    def resolver_com_eventos(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float], h: float,
+                             eventos: Sequence[Evento], decimacao: int = 1) -> ResultadoEventos:
+        """
+        Integra como `resolver`, testando a cada passo o sinal de cada evento.
+        Quando há troca de sinal, o instante é localizado por Brent sobre o
+        interpolante do passo: a saída densa do Dormand-Prince ou um Hermite
+        cúbico (2 avaliações extras de f, só nos passos com cruzamento).
+        Um evento terminal encerra a integração no instante encontrado.
+        """
+        t0 = intervalo[0]
+        num_passos = numero_de_passos(intervalo, h)
+        decimacao = max(1, decimacao)
+
+        self.metodo.reiniciar()
+        y = np.array(y0, dtype=float)
+        detector = DetectorEventos(eventos, t0, y)
+        dormand_prince = isinstance(self.metodo, MetodoDormandPrince)
+        f_atual = func_sistema(t0, y) if dormand_prince else None
+
+        tempos, resultados = [t0], [y]
+        for i in range(num_passos):
+            t, t_prox = t0 + i * h, t0 + (i + 1) * h
+            if dormand_prince:
+                y_prox, _, K = self.metodo.passo_embutido(func_sistema, t, y, h, f_atual)
+                f_atual = K[6]
+                obter_interpolante = lambda t=t, y=y, K=K: (
+                    lambda tau: self.metodo.interpolar(t, h, y, K, [tau])[0])
+            else:
+                y_prox = self.metodo.calcular_passo(func_sistema, t, y, h)
+                obter_interpolante = lambda t=t, y=y, t_prox=t_prox, y_prox=y_prox: (
+                    self._interpolante_hermite(func_sistema, t, y, t_prox, y_prox))
+
+            terminal = detector.verificar(t, t_prox, y_prox, obter_interpolante)
+            if terminal is not None:
+                tempos.append(terminal[0])
+                resultados.append(terminal[1])
+                break
+
+            y = y_prox
+            if (i + 1) % decimacao == 0 or i + 1 == num_passos:
+                tempos.append(t_prox)
+                resultados.append(y)
+
+        return ResultadoEventos(
+            tempos=np.array(tempos),
+            resultados=np.array(resultados),
+            tempos_eventos=detector.tempos_eventos,
+            estados_eventos=detector.estados_eventos,
+            evento_terminal=detector.evento_terminal,
+        )
+
+    def resolver(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float], h: float,
+                 decimacao: int = 1, apenas_final: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        `y0` pode ser um único estado (d,) ou um conjunto de condições iniciais
+        (m, d). No segundo caso, cada etapa do método avalia f uma única vez
+        sobre o array inteiro e os resultados têm forma (passos, m, d).
+        Para limitar a memória, `decimacao` guarda 1 a cada k passos (o último
+        sempre é guardado) e `apenas_final` mantém somente o estado final.
+        """
+        t0 = intervalo[0]
+        num_passos = numero_de_passos(intervalo, h)
         
+        if apenas_final:
+            indices_salvos = np.array([num_passos])
+        else:
+            indices_salvos = np.arange(0, num_passos + 1, max(1, decimacao))
+            if indices_salvos[-1] != num_passos:
+                indices_salvos = np.append(indices_salvos, num_passos)
+
         y0_array = np.array(y0, dtype=float)
-        resultados = np.zeros((len(tempos), len(y0_array)))
-        resultados[0] = y0_array
-
-        y_atual = y0_array
-        for i in range(len(tempos) - 1):
-            t_atual = tempos[i]
-            y_prox = self.metodo.calcular_passo(func_sistema, t_atual, y_atual, h)
-            resultados[i+1] = y_prox
-            y_atual = y_prox
+        tempos = np.zeros(len(indices_salvos))
+        resultados = np.zeros((len(indices_salvos),) + y0_array.shape)
+
+        inicio_bloco = 0
+        for bloco_t, bloco_y in self.iterar(func_sistema, intervalo, y0_array, h):
+            fim_bloco = inicio_bloco + len(bloco_t)
+            i0, i1 = np.searchsorted(indices_salvos, [inicio_bloco, fim_bloco])
+            tempos[i0:i1] = bloco_t[indices_salvos[i0:i1] - inicio_bloco]
+            resultados[i0:i1] = bloco_y[indices_salvos[i0:i1] - inicio_bloco]
+            inicio_bloco = fim_bloco
             
         return tempos, resultados
 
+class Sumidouro(ABC):
+    """Destino dos blocos gerados por SolucionadorEDO.iterar/transmitir."""
+    @abstractmethod
+    def consumir(self, tempos: np.ndarray, estados: np.ndarray):
+        pass
+
+    def finalizar(self) -> Any:
+        return None
+
+class SumidouroDecimacao(Sumidouro):
+    """Guarda 1 amostra a cada k (contadas desde o início) e sempre a última."""
+    def __init__(self, k: int):
+        self.k = max(1, k)
+        self._contador = 0
+        self._tempos: List[np.ndarray] = []
+        self._estados: List[np.ndarray] = []
+        self._ultimo: Optional[Tuple[float, np.ndarray]] = None
+
+    def consumir(self, tempos: np.ndarray, estados: np.ndarray):
+        if len(tempos) == 0:
+            return
+        primeiro = (-self._contador) % self.k
+        self._tempos.append(tempos[primeiro::self.k].copy())
+        self._estados.append(estados[primeiro::self.k].copy())
+        self._contador += len(tempos)
+        self._ultimo = (tempos[-1], estados[-1].copy())
+
+    def finalizar(self) -> Tuple[np.ndarray, np.ndarray]:
+        if not self._tempos:
+            return np.empty(0), np.empty(0)
+        tempos = np.concatenate(self._tempos)
+        estados = np.concatenate(self._estados)
+        if self._ultimo is not None and (self._contador - 1) % self.k != 0:
+            tempos = np.append(tempos, self._ultimo[0])
+            estados = np.concatenate([estados, self._ultimo[1][np.newaxis]])
+        return tempos, estados
+
+class SumidouroArquivoNpy(Sumidouro):
+    """
+    Grava as linhas [t, y...] num .npy que cresce a cada bloco. O cabeçalho
+    tem tamanho fixo e é reescrito no final com o número real de linhas, então
+    o arquivo pode ser lido depois com np.load(..., mmap_mode='r').
+    """
+    TAMANHO_CABECALHO = 128
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._arquivo = None
+        self._linhas = 0
+        self._colunas = 0
+
+    def _escrever_cabecalho(self):
+        dicionario = f"{{'descr': '<f8', 'fortran_order': False, 'shape': ({self._linhas}, {self._colunas}), }}"
+        tamanho = self.TAMANHO_CABECALHO - 10
+        cabecalho = dicionario.ljust(tamanho - 1) + "\n"
+        self._arquivo.seek(0)
+        self._arquivo.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", tamanho) + cabecalho.encode("latin1"))
+
+    def consumir(self, tempos: np.ndarray, estados: np.ndarray):
+        linhas = np.column_stack([tempos, estados.reshape(len(tempos), -1)]).astype('<f8')
+        if self._arquivo is None:
+            self._colunas = linhas.shape[1]
+            self._arquivo = open(self.caminho, "wb")
+            self._escrever_cabecalho()
+        self._arquivo.seek(0, 2)
+        self._arquivo.write(linhas.tobytes())
+        self._linhas += len(linhas)
+
+    def finalizar(self) -> str:
+        if self._arquivo is not None:
+            self._escrever_cabecalho()
+            self._arquivo.close()
+            self._arquivo = None
+        return self.caminho
+
+class SumidouroEstatisticas(Sumidouro):
+    """Mínimo, máximo e média de cada componente ao longo do tempo, em memória constante."""
+    def __init__(self):
+        self._minimo = None
+        self._maximo = None
+        self._soma = None
+        self._contador = 0
+
+    def consumir(self, tempos: np.ndarray, estados: np.ndarray):
+        if len(estados) == 0:
+            return
+        if self._minimo is None:
+            self._minimo = estados.min(axis=0)
+            self._maximo = estados.max(axis=0)
+            self._soma = estados.sum(axis=0)
+        else:
+            np.minimum(self._minimo, estados.min(axis=0), out=self._minimo)
+            np.maximum(self._maximo, estados.max(axis=0), out=self._maximo)
+            self._soma += estados.sum(axis=0)
+        self._contador += len(estados)
+
+    def finalizar(self) -> Dict[str, Any]:
+        if self._contador == 0:
+            # Nenhuma amostra recebida: sem estatísticas, como os arrays vazios de SumidouroDecimacao
+            return {'minimo': None, 'maximo': None, 'media': None, 'amostras': 0}
+        return {'minimo': self._minimo, 'maximo': self._maximo,
+                'media': self._soma / self._contador, 'amostras': self._contador}
+
+@dataclass
+class ResultadoRichardson:
+    h_recomendado: float
+    h_final: float            # menor passo efetivamente integrado
+    erro_estimado: float      # erro global estimado da solução com h_final
+    tempos: np.ndarray
+    resultados: np.ndarray    # solução com h_final
+    historico: List[Tuple[float, float]]  # (h, erro estimado) de cada refinamento
+
+class EstimadorRichardson:
+    """
+    Estimativa do erro global de um método de passo fixo sem solução exata.
+    Integra com h e h/2 e, pela ordem p conhecida, erro(h/2) ≈ |y_h/2 - y_h| / (2^p - 1)
+    nos pontos comuns às duas malhas. Enquanto o erro passa da tolerância,
+    o passo é dividido por 2 e a solução fina vira a grossa do próximo
+    refinamento, então cada malha é integrada uma única vez.
+    """
+    FATOR_SEGURANCA = 0.9
+
+    def __init__(self, metodo: MetodoNumerico, tolerancia: float = 1e-6, max_refinamentos: int = 12):
+        if max_refinamentos < 1:
+            raise ValueError("É necessário pelo menos 1 refinamento (h e h/2) para estimar o erro.")
+        self.metodo = metodo
+        self.tolerancia = tolerancia
+        self.max_refinamentos = max_refinamentos
+
+    @staticmethod
+    def _ajustar_passo(intervalo: Tuple[float, float], h: float) -> float:
+        """Maior passo ≤ h que divide o intervalo: garante que a malha de h/2 contém a de h."""
+        comprimento = intervalo[1] - intervalo[0]
+        return comprimento / max(1, numero_de_passos(intervalo, h))
+
+    def estimar(self, func_sistema: Callable, intervalo: Tuple[float, float], y0: List[float],
+                h_inicial: Optional[float] = None) -> ResultadoRichardson:
+        solver = SolucionadorEDO(self.metodo)
+        p = self.metodo.ordem
+        h = self._ajustar_passo(intervalo, h_inicial if h_inicial else (intervalo[1] - intervalo[0]) / 16)
+
+        _, grossa = solver.resolver(func_sistema, intervalo, y0, h)
+        historico = []
+        for _ in range(self.max_refinamentos):
+            h /= 2
+            tempos, fina = solver.resolver(func_sistema, intervalo, y0, h)
+            if fina[::2].shape != grossa.shape:
+                raise RuntimeError(f"Malhas de h e h/2 não encaixam ({len(grossa)} e {len(fina)} pontos).")
+            erro = np.max(np.abs(fina[::2] - grossa)) / (2**p - 1)
+            historico.append((h, erro))
+            if erro <= self.tolerancia:
+                break
+            grossa = fina
+
+        if erro > 0:
+            h_recomendado = self._ajustar_passo(intervalo, h * (self.tolerancia / erro) ** (1.0 / p) * self.FATOR_SEGURANCA)
+        else:
+            h_recomendado = intervalo[1] - intervalo[0]
+        if erro <= self.tolerancia:
+            # h_final já atende a tolerância: a recomendação nunca é menor que ele
+            h_recomendado = max(h_recomendado, h)
+        return ResultadoRichardson(
+            h_recomendado=h_recomendado,
+            h_final=h, erro_estimado=erro, tempos=tempos, resultados=fina, historico=historico,
+        )
+
+@dataclass
+class ResultadoVarredura:
+    parametros: np.ndarray   # (m, P): uma linha por combinação, na ordem de `resultados`
+    tempos: np.ndarray
+    resultados: np.ndarray   # (m, passos, d)
+
+@lru_cache(maxsize=8)
+def _sistema_parametrico_em_cache(str_eqs: Tuple[str, ...], var_t: str, vars_y: Tuple[str, ...],
+                                  nomes_parametros: Tuple[str, ...]) -> Callable:
+    """Compila uma vez por processo: os kernels gerados por exec não são serializáveis."""
+    return InterpretadorMatematico.converter_sistema_parametrico(list(str_eqs), var_t, list(vars_y), list(nomes_parametros))
+
+def _integrar_lote_parametros(sistema: Tuple, metodo: MetodoNumerico, intervalo: Tuple[float, float],
+                              y0_lote: np.ndarray, h: float, decimacao: int,
+                              p_lote: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Integra um lote de combinações; devolve (tempos, resultados (k, passos, d))."""
+    f = _sistema_parametrico_em_cache(*sistema)
+    solver = SolucionadorEDO(metodo)
+
+    if isinstance(metodo, MetodoImplicito):
+        # Newton dos métodos implícitos trabalha com um estado por vez
+        saidas = []
+        for y0, p in zip(y0_lote, p_lote):
+            tempos, res = solver.resolver(lambda t, y, out=None, p=p: f(t, y, p, out), intervalo, y0, h, decimacao)
+            saidas.append(res)
+        return tempos, np.stack(saidas)
+
+    tempos, res = solver.resolver(lambda t, y, out=None: f(t, y, p_lote, out), intervalo, y0_lote, h, decimacao)
+    return tempos, np.moveaxis(res, 1, 0)
+
+def imprimir_progresso(concluidos: int, total: int):
+    largura = 30
+    cheio = int(largura * concluidos / total)
+    print(f"\r[{'#' * cheio}{'.' * (largura - cheio)}] {concluidos}/{total}", end="" if concluidos < total else "\n", flush=True)
+
+class VarreduraParametros:
+    """
+    Integra o mesmo sistema sobre uma grade de parâmetros livres (ex: k em
+    dy/dt = -k*y). As equações são compiladas uma vez; em sistemas pequenos
+    cada lote de combinações vira um conjunto (m, d) integrado de forma
+    vetorizada, e acima de `LIMITE_VETORIZADO` equações os lotes são
+    distribuídos num pool de processos.
+    """
+    LIMITE_VETORIZADO = 32
+
+    def __init__(self, str_eqs: List[str], var_t: str, vars_y: List[str], nomes_parametros: List[str],
+                 metodo: Optional[MetodoNumerico] = None):
+        self.sistema = (tuple(str_eqs), var_t, tuple(vars_y), tuple(nomes_parametros))
+        self.metodo = metodo if metodo is not None else MetodoRK4()
+        # Valida a sintaxe já na construção
+        _sistema_parametrico_em_cache(*self.sistema)
+
+    def grade(self, valores: Dict[str, Sequence[float]]) -> np.ndarray:
+        """Produto cartesiano dos valores de cada parâmetro, forma (m, P)."""
+        nomes = self.sistema[3]
+        faltando = set(nomes) - set(valores)
+        if faltando:
+            raise ValueError(f"Parâmetros sem valores: {sorted(faltando)}")
+        eixos = np.meshgrid(*[np.asarray(valores[nome], dtype=float) for nome in nomes], indexing='ij')
+        return np.stack([eixo.ravel() for eixo in eixos], axis=-1)
+
+    def executar(self, intervalo: Tuple[float, float], y0: Sequence[float], h: float,
+                 valores: Dict[str, Sequence[float]], decimacao: int = 1, tamanho_lote: int = 256,
+                 processos: Optional[int] = None,
+                 progresso: Optional[Callable[[int, int], None]] = None) -> ResultadoVarredura:
+        """
+        `y0` pode ser um estado (d,) comum a todas as combinações ou um por
+        combinação (m, d). `progresso(concluidos, total)` é chamado a cada lote.
+        """
+        parametros = self.grade(valores)
+        m = len(parametros)
+        y0_todos = np.broadcast_to(np.asarray(y0, dtype=float), (m, len(self.sistema[2])))
+        lotes = [slice(i, min(i + tamanho_lote, m)) for i in range(0, m, tamanho_lote)]
+
+        resultados = None
+        tempos = None
+        concluidos = 0
+
+        def guardar(lote: slice, saida: Tuple[np.ndarray, np.ndarray]):
+            nonlocal resultados, tempos, concluidos
+            tempos, res = saida
+            if resultados is None:
+                resultados = np.empty((m,) + res.shape[1:])
+            resultados[lote] = res
+            concluidos += lote.stop - lote.start
+            if progresso is not None:
+                progresso(concluidos, m)
+
+        argumentos = (self.sistema, self.metodo, intervalo)
+        if len(self.sistema[2]) <= self.LIMITE_VETORIZADO and processos is None:
+            for lote in lotes:
+                guardar(lote, _integrar_lote_parametros(*argumentos, y0_todos[lote], h, decimacao, parametros[lote]))
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                futuros = {executor.submit(_integrar_lote_parametros, *argumentos, y0_todos[lote], h, decimacao,
+                                           parametros[lote]): lote for lote in lotes}
+                for futuro in as_completed(futuros):
+                    guardar(futuros[futuro], futuro.result())
+
+        return ResultadoVarredura(parametros=parametros, tempos=tempos, resultados=resultados)
+
 
 # 2. SEGURANÇA E PARSING
 
+def _como_estado(y_vec) -> np.ndarray:
+    """Aceita listas e escalares (sistema de uma equação) como o lambdify aceitava."""
+    y_vec = np.asarray(y_vec, dtype=float)
+    return y_vec.reshape(1) if y_vec.ndim == 0 else y_vec
+
 class InterpretadorMatematico:
     @staticmethod
     def converter_expressao_para_funcao(str_eqs: List[str], var_t: str, vars_y: List[str]) -> Callable:
+        """
+        Compila o sistema inteiro num único kernel (ver `_gerar_kernel`).
+        A função retornada tem assinatura f(t, y, out=None): se `out` for
+        fornecido, o resultado é escrito nele sem alocar memória. A dimensão de
+        `y` é validada apenas na primeira chamada.
+        """
         t_sym = sp.symbols(var_t)
         y_syms = sp.symbols(vars_y)
         
@@ -68,19 +1327,173 @@ class InterpretadorMatematico:
             exprs_sym = [sp.sympify(eq.replace('^', '**')) for eq in str_eqs]
         except sp.SympifyError as e:
             raise ValueError(f"Erro de sintaxe matemática: {e}")
+        if len(exprs_sym) != len(y_syms):
+            raise ValueError("O número de equações deve ser igual ao de variáveis.")
+
+        kernel = InterpretadorMatematico._gerar_kernel(exprs_sym, t_sym, y_syms)
+        dimensao = len(y_syms)
+        validado = False
+
+        def wrapper(t_val, y_vec, out=None):
+            nonlocal validado
+            y_vec = _como_estado(y_vec)
+            if not validado:
+                # Proteção contra dimensão incompatível
+                if np.ndim(y_vec) == 0 or np.shape(y_vec)[-1] != dimensao:
+                    raise ValueError("Dimensão do vetor de estado incompatível com variáveis definidas.")
+                validado = True
+            if out is None:
+                out = np.empty(np.shape(y_vec))
+            return kernel(t_val, y_vec, out)
+        
+        return wrapper
+
+    @staticmethod
+    def converter_sistema_parametrico(str_eqs: List[str], var_t: str, vars_y: List[str],
+                                      nomes_parametros: List[str]) -> Callable:
+        """
+        Como `converter_expressao_para_funcao`, mas com parâmetros simbólicos
+        livres: devolve f(t, y, p, out=None), onde `p` tem forma (P,) ou, para
+        um conjunto (m, d), (m, P) com uma combinação de parâmetros por estado.
+        """
+        t_sym = sp.symbols(var_t)
+        y_syms = sp.symbols(vars_y)
+        p_syms = [sp.Symbol(nome) for nome in nomes_parametros]
+        # locals evita que nomes como 'beta' ou 'gamma' virem funções do SymPy
+        simbolos = {str(simbolo): simbolo for simbolo in p_syms}
+        try:
+            exprs_sym = [sp.sympify(eq.replace('^', '**'), locals=simbolos) for eq in str_eqs]
+        except sp.SympifyError as e:
+            raise ValueError(f"Erro de sintaxe matemática: {e}")
+        if len(exprs_sym) != len(y_syms):
+            raise ValueError("O número de equações deve ser igual ao de variáveis.")
+
+        kernel = InterpretadorMatematico._gerar_kernel(exprs_sym, t_sym, y_syms, p_syms)
+
+        def wrapper(t_val, y_vec, p_vec, out=None):
+            y_vec = _como_estado(y_vec)
+            if out is None:
+                out = np.empty(np.shape(y_vec))
+            return kernel(t_val, y_vec, out, np.asarray(p_vec, dtype=float))
+
+        return wrapper
+
+    @staticmethod
+    def converter_jacobiana(str_eqs: List[str], var_t: str, vars_y: List[str]) -> Callable:
+        """Jacobiana exata J[i, j] = d f_i / d y_j derivada pelo SymPy e compilada num único kernel."""
+        t_sym = sp.symbols(var_t)
+        y_syms = sp.symbols(vars_y)
+        try:
+            exprs_sym = [sp.sympify(eq.replace('^', '**')) for eq in str_eqs]
+        except sp.SympifyError as e:
+            raise ValueError(f"Erro de sintaxe matemática: {e}")
+
+        dimensao = len(y_syms)
+        derivadas = [sp.diff(expr, y_sym) for expr in exprs_sym for y_sym in y_syms]
+        kernel = InterpretadorMatematico._gerar_kernel(derivadas, t_sym, y_syms)
+
+        def jacobiana(t_val, y_vec):
+            y_vec = _como_estado(y_vec)
+            saida = np.empty(np.shape(y_vec)[:-1] + (dimensao * dimensao,))
+            return kernel(t_val, y_vec, saida).reshape(np.shape(y_vec)[:-1] + (dimensao, dimensao))
+
+        return jacobiana
+
+    @staticmethod
+    def _gerar_kernel(exprs_sym: List[sp.Expr], t_sym: sp.Symbol, y_syms: Sequence[sp.Symbol],
+                      p_syms: Sequence[sp.Symbol] = ()) -> Callable:
+        """
+        Gera o código de `kernel(t, y, out, p=None)` para todas as expressões de
+        uma vez: subexpressões comuns (CSE) são calculadas uma única vez e cada
+        derivada é gravada diretamente em out[..., i]. O desempacotamento por
+        `y.T` (e `p.T`, se houver parâmetros) funciona tanto para um único
+        estado (d,) quanto para um conjunto (m, d).
+        """
+        mapa = {t_sym: sp.Symbol('_t')}
+        mapa.update({y_sym: sp.Symbol(f'_y{i}') for i, y_sym in enumerate(y_syms)})
+        mapa.update({p_sym: sp.Symbol(f'_p{i}') for i, p_sym in enumerate(p_syms)})
+        exprs = [sp.sympify(expr).xreplace(mapa) for expr in exprs_sym]
+        temporarios, reduzidas = sp.cse(exprs, symbols=sp.numbered_symbols('_c'))
+
+        nomes_y = ", ".join(f"_y{i}" for i in range(len(y_syms)))
+        linhas = ["def _kernel(_t, _y, _out, _p=None):",
+                  f"    {nomes_y}, = _y.T",
+                  "    _saida = _out.T"]
+        if p_syms:
+            linhas.append(f"    {', '.join(f'_p{i}' for i in range(len(p_syms)))}, = _p.T")
+        # O SciPyPrinter estende o do NumPy: funções especiais (erf, besselj, gamma...)
+        # saem como scipy.special vetorizado, e não como math.*, que falha com arrays
+        impressora = SciPyPrinter()
+        linhas += [f"    {nome} = {impressora.doprint(valor)}" for nome, valor in temporarios]
+        linhas += [f"    _saida[{i}] = {impressora.doprint(expr)}" for i, expr in enumerate(reduzidas)]
+        linhas.append("    return _out")
+
+        namespace: Dict[str, object] = {}
+        for modulo in impressora.module_imports:
+            exec(f"import {modulo}", namespace)
+        exec(compile("\n".join(linhas), "<sistema EDO compilado>", "exec"), namespace)
+        return namespace["_kernel"]
 
-        # Cria uma função Python otimizada
+    @staticmethod
+    def _compilar_por_equacao(str_eqs: List[str], var_t: str, vars_y: List[str]) -> Callable:
+        """Compilação anterior (um lambdify por equação), mantida como referência do benchmark."""
+        t_sym = sp.symbols(var_t)
+        y_syms = sp.symbols(vars_y)
+        exprs_sym = [sp.sympify(eq.replace('^', '**')) for eq in str_eqs]
         funcs_lambda = [sp.lambdify((t_sym, *y_syms), expr, modules=['numpy', 'math']) for expr in exprs_sym]
 
         def wrapper(t_val, y_vec):
             if np.ndim(y_vec) == 0: y_vec = [y_vec]
-            # Proteção contra dimensão incompatível
             if len(y_vec) != len(y_syms):
                 raise ValueError("Dimensão do vetor de estado incompatível com variáveis definidas.")
             return np.array([f(t_val, *y_vec) for f in funcs_lambda])
-        
+
         return wrapper
 
+    @staticmethod
+    def converter_evento(str_expr: str, var_t: str, vars_y: List[str],
+                         direcao: int = 0, terminal: bool = False) -> Evento:
+        """Compila uma expressão g(t, y) como Evento; o cruzamento de interesse é g = 0."""
+        t_sym = sp.symbols(var_t)
+        y_syms = sp.symbols(vars_y)
+        try:
+            expr = sp.sympify(str_expr.replace('^', '**'))
+        except sp.SympifyError as e:
+            raise ValueError(f"Erro de sintaxe matemática: {e}")
+        desconhecidos = expr.free_symbols - {t_sym, *y_syms}
+        if desconhecidos:
+            raise ValueError(f"Símbolos desconhecidos no evento: {sorted(map(str, desconhecidos))}")
+
+        g_lambda = sp.lambdify([t_sym, *y_syms], expr, modules='numpy')
+        def funcao(t_val, y_vec):
+            return g_lambda(t_val, *np.moveaxis(np.asarray(y_vec), -1, 0))
+        return Evento(nome=str_expr, funcao=funcao, direcao=direcao, terminal=terminal)
+
+    @staticmethod
+    def verificar_forma_mecanica(str_eqs: List[str], vars_y: List[str],
+                                 posicoes: List[str], velocidades: List[str]) -> Tuple[List[int], List[int]]:
+        """
+        Confere se o sistema tem a forma separável exigida pelos métodos
+        simpléticos (dq/dt = v e dv/dt sem depender das velocidades) e devolve
+        os índices (posições, velocidades) em `vars_y`.
+        """
+        if len(posicoes) != len(velocidades) or not posicoes:
+            raise ValueError("Informe o mesmo número (≥ 1) de posições e velocidades.")
+        desconhecidas = (set(posicoes) | set(velocidades)) - set(vars_y)
+        if desconhecidas:
+            raise ValueError(f"Variáveis desconhecidas: {sorted(desconhecidas)}")
+
+        simbolos = {nome: sp.Symbol(nome) for nome in vars_y}
+        exprs = [sp.sympify(eq.replace('^', '**'), locals=simbolos) for eq in str_eqs]
+        indices_q = [vars_y.index(nome) for nome in posicoes]
+        indices_v = [vars_y.index(nome) for nome in velocidades]
+        for iq, iv in zip(indices_q, indices_v):
+            if sp.simplify(exprs[iq] - simbolos[vars_y[iv]]) != 0:
+                raise ValueError(f"d({vars_y[iq]})/dt precisa ser exatamente {vars_y[iv]}.")
+            if exprs[iv].free_symbols & {simbolos[vars_y[j]] for j in indices_v}:
+                raise ValueError(f"d({vars_y[iv]})/dt não pode depender das velocidades.")
+        return indices_q, indices_v
+
     @staticmethod
     def avaliar_expressao_escalar(str_expr: str) -> float:
         """Avalia inputs como 'pi/2' ou '1e-3' de forma segura."""
@@ -106,17 +1519,38 @@ class InterpretadorMatematico:
 
 # 3. INTERFACE COM USUÁRIO (Console & Gráficos)
 
+_plt = None
+
+def _pyplot(salvar_em_arquivo: bool):
+    """pyplot carregado só na primeira figura, com o backend decidido na partida."""
+    global _plt
+    if _plt is None:
+        _plt = importar_pyplot(salvar_em_arquivo)
+    return _plt
+
 class InterfaceConsole:
     """
     Gerencia toda a interação com o usuário. 
     Mantém o SRP: A lógica de UI está isolada da matemática.
     """
-    
-    def __init__(self):
+    MAX_PONTOS_COM_MARCADOR = 200
+
+    def __init__(self, arquivo_grafico: Optional[str] = None):
+        # Com arquivo (ou sem tela disponível) o gráfico é salvo em PNG/SVG em vez de aberto numa janela;
+        # decidido aqui, na partida, para o backend ser escolhido antes do primeiro import do pyplot
+        self.arquivo_grafico = arquivo_grafico
+        self.salvar_grafico = arquivo_grafico is not None or sem_tela()
         self.mapa_metodos = {
             '1': ('Euler', MetodoEuler()),
             '2': ('Euler Aperfeiçoado', MetodoEulerAperfeicoado()),
-            '3': ('Runge-Kutta 4 (RK4)', MetodoRK4())
+            '3': ('Runge-Kutta 4 (RK4)', MetodoRK4()),
+            '4': ('Dormand-Prince 5(4) Adaptativo', MetodoDormandPrince()),
+            '5': ('Euler Implícito (rígido)', MetodoEulerImplicito()),
+            '6': ('Trapézio Implícito (rígido)', MetodoTrapezioImplicito()),
+            '7': ('BDF Ordem Variável (rígido, adaptativo)', SolucionadorBDF()),
+            '8': ('Adams-Bashforth-Moulton 4 (multipasso)', MetodoAdamsBashforthMoulton(4)),
+            '9': ('Velocity Verlet (simplético)', MetodoVelocityVerlet()),
+            '10': ('Yoshida 4ª ordem (simplético)', MetodoYoshida4())
         }
 
     def _ler_float(self, mensagem: str) -> float:
@@ -127,6 +1561,30 @@ class InterfaceConsole:
             except ValueError as e:
                 print(f" > {e}. Tente usar ponto para decimais (ex: 0.5).")
 
+    def _ler_passo(self, mensagem: str) -> Optional[float]:
+        """Como `_ler_float`, mas 'auto' devolve None (passo escolhido pela estimativa de Richardson)."""
+        while True:
+            entrada = input(mensagem).strip()
+            if entrada.lower() == 'auto':
+                return None
+            try:
+                return InterpretadorMatematico.avaliar_expressao_escalar(entrada)
+            except ValueError as e:
+                print(f" > {e}. Tente usar ponto para decimais (ex: 0.5) ou 'auto'.")
+
+    def _escolher_passo(self, metodo: MetodoNumerico, funcao_sistema: Callable,
+                        intervalo: Tuple[float, float], y0: List[float]) -> float:
+        tolerancia = self._ler_float("Tolerância do erro global (ex: 1e-6): ")
+        print("\nEstimando o erro por Richardson (h e h/2)...")
+        estimativa = EstimadorRichardson(metodo, tolerancia).estimar(funcao_sistema, intervalo, y0)
+        for h, erro in estimativa.historico:
+            print(f"  h={h:.6g} -> erro estimado {erro:.3e}")
+        if estimativa.erro_estimado > tolerancia:
+            print(" > Tolerância não atingida no limite de refinamentos; usando o menor passo testado.")
+            return estimativa.h_final
+        print(f"Passo escolhido: h={estimativa.h_recomendado:.6g}")
+        return estimativa.h_recomendado
+
     def _ler_texto(self, mensagem: str, padrao: str = "") -> str:
         entrada = input(mensagem).strip()
         return entrada if entrada else padrao
@@ -163,7 +1621,7 @@ class InterfaceConsole:
                     eq = input(f"d({nome})/d({var_t}) = ")
                     try:
                         # Teste rápido de sintaxe
-                        InterpretadorMatematico.converter_expressao_para_funcao([eq], var_t, vars_y)
+                        sp.sympify(eq.replace('^', '**'))
                         equacoes_str.append(eq)
                         validado = True
                     except Exception as e:
@@ -175,7 +1633,7 @@ class InterfaceConsole:
             print("\n--- Configuração do Intervalo ---")
             t_inicio = self._ler_float(f"Início ({var_t}0): ")
             t_fim = self._ler_float(f"Fim ({var_t}_final): ")
-            passo = self._ler_float("Passo (h): ")
+            passo = self._ler_passo("Passo (h, ou 'auto' para escolher pela tolerância): ")
 
             # 4. Seleção do Método
             print("\n--- Método Numérico ---")
@@ -184,16 +1642,53 @@ class InterfaceConsole:
             
             opcao = '0'
             while opcao not in self.mapa_metodos:
-                opcao = input("Escolha (1-3): ").strip()
+                opcao = input(f"Escolha (1-{len(self.mapa_metodos)}): ").strip()
             
             nome_metodo, obj_metodo = self.mapa_metodos[opcao]
 
             # 5. Execução
             funcao_sistema = InterpretadorMatematico.converter_expressao_para_funcao(equacoes_str, var_t, vars_y)
-            solver = SolucionadorEDO(obj_metodo)
+            if isinstance(obj_metodo, MetodoSimpletico):
+                self._configurar_simpletico(obj_metodo, equacoes_str, vars_y)
+            if isinstance(obj_metodo, (MetodoImplicito, SolucionadorBDF)):
+                # Jacobiana exata obtida das mesmas expressões simbólicas
+                obj_metodo.jacobiana = InterpretadorMatematico.converter_jacobiana(equacoes_str, var_t, vars_y)
             
-            print("\nCalculando...")
-            tempos, resultados = solver.resolver(funcao_sistema, (t_inicio, t_fim), y0_lista, passo)
+            if isinstance(obj_metodo, (MetodoDormandPrince, SolucionadorBDF)):
+                # Passo adaptativo: h passa a ser apenas o espaçamento da saída
+                if passo is None:
+                    passo = (t_fim - t_inicio) / 100
+                rtol = self._ler_float("Tolerância relativa (rtol, ex: 1e-6): ")
+                atol = self._ler_float("Tolerância absoluta (atol, ex: 1e-9): ")
+                num_saidas = int(np.ceil((t_fim - t_inicio) / passo))
+                tempos_saida = np.linspace(t_inicio, t_inicio + num_saidas * passo, num_saidas + 1)
+                eventos = self._ler_eventos(var_t, vars_y)
+
+                print("\nCalculando...")
+                if isinstance(obj_metodo, SolucionadorBDF):
+                    solver = obj_metodo
+                    solver.rtol, solver.atol = rtol, atol
+                else:
+                    solver = SolucionadorAdaptativo(obj_metodo, rtol=rtol, atol=atol)
+                resultado = solver.resolver(funcao_sistema, (t_inicio, tempos_saida[-1]), y0_lista,
+                                            tempos_saida=tempos_saida, eventos=eventos)
+                tempos, resultados = resultado.tempos, resultado.resultados
+                print(f"Passos aceitos: {resultado.passos_aceitos} | rejeitados: {resultado.passos_rejeitados}"
+                      f" | avaliações de f: {resultado.avaliacoes}")
+                if eventos:
+                    self._exibir_eventos(resultado, eventos, var_t, vars_y)
+            else:
+                solver = SolucionadorEDO(obj_metodo)
+                if passo is None:
+                    passo = self._escolher_passo(obj_metodo, funcao_sistema, (t_inicio, t_fim), y0_lista)
+                eventos = self._ler_eventos(var_t, vars_y)
+                print("\nCalculando...")
+                if eventos:
+                    resultado = solver.resolver_com_eventos(funcao_sistema, (t_inicio, t_fim), y0_lista, passo, eventos)
+                    tempos, resultados = resultado.tempos, resultado.resultados
+                    self._exibir_eventos(resultado, eventos, var_t, vars_y)
+                else:
+                    tempos, resultados = solver.resolver(funcao_sistema, (t_inicio, t_fim), y0_lista, passo)
 
             # Exibição Resultados Numéricos
             print("\n" + "="*30)
@@ -213,13 +1708,61 @@ class InterfaceConsole:
         finally:
             print("\nPrograma finalizado.")
 
+    def _configurar_simpletico(self, metodo: MetodoSimpletico, equacoes_str: List[str], vars_y: List[str]):
+        print("\nMétodos simpléticos exigem d(posição)/dt = velocidade e aceleração sem depender das velocidades.")
+        while True:
+            posicoes = [nome.strip() for nome in input(f"Variáveis de posição (ex: {vars_y[0]}): ").split(',') if nome.strip()]
+            velocidades = [nome.strip() for nome in input("Velocidades correspondentes, na mesma ordem: ").split(',') if nome.strip()]
+            try:
+                metodo.indices_posicao, metodo.indices_velocidade = InterpretadorMatematico.verificar_forma_mecanica(
+                    equacoes_str, vars_y, posicoes, velocidades)
+                return
+            except (ValueError, sp.SympifyError) as e:
+                print(f" > {e}")
+
+    def _ler_eventos(self, var_t: str, vars_y: List[str]) -> List[Evento]:
+        if input("\nDetectar eventos (ex: cruzamento de zero)? (s/n): ").lower().strip() != 's':
+            return []
+
+        print(f"Digite g({var_t}, {', '.join(vars_y)}); o evento ocorre quando g = 0. Linha vazia encerra.")
+        eventos = []
+        while True:
+            expr = input(f"Evento {len(eventos) + 1}: g = ").strip()
+            if not expr:
+                return eventos
+            direcao = input("Direção (+1 subida, -1 descida, 0 ambas) [0]: ").strip() or '0'
+            terminal = input("Encerrar a integração neste evento? (s/n): ").lower().strip() == 's'
+            try:
+                eventos.append(InterpretadorMatematico.converter_evento(expr, var_t, vars_y, int(direcao), terminal))
+            except ValueError as e:
+                print(f" > Evento ignorado: {e}")
+
+    def _exibir_eventos(self, resultado: Union[ResultadoEventos, ResultadoAdaptativo], eventos: List[Evento], var_t: str, vars_y: List[str]):
+        print("\n--- Eventos ---")
+        for evento, t_ev, y_ev in zip(eventos, resultado.tempos_eventos, resultado.estados_eventos):
+            print(f"g = {evento.nome}: {len(t_ev)} ocorrência(s)")
+            for t_val, y_val in zip(t_ev, y_ev):
+                estado = ", ".join(f"{nome}={valor:.6f}" for nome, valor in zip(vars_y, y_val))
+                print(f"  {var_t}={t_val:.8f} | {estado}")
+        if resultado.evento_terminal is not None:
+            print(f"Integração encerrada pelo evento terminal '{resultado.evento_terminal}'.")
+
     def _gerar_grafico(self, tempos, resultados, vars_y, var_t, nome_metodo):
         print("\n[Info] Gerando gráfico...")
-        plt.figure(figsize=(10, 6))
-        
+        destino = self.arquivo_grafico
+        if destino is None and self.salvar_grafico:
+            destino = f"edo_{time.strftime('%Y%m%d_%H%M%S')}.png"
+        plt = _pyplot(self.salvar_grafico)
+
+        fig = plt.figure(figsize=(10, 6))
+        # Custo de desenho limitado pela largura em pixels, não pelo número de passos
+        indices = decimar_min_max(resultados, int(fig.get_figwidth() * fig.dpi))
+        tempos, resultados = tempos[indices], resultados[indices]
+        marcador = 'o' if len(indices) <= self.MAX_PONTOS_COM_MARCADOR else ''
+
         qtd_vars = len(vars_y)
         if qtd_vars == 1:
-            plt.plot(tempos, resultados[:, 0], 'b-o', label=vars_y[0], markersize=3)
+            plt.plot(tempos, resultados[:, 0], f'b-{marcador}', label=vars_y[0], markersize=3)
             plt.ylabel(vars_y[0])
             plt.xlabel(var_t)
             plt.title(f"Solução: {nome_metodo}")
@@ -240,7 +1783,12 @@ class InterfaceConsole:
 
         plt.grid(True)
         plt.legend()
-        plt.show()
+        if destino is not None:
+            fig.savefig(destino)
+            plt.close(fig)
+            print(f"[Info] Gráfico salvo em '{destino}'.")
+        else:
+            plt.show()
 
     def _analisar_erro(self, tempos, resultados, vars_y, var_t):
         if input("\nCalcular erro comparativo? (s/n): ").lower().strip() != 's':
@@ -272,8 +1820,138 @@ class InterfaceConsole:
                 print(f"Erro ao calcular analítica para {nome}: {e}")
 
 
-# 4. ENTRY POINT
+# 4. BENCHMARKS
+
+def benchmark_rhs(str_eqs: List[str], var_t: str, vars_y: List[str], y0: List[float],
+                  num_chamadas: int = 20000, passos_rk4: int = 5000):
+    """Compara a compilação por equação (anterior) com o kernel fundido: chamada isolada e RK4 completo."""
+    candidatos = [
+        ("Por equação (anterior)", InterpretadorMatematico._compilar_por_equacao(str_eqs, var_t, vars_y)),
+        ("Kernel fundido (CSE)", InterpretadorMatematico.converter_expressao_para_funcao(str_eqs, var_t, vars_y)),
+    ]
+    y = np.array(y0, dtype=float)
+    h = 1e-3
+
+    print(f"\n{'Compilação':<26} | {'µs/chamada':>11} | {'RK4 ' + str(passos_rk4) + ' passos (s)':>22}")
+    print("-" * 66)
+    for nome, func in candidatos:
+        func(0.0, y)
+        inicio = time.perf_counter()
+        for _ in range(num_chamadas):
+            func(0.0, y)
+        por_chamada = (time.perf_counter() - inicio) / num_chamadas * 1e6
+
+        inicio = time.perf_counter()
+        SolucionadorEDO(MetodoRK4()).resolver(func, (0.0, passos_rk4 * h), y0, h)
+        tempo_rk4 = time.perf_counter() - inicio
+        print(f"{nome:<26} | {por_chamada:>11.2f} | {tempo_rk4:>22.3f}")
+
+def benchmark_avaliacoes(tolerancia: float = 1e-6, t_fim: float = 10.0):
+    """
+    Avaliações de f que cada método de passo fixo precisa para atingir a mesma
+    precisão no oscilador harmônico y'' = -y (solução exata conhecida).
+    O passo é reduzido à metade até o erro final ficar abaixo da tolerância.
+    """
+    func = InterpretadorMatematico.converter_expressao_para_funcao(["v", "-y"], "t", ["y", "v"])
+    exata = np.array([np.cos(t_fim), -np.sin(t_fim)])
+    metodos = [("RK4", MetodoRK4())] + [(f"ABM{p}", MetodoAdamsBashforthMoulton(p)) for p in (2, 3, 4, 5)]
+
+    print(f"\n{'Método':<8} | {'h':>10} | {'Erro final':>11} | {'Avaliações':>10} | {'Tempo (s)':>9}")
+    print("-" * 60)
+    for nome, metodo in metodos:
+        h = 0.5
+        while True:
+            avaliacoes = 0
+            def contar(t, y):
+                nonlocal avaliacoes
+                avaliacoes += 1
+                return func(t, y)
+            inicio = time.perf_counter()
+            _, res = SolucionadorEDO(metodo).resolver(contar, (0.0, t_fim), [1.0, 0.0], h, apenas_final=True)
+            tempo = time.perf_counter() - inicio
+            erro = np.max(np.abs(res[-1] - exata))
+            if erro < tolerancia or h < 1e-5:
+                break
+            h /= 2
+        print(f"{nome:<8} | {h:>10.2e} | {erro:>11.2e} | {avaliacoes:>10} | {tempo:>9.3f}")
+
+def benchmark_energia(periodos: int = 200, avaliacoes_por_periodo: int = 400, excentricidade: float = 0.5):
+    """
+    Deriva de energia numa órbita de Kepler com o mesmo orçamento de avaliações
+    de f por período para cada método: o RK4 perde energia continuamente,
+    enquanto os simpléticos mantêm o erro limitado.
+    """
+    func = InterpretadorMatematico.converter_expressao_para_funcao(
+        ["vx", "vy", "-x/(x**2 + y**2)**1.5", "-y/(x**2 + y**2)**1.5"], "t", ["x", "y", "vx", "vy"])
+    # Periélio em (1 - e, 0); período 2*pi para semieixo 1 e mu = 1
+    y0 = [1 - excentricidade, 0.0, 0.0, np.sqrt((1 + excentricidade) / (1 - excentricidade))]
+    periodo = 2 * np.pi
+
+    def energia(estados):
+        return 0.5 * (estados[:, 2]**2 + estados[:, 3]**2) - 1.0 / np.hypot(estados[:, 0], estados[:, 1])
+
+    metodos = [("RK4", MetodoRK4(), 4),
+               ("Velocity Verlet", MetodoVelocityVerlet([0, 1], [2, 3]), 1),
+               ("Yoshida 4", MetodoYoshida4([0, 1], [2, 3]), 3)]
+    e0 = energia(np.array([y0]))[0]
+
+    print(f"\n{'Método':<16} | {'Passos/período':>14} | {'Máx |ΔE/E0|':>12} | {'|ΔE/E0| final':>13} | {'Tempo (s)':>9}")
+    print("-" * 78)
+    for nome, metodo, avaliacoes_por_passo in metodos:
+        passos = avaliacoes_por_periodo // avaliacoes_por_passo
+        inicio = time.perf_counter()
+        # Deriva medida em todos os passos, bloco a bloco, sem guardar a trajetória
+        desvio_maximo = desvio_final = 0.0
+        for _, estados in SolucionadorEDO(metodo).iterar(func, (0.0, periodos * periodo), y0, periodo / passos):
+            desvio = np.abs((energia(estados) - e0) / e0)
+            desvio_maximo, desvio_final = max(desvio_maximo, float(desvio.max())), float(desvio[-1])
+        tempo = time.perf_counter() - inicio
+        print(f"{nome:<16} | {passos:>14} | {desvio_maximo:>12.2e} | {desvio_final:>13.2e} | {tempo:>9.3f}")
+
+def benchmark_robertson(h: float = 1e-2, t_fim: float = 40.0, tolerancia: float = 1e-3):
+    """
+    Cinética de Robertson (rigidez ~1e4 no início) com os métodos implícitos de
+    passo fixo. Serve de verificação de regressão: os dois precisam completar a
+    integração e chegar perto da referência do BDF com tolerância apertada.
+    """
+    eqs = ["-0.04*a + 1e4*b*c", "0.04*a - 1e4*b*c - 3e7*b**2", "3e7*b**2"]
+    func = InterpretadorMatematico.converter_expressao_para_funcao(eqs, "t", ["a", "b", "c"])
+    jac = InterpretadorMatematico.converter_jacobiana(eqs, "t", ["a", "b", "c"])
+    referencia = SolucionadorBDF(jac, rtol=1e-9, atol=1e-13).resolver(func, (0.0, t_fim), [1.0, 0.0, 0.0]).resultados[-1]
+
+    print(f"\n{'Método':<20} | {'h':>8} | {'Erro final':>11} | {'1 - Σy':>9} | {'Tempo (s)':>9} | Situação")
+    print("-" * 78)
+    for nome, metodo in (("Euler Implícito", MetodoEulerImplicito(jac)), ("Trapézio Implícito", MetodoTrapezioImplicito(jac))):
+        inicio = time.perf_counter()
+        try:
+            _, res = SolucionadorEDO(metodo).resolver(func, (0.0, t_fim), [1.0, 0.0, 0.0], h, apenas_final=True)
+        except RuntimeError as erro:
+            print(f"{nome:<20} | {h:>8.0e} | {'-':>11} | {'-':>9} | {time.perf_counter() - inicio:>9.3f} | FALHOU ({erro})")
+            continue
+        tempo = time.perf_counter() - inicio
+        erro = np.max(np.abs(res[-1] - referencia))
+        situacao = "ok" if erro < tolerancia else "FALHOU (erro acima da tolerância)"
+        print(f"{nome:<20} | {h:>8.0e} | {erro:>11.2e} | {abs(1 - res[-1].sum()):>9.1e} | {tempo:>9.3f} | {situacao}")
+
+def executar_benchmarks():
+    print("Sistema de Lorenz (sigma=10, rho=28, beta=8/3)")
+    benchmark_rhs(["10*(y - x)", "x*(28 - z) - y", "x*y - 8/3*z"], "t", ["x", "y", "z"], [1.0, 1.0, 1.0])
+    print("\nOscilador harmônico: avaliações de f para erro < 1e-6")
+    benchmark_avaliacoes()
+    print("\nÓrbita de Kepler (e=0.5, 200 períodos): deriva de energia com 400 avaliações de f por período")
+    benchmark_energia()
+    print("\nRobertson (t em [0, 40]): métodos implícitos de passo fixo contra referência BDF")
+    benchmark_robertson()
+
+
+# 5. ENTRY POINT
 
 if __name__ == "__main__":
-    app = InterfaceConsole()
-    app.executar()
\ No newline at end of file
+    if "--benchmark" in sys.argv[1:]:
+        executar_benchmarks()
+    else:
+        # --grafico arquivo.png|svg salva o gráfico em vez de abrir uma janela
+        argumentos = sys.argv[1:]
+        arquivo_grafico = argumentos[argumentos.index("--grafico") + 1] if "--grafico" in argumentos[:-1] else None
+        app = InterfaceConsole(arquivo_grafico)
+        app.executar()
\ No newline at end of file